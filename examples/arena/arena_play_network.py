@@ -15,7 +15,7 @@ def main():
     logging.basicConfig(level=logging.INFO)
 
     # setup the arena
-    arena = Arena(nr_games_to_play=1)
+    arena = Arena(nr_games_to_play=1, record_latency=True)
     player = AgentRandomSchieber()
     # my_player = AgentByNetwork('http://localhost:5000/random')
     my_player = AgentByNetwork('https://lg3bsb3a96.execute-api.eu-central-1.amazonaws.com/dev/random')
@@ -25,6 +25,9 @@ def main():
     arena.play_all_games()
     print('Average Points Team 0: {:.2f})'.format(arena.points_team_0.mean()))
     print('Average Points Team 1: {:.2f})'.format(arena.points_team_1.mean()))
+    for entry in arena.latency_statistics.summary(by_phase=False):
+        print('Seat {seat}: p50 {p50:.4f}s, p95 {p95:.4f}s, p99 {p99:.4f}s, max {max:.4f}s, '
+              'standin actions {fallbacks}'.format(**entry))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,30 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+
+import logging
+
+from jass.agents.agent_by_network_async import AgentByNetworkAsync
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena_async import AsyncArena
+
+
+def main():
+    # Set the global logging level (Set to debug or info to see more messages)
+    logging.basicConfig(level=logging.WARNING)
+
+    # setup the arena, games are played concurrently against the service
+    arena = AsyncArena(nr_games_to_play=100, nr_concurrent_games=20)
+    player = AgentRandomSchieber()
+    my_player = AgentByNetworkAsync('http://localhost:5000/random', max_connections=20)
+
+    arena.set_players(my_player, player, my_player, player)
+    print('Playing {} games'.format(arena.nr_games_to_play))
+    arena.play_all_games()
+    print('Average Points Team 0: {:.2f})'.format(arena.points_team_0.mean()))
+    print('Average Points Team 1: {:.2f})'.format(arena.points_team_1.mean()))
+
+
+if __name__ == '__main__':
+    main()
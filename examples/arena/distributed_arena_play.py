@@ -0,0 +1,52 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Play games distributed over several machines. Start the coordinator on one machine, listening on all
+interfaces (the connections are not authenticated, so only do this on a trusted network):
+
+    python distributed_arena_play.py coordinator --listen 0.0.0.0 --port 8888 --nr_games 10000
+
+and any number of workers on the other machines (or on the same machine, the coordinator only accepts local
+workers without --listen):
+
+    python distributed_arena_play.py worker --host <coordinator> --port 8888
+"""
+import argparse
+import logging
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.distributed_arena import DistributedArenaCoordinator, DistributedArenaWorker
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='Play games in a distributed arena')
+    parser.add_argument('mode', choices=['coordinator', 'worker'], help='Run the coordinator or a worker')
+    parser.add_argument('--host', type=str, default='localhost', help='Host of the coordinator')
+    parser.add_argument('--port', type=int, default=8888, help='Port of the coordinator')
+    parser.add_argument('--listen', type=str, default='127.0.0.1',
+                        help='Address the coordinator listens on, 0.0.0.0 to accept workers from other machines')
+    parser.add_argument('--nr_games', type=int, default=1000, help='Number of games to play')
+    parser.add_argument('--games_per_block', type=int, default=100, help='Number of games in a block')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for dealing the cards')
+    parser.add_argument('--save', type=str, default=None, help='Basename of the files for the saved games')
+    arg = parser.parse_args()
+
+    if arg.mode == 'coordinator':
+        with DistributedArenaCoordinator(nr_games_to_play=arg.nr_games, games_per_block=arg.games_per_block,
+                                         seed=arg.seed, host=arg.listen, port=arg.port,
+                                         save_filename=arg.save) as coordinator:
+            coordinator.play_all_games()
+        print('Average Points Team 0: {:.2f})'.format(coordinator.points_team_0.mean()))
+        print('Average Points Team 1: {:.2f})'.format(coordinator.points_team_1.mean()))
+    else:
+        # the agents are created by the workers
+        worker = DistributedArenaWorker(arg.host, arg.port)
+        worker.set_players(AgentRandomSchieber, AgentRandomSchieber, AgentRandomSchieber, AgentRandomSchieber)
+        worker.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+
+import logging
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.tournament import Tournament
+
+
+def print_standings(tournament: Tournament):
+    print('{:>6} games played'.format(tournament.nr_games_played))
+    for entry in tournament.standings():
+        print('  {name:20} Elo {elo:7.1f}  BT {bradley_terry:7.1f}  games {games:6}  '
+              'points/game {point_difference:+6.2f}'.format(**entry))
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+
+    # agents are given by factories, so that each worker can create its own instances
+    agents = {
+        'random_1': AgentRandomSchieber,
+        'random_2': AgentRandomSchieber,
+        'random_3': AgentRandomSchieber,
+    }
+    tournament = Tournament(agents, nr_games_per_pairing=200, games_per_block=50, nr_workers=4, seed=1)
+    tournament.play(callback=print_standings)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Count the nodes of the game tree for the reference positions and check the counts.
+"""
+import argparse
+
+from jass.bench.game_tree import perft, reference_positions, get_reference_state, verify_reference_positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the nodes of the game tree for the reference positions')
+    parser.add_argument('--depth', type=int, default=3, help='Depth of the search')
+    arg = parser.parse_args()
+
+    for index in range(len(reference_positions)):
+        result = perft(get_reference_state(index), arg.depth)
+        print('Position {}: leaf nodes: {}, nodes per depth: {}, {:.0f} nodes/s'.format(
+            index, result.nr_leaf_nodes, result.nodes_per_depth, result.nodes_per_second))
+
+    errors = verify_reference_positions(lambda state, depth: perft(state, depth).nr_leaf_nodes, arg.depth)
+    for error in errors:
+        print(error)
+    print('Reference counts: {}'.format('ok' if not errors else 'FAILED'))
+
+
+if __name__ == '__main__':
+    main()
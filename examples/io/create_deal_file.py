@@ -0,0 +1,30 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Create a deal file for DealingCardFileStrategy, either with random deals or from the games in log files.
+"""
+import argparse
+
+from jass.arena.dealing_card_file_strategy import generate_deal_file, extract_deal_file_from_game_logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create a file with deals for the arena')
+    parser.add_argument('--nr_deals', type=int, default=100000, help='Number of random deals, if no log files given')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the random number generator')
+    parser.add_argument('output', type=str, help='Name of the deal file (.npy)')
+    parser.add_argument('files', type=str, nargs='*', help='Log files with games to extract the deals from')
+    arg = parser.parse_args()
+
+    if len(arg.files) > 0:
+        nr_deals = extract_deal_file_from_game_logs(arg.files, arg.output)
+    else:
+        generate_deal_file(arg.output, arg.nr_deals, arg.seed)
+        nr_deals = arg.nr_deals
+    print('Saved {} deals'.format(nr_deals))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Build a trump table for randomly sampled hands.
+"""
+import argparse
+import logging
+
+from jass.agents.trump_table_builder import TrumpTableBuilder
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a lookup table for trump selection')
+    parser.add_argument('--nr_hands', type=int, default=10000, help='Number of hands to sample')
+    parser.add_argument('--nr_samples', type=int, default=100, help='Number of card distributions per hand')
+    parser.add_argument('--nr_workers', type=int, default=4, help='Number of processes')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the random number generators')
+    parser.add_argument('output', type=str, help='Base name of the table files')
+    arg = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    builder = TrumpTableBuilder(nr_samples=arg.nr_samples, nr_workers=arg.nr_workers, seed=arg.seed)
+    table = builder.build_random(arg.nr_hands)
+    table.save(arg.output)
+    print('Saved table with {} hands'.format(len(table)))
+
+
+if __name__ == '__main__':
+    main()
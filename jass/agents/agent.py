@@ -2,6 +2,7 @@
 #
 # Created by Thomas Koller on 7/28/2020
 #
+from jass.game.game_event import GameEvent
 from jass.game.game_observation import GameObservation
 
 
@@ -12,6 +13,11 @@ class Agent:
     def action_trump(self, obs: GameObservation) -> int:
         """
         Determine trump action for the given observation
+
+        The observation is only guaranteed to be valid during the call: an arena created with
+        observation_views=True passes a read-only view onto the game state (ObservationView), which changes as the
+        game continues. Agents that keep the observation must keep a copy (obs.materialize() for a view).
+
         Args:
             obs: the game observation, it must be in a state for trump selection
 
@@ -24,6 +30,8 @@ class Agent:
         """
         Determine the card to play.
 
+        The observation is only guaranteed to be valid during the call, see action_trump.
+
         Args:
             obs: the game observation
 
@@ -31,3 +39,25 @@ class Agent:
             the card to play, int encoded as defined in jass.game.const
         """
         raise NotImplementedError
+
+    def on_forced_card(self, obs: GameObservation, card: int) -> None:
+        """
+        Notification that the card was played for the agent without calling action_play_card, as it was the only
+        valid card (if enabled in the arena). The default implementation does nothing.
+
+        Args:
+            obs: the game observation before the card was played, only valid during the call (see action_trump)
+            card: the card that was played
+        """
+        pass
+
+    def on_game_event(self, event: GameEvent) -> None:
+        """
+        Notification about an event in the game (if enabled in the arena, or from the game info requests in a
+        player service). Agents can use the events to update their information incrementally. The default
+        implementation does nothing.
+
+        Args:
+            event: the event
+        """
+        pass
@@ -0,0 +1,61 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+from jass.agents.agent import Agent
+from jass.game.game_observation import GameObservation
+
+
+class AgentAsync:
+    """
+    Agent to act as a player in a game of jass, with coroutines for the actions, so that an arena can play many
+    games concurrently (see AsyncArena). This is useful for agents that wait for external resources, such as
+    players running as a service.
+    """
+    async def action_trump(self, obs: GameObservation) -> int:
+        """
+        Determine trump action for the given observation
+        Args:
+            obs: the game observation, it must be in a state for trump selection
+
+        Returns:
+            selected trump as encoded in jass.game.const or jass.game.const.PUSH
+        """
+        raise NotImplementedError
+
+    async def action_play_card(self, obs: GameObservation) -> int:
+        """
+        Determine the card to play.
+
+        Args:
+            obs: the game observation
+
+        Returns:
+            the card to play, int encoded as defined in jass.game.const
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release the resources of the agent (such as connections), called when all games have been played.
+        """
+        pass
+
+
+class AgentAsyncFromAgent(AgentAsync):
+    """
+    Use a (synchronous) agent as asynchronous agent. The actions of the agent are run directly on the event loop,
+    so they should be fast.
+    """
+    def __init__(self, agent: Agent):
+        self._agent = agent
+
+    @property
+    def agent(self) -> Agent:
+        return self._agent
+
+    async def action_trump(self, obs: GameObservation) -> int:
+        return self._agent.action_trump(obs)
+
+    async def action_play_card(self, obs: GameObservation) -> int:
+        return self._agent.action_play_card(obs)
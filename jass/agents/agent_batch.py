@@ -0,0 +1,47 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+from typing import List
+
+from jass.agents.agent import Agent
+from jass.game.game_observation import GameObservation
+
+
+class BatchAgent(Agent):
+    """
+    Agent that determines the actions for a batch of observations at once, for example agents that evaluate a
+    neural network. Subclasses implement the batch methods, the methods for single observations call them with a
+    batch of size one.
+
+    LockstepArena plays several games in parallel and collects the observations of all games for the batch calls.
+    """
+    def action_trump_batch(self, obs_list: List[GameObservation]) -> List[int]:
+        """
+        Determine trump actions for a list of observations.
+
+        Args:
+            obs_list: the game observations, they must be in a state for trump selection
+
+        Returns:
+            selected trump for each observation as encoded in jass.game.const or jass.game.const.PUSH
+        """
+        raise NotImplementedError
+
+    def action_play_card_batch(self, obs_list: List[GameObservation]) -> List[int]:
+        """
+        Determine the cards to play for a list of observations.
+
+        Args:
+            obs_list: the game observations
+
+        Returns:
+            the card to play for each observation, int encoded as defined in jass.game.const
+        """
+        raise NotImplementedError
+
+    def action_trump(self, obs: GameObservation) -> int:
+        return self.action_trump_batch([obs])[0]
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        return self.action_play_card_batch([obs])[0]
@@ -10,8 +10,11 @@ from jass.agents.agent import Agent
 from jass.agents.agent_random_schieber import AgentRandomSchieber
 from jass.game.const import card_ids
 from jass.game.game_observation import GameObservation
+from jass.game.json_encoder import ObservationJsonEncoder
 from jass.service.player_service_route import SEND_INFO_PREFIX, SELECT_TRUMP_PATH_PREFIX, PLAY_CARD_PATH_PREFIX
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
 
 class AgentByNetwork(Agent):
     """
@@ -28,29 +31,37 @@ class AgentByNetwork(Agent):
         self._url_trump = self._base_url + SELECT_TRUMP_PATH_PREFIX
         self._url_play = self._base_url + PLAY_CARD_PATH_PREFIX
         self._timeout = timeout
+        self._nr_standin_actions = 0
+        self._encoder = ObservationJsonEncoder()
+
+    @property
+    def nr_standin_actions(self) -> int:
+        """
+        Number of actions that were made by the standin player.
+        """
+        return self._nr_standin_actions
 
     def action_trump(self, obs: GameObservation) -> int:
-        data = obs.to_json()
-        data['gameId'] = 0
+        data = self._encoder.encode(obs)
         # noinspection PyBroadException
         try:
             self._logger.info('Sending request...')
-            response = requests.post(self._url_trump, json=data, timeout=self._timeout)
+            response = requests.post(self._url_trump, data=data, headers=_JSON_HEADERS, timeout=self._timeout)
             response_data = response.json()
             self._logger.info('got response: {}'.format(response_data))
             trump = int(response_data['trump'])
             return trump
         except Exception:
             self._logger.error('No response from network player, using standin player')
+            self._nr_standin_actions += 1
             return self._standin_player.action_trump(obs)
 
     # noinspection PyBroadException
     def action_play_card(self, obs: GameObservation) -> int:
-        data = obs.to_json()
-        data['gameId'] = 0
+        data = self._encoder.encode(obs)
         try:
             self._logger.info('Sending request...')
-            response = requests.post(self._url_play, json=data, timeout=self._timeout)
+            response = requests.post(self._url_play, data=data, headers=_JSON_HEADERS, timeout=self._timeout)
             response_data = response.json()
             self._logger.info('got response: {}'.format(response_data))
             card = response_data['card']
@@ -58,4 +69,5 @@ class AgentByNetwork(Agent):
             return card_id
         except Exception:
             self._logger.error('No response from network player, using standin player')
+            self._nr_standin_actions += 1
             return self._standin_player.action_play_card(obs)
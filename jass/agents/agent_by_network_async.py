@@ -0,0 +1,95 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import logging
+
+import aiohttp
+
+from jass.agents.agent_async import AgentAsync
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.const import card_ids
+from jass.game.game_observation import GameObservation
+from jass.game.json_encoder import ObservationJsonEncoder
+from jass.service.player_service_route import SELECT_TRUMP_PATH_PREFIX, PLAY_CARD_PATH_PREFIX
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+class AgentByNetworkAsync(AgentAsync):
+    """
+    Forwards the request to a player service, asynchronous version of AgentByNetwork to be used in AsyncArena.
+
+    The requests of all games are sent over one session with a pool of keep-alive connections, the number of
+    connections limits the number of concurrent requests to the service.
+
+    A random agent is used as standing player, if the service does not answer within a timeout.
+    """
+
+    def __init__(self, url, timeout=10, max_connections=100):
+        """
+        Args:
+            url: base url of the player service
+            timeout: timeout for a request in seconds
+            max_connections: maximal number of simultaneous connections to the service
+        """
+        self._logger = logging.getLogger(__name__)
+        self._standin_player = AgentRandomSchieber()
+        self._base_url = url
+        self._url_trump = self._base_url + SELECT_TRUMP_PATH_PREFIX
+        self._url_play = self._base_url + PLAY_CARD_PATH_PREFIX
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_connections = max_connections
+
+        self._nr_standin_actions = 0
+        self._encoder = ObservationJsonEncoder()
+
+        # the session is created on the first request, as it must be created within the event loop
+        self._session = None
+
+    @property
+    def nr_standin_actions(self) -> int:
+        """
+        Number of actions that were made by the standin player.
+        """
+        return self._nr_standin_actions
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return self._session
+
+    async def _post(self, url: str, obs: GameObservation) -> dict:
+        # the observation is encoded before the request is sent, so the encoder is not used concurrently
+        data = self._encoder.encode(obs)
+        self._logger.info('Sending request...')
+        async with self._get_session().post(url, data=data, headers=_JSON_HEADERS) as response:
+            response_data = await response.json()
+        self._logger.info('got response: {}'.format(response_data))
+        return response_data
+
+    # noinspection PyBroadException
+    async def action_trump(self, obs: GameObservation) -> int:
+        try:
+            response_data = await self._post(self._url_trump, obs)
+            return int(response_data['trump'])
+        except Exception:
+            self._logger.error('No response from network player, using standin player')
+            self._nr_standin_actions += 1
+            return self._standin_player.action_trump(obs)
+
+    # noinspection PyBroadException
+    async def action_play_card(self, obs: GameObservation) -> int:
+        try:
+            response_data = await self._post(self._url_play, obs)
+            return card_ids[response_data['card']]
+        except Exception:
+            self._logger.error('No response from network player, using standin player')
+            self._nr_standin_actions += 1
+            return self._standin_player.action_play_card(obs)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
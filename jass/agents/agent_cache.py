@@ -0,0 +1,235 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import hashlib
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_cheating import AgentCheating
+from jass.game.game_event import GameEvent
+from jass.game.game_observation import GameObservation
+from jass.game.game_state import GameState
+
+# the phase is part of the key, so that trump and card decisions never share an entry
+_PHASE_TRUMP = 0
+_PHASE_CARD = 1
+
+
+def get_observation_key(obs: GameObservation, phase: int = _PHASE_CARD) -> str:
+    """
+    Calculate a key for the information set of the observation, i.e. everything the player knows when acting.
+    Observations that only differ in derived information (like the points) get the same key.
+
+    Args:
+        obs: the observation
+        phase: _PHASE_TRUMP or _PHASE_CARD
+    Returns:
+        hash of the information set
+    """
+    data = np.concatenate(([phase, obs.dealer, obs.player, obs.trump, obs.forehand, obs.declared_trump],
+                           obs.hand, obs.tricks.reshape(-1), obs.trick_first_player)).astype(np.int8)
+    return hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+
+
+def get_state_key(state: GameState, phase: int = _PHASE_CARD) -> str:
+    """
+    Calculate a key for the game state (for agents in cheating mode).
+
+    Args:
+        state: the game state
+        phase: _PHASE_TRUMP or _PHASE_CARD
+    Returns:
+        hash of the state
+    """
+    data = np.concatenate(([phase, state.dealer, state.player, state.trump, state.forehand, state.declared_trump],
+                           state.hands.reshape(-1), state.tricks.reshape(-1),
+                           state.trick_first_player)).astype(np.int8)
+    return hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+
+
+class DecisionCache:
+    """
+    Least recently used cache of the decisions of an agent, with a bounded number of entries. The cache can be
+    saved to a json file and loaded again for the next run.
+    """
+    def __init__(self, max_entries: int = 1000000):
+        """
+        Args:
+            max_entries: maximal number of decisions in the cache, the least recently used entry is removed when
+                a new entry is added to a full cache
+        """
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._nr_hits = 0
+        self._nr_misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def nr_hits(self) -> int:
+        return self._nr_hits
+
+    @property
+    def nr_misses(self) -> int:
+        return self._nr_misses
+
+    @property
+    def hit_rate(self) -> float:
+        nr_requests = self._nr_hits + self._nr_misses
+        return self._nr_hits / nr_requests if nr_requests > 0 else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> int or None:
+        """
+        Get the decision for the key and count the hit or miss.
+
+        Returns:
+            the decision, or None if it is not in the cache
+        """
+        action = self._entries.get(key)
+        if action is None:
+            self._nr_misses += 1
+            return None
+        self._nr_hits += 1
+        self._entries.move_to_end(key)
+        return action
+
+    def put(self, key: str, action: int) -> None:
+        """
+        Add a decision to the cache.
+        """
+        self._entries[key] = action
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nr_hits = 0
+        self._nr_misses = 0
+
+    def save(self, filename: str) -> None:
+        """
+        Save the entries (from the least to the most recently used) to a json file.
+        """
+        with open(filename, mode='w') as file:
+            json.dump(dict(max_entries=self._max_entries, entries=list(self._entries.items())), file,
+                      separators=(',', ':'))
+
+    def load(self, filename: str) -> None:
+        """
+        Add the entries of a json file written by save, so that the entries of the file are the most recently used.
+        The maximal number of entries is restored from the file, the least recently used entries are removed if
+        the cache contains more entries.
+        """
+        with open(filename, mode='r') as file:
+            data = json.load(file)
+        self._max_entries = data['max_entries']
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        for key, action in data['entries']:
+            self.put(key, action)
+
+
+class AgentCached(Agent):
+    """
+    Agent that caches the decisions of another agent by the information set of the observation, which is
+    useful for deterministic agents, that are asked for the same decision many times (for example with
+    duplicate deals).
+
+    The wrapped agent must be deterministic and must not depend on information from earlier calls or
+    notifications, as these are only forwarded and do not change the cached decisions.
+    """
+    def __init__(self, agent: Agent, cache: DecisionCache = None, max_entries: int = 1000000):
+        """
+        Args:
+            agent: the agent to cache
+            cache: the cache to use (it can be shared between agents that make the same decisions), a new cache
+                with max_entries is created if None
+            max_entries: maximal number of entries of a new cache
+        """
+        self._agent = agent
+        self._cache = cache if cache is not None else DecisionCache(max_entries)
+
+    @property
+    def agent(self) -> Agent:
+        return self._agent
+
+    @property
+    def cache(self) -> DecisionCache:
+        return self._cache
+
+    def action_trump(self, obs: GameObservation) -> int:
+        key = get_observation_key(obs, _PHASE_TRUMP)
+        action = self._cache.get(key)
+        if action is None:
+            action = int(self._agent.action_trump(obs))
+            self._cache.put(key, action)
+        return action
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        key = get_observation_key(obs, _PHASE_CARD)
+        action = self._cache.get(key)
+        if action is None:
+            action = int(self._agent.action_play_card(obs))
+            self._cache.put(key, action)
+        return action
+
+    def on_forced_card(self, obs: GameObservation, card: int) -> None:
+        self._agent.on_forced_card(obs, card)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        self._agent.on_game_event(event)
+
+
+class AgentCheatingCached(AgentCheating):
+    """
+    Agent in cheating mode that caches the decisions of another agent by the game state, see AgentCached.
+    """
+    def __init__(self, agent: AgentCheating, cache: DecisionCache = None, max_entries: int = 1000000):
+        """
+        Args:
+            agent: the agent to cache
+            cache: the cache to use, a new cache with max_entries is created if None
+            max_entries: maximal number of entries of a new cache
+        """
+        self._agent = agent
+        self._cache = cache if cache is not None else DecisionCache(max_entries)
+
+    @property
+    def agent(self) -> AgentCheating:
+        return self._agent
+
+    @property
+    def cache(self) -> DecisionCache:
+        return self._cache
+
+    def action_trump(self, state: GameState) -> int:
+        key = get_state_key(state, _PHASE_TRUMP)
+        action = self._cache.get(key)
+        if action is None:
+            action = int(self._agent.action_trump(state))
+            self._cache.put(key, action)
+        return action
+
+    def action_play_card(self, state: GameState) -> int:
+        key = get_state_key(state, _PHASE_CARD)
+        action = self._cache.get(key)
+        if action is None:
+            action = int(self._agent.action_play_card(state))
+            self._cache.put(key, action)
+        return action
+
+    def on_forced_card(self, state: GameState, card: int) -> None:
+        self._agent.on_forced_card(state, card)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        self._agent.on_game_event(event)
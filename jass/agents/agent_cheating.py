@@ -2,6 +2,7 @@
 #
 # Created by Thomas Koller on 7/28/2020
 #
+from jass.game.game_event import GameEvent
 from jass.game.game_state import GameState
 
 
@@ -31,3 +32,25 @@ class AgentCheating:
             the card to play, int encoded as defined in jass.game.const
         """
         raise NotImplementedError
+
+    def on_forced_card(self, state: GameState, card: int) -> None:
+        """
+        Notification that the card was played for the agent without calling action_play_card, as it was the only
+        valid card (if enabled in the arena). The default implementation does nothing.
+
+        Args:
+            state: the game state before the card was played
+            card: the card that was played
+        """
+        pass
+
+    def on_game_event(self, event: GameEvent) -> None:
+        """
+        Notification about an event in the game (if enabled in the arena, or from the game info requests in a
+        player service). Agents can use the events to update their information incrementally. The default
+        implementation does nothing.
+
+        Args:
+            event: the event
+        """
+        pass
@@ -0,0 +1,316 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.game_event import GameEvent
+from jass.game.game_observation import GameObservation
+
+# size of a message slot in bytes
+SLOT_SIZE = 128
+
+# message types
+MSG_STOP = 0
+MSG_TRUMP = 1
+MSG_PLAY_CARD = 2
+MSG_FORCED_CARD = 3
+MSG_GAME_EVENT = 4
+
+# layout of the observation in a slot (int8), the points are stored as int16 in 4 bytes
+_OBS_SCALARS = 1
+_OBS_CARD = 10
+_OBS_HAND = 11
+_OBS_TRICKS = 47
+_OBS_TRICK_WINNER = 83
+_OBS_TRICK_POINTS = 92
+_OBS_TRICK_FIRST_PLAYER = 101
+_OBS_POINTS = 110
+
+# layout of an event in a slot
+_EVENT_SCALARS = 1
+_EVENT_POINTS = 7
+_EVENT_HAND = 11
+_EVENT_HAS_HAND = 47
+_EVENT_SEATS = 48
+_EVENT_HAND_OWNERS = 49
+_EVENT_HAS_HANDS = 85
+
+# layout of the response slot
+_RESPONSE_ACTION = 0
+
+
+def encode_observation(obs: GameObservation, slot: np.ndarray) -> None:
+    """
+    Encode an observation into a slot of the shared memory with a fixed layout.
+
+    Args:
+        obs: the observation
+        slot: int8 array of size SLOT_SIZE
+    """
+    slot[_OBS_SCALARS:_OBS_SCALARS + 9] = (obs.dealer, obs.player, obs.player_view, obs.trump, obs.forehand,
+                                           obs.declared_trump, obs.nr_tricks, obs.nr_cards_in_trick,
+                                           obs.nr_played_cards)
+    slot[_OBS_HAND:_OBS_HAND + 36] = obs.hand
+    slot[_OBS_TRICKS:_OBS_TRICKS + 36] = obs.tricks.reshape(-1)
+    slot[_OBS_TRICK_WINNER:_OBS_TRICK_WINNER + 9] = obs.trick_winner
+    slot[_OBS_TRICK_POINTS:_OBS_TRICK_POINTS + 9] = obs.trick_points
+    slot[_OBS_TRICK_FIRST_PLAYER:_OBS_TRICK_FIRST_PLAYER + 9] = obs.trick_first_player
+    slot[_OBS_POINTS:_OBS_POINTS + 4].view(np.int16)[:] = obs.points
+
+
+def decode_observation(slot: np.ndarray) -> GameObservation:
+    """
+    Decode an observation from a slot of the shared memory.
+
+    Args:
+        slot: int8 array of size SLOT_SIZE
+    Returns:
+        the observation
+    """
+    obs = GameObservation()
+    obs.dealer, obs.player, obs.player_view, obs.trump, obs.forehand, obs.declared_trump, obs.nr_tricks, \
+        obs.nr_cards_in_trick, obs.nr_played_cards = (int(v) for v in slot[_OBS_SCALARS:_OBS_SCALARS + 9])
+    obs.hand[:] = slot[_OBS_HAND:_OBS_HAND + 36]
+    obs.tricks[:, :] = slot[_OBS_TRICKS:_OBS_TRICKS + 36].reshape(9, 4)
+    obs.trick_winner[:] = slot[_OBS_TRICK_WINNER:_OBS_TRICK_WINNER + 9]
+    obs.trick_points[:] = slot[_OBS_TRICK_POINTS:_OBS_TRICK_POINTS + 9]
+    obs.trick_first_player[:] = slot[_OBS_TRICK_FIRST_PLAYER:_OBS_TRICK_FIRST_PLAYER + 9]
+    obs.points[:] = slot[_OBS_POINTS:_OBS_POINTS + 4].view(np.int16)
+    obs.current_trick = obs.tricks[obs.nr_tricks, :] if obs.nr_played_cards < 36 else None
+    return obs
+
+
+def encode_event(event: GameEvent, slot: np.ndarray) -> None:
+    """
+    Encode a game event (except GAME_INFO) into a slot of the shared memory.
+
+    Args:
+        event: the event
+        slot: int8 array of size SLOT_SIZE
+    """
+    slot[_EVENT_SCALARS:_EVENT_SCALARS + 6] = (event.event_type, event.player, event.dealer, event.trump, event.card,
+                                               event.trick_nr)
+    slot[_EVENT_POINTS:_EVENT_POINTS + 4].view(np.int16)[:] = event.points
+    if event.hand is not None:
+        slot[_EVENT_HAND:_EVENT_HAND + 36] = event.hand
+        slot[_EVENT_HAS_HAND] = 1
+    else:
+        slot[_EVENT_HAS_HAND] = 0
+    # the seats as bit mask (0 if not set) and the hands of the seats as the seat owning each card
+    slot[_EVENT_SEATS] = sum(1 << seat for seat in event.seats) if event.seats is not None else 0
+    if event.hands is not None:
+        owners = slot[_EVENT_HAND_OWNERS:_EVENT_HAND_OWNERS + 36]
+        owners[:] = -1
+        for seat in range(4):
+            owners[event.hands[seat] != 0] = seat
+        slot[_EVENT_HAS_HANDS] = 1
+    else:
+        slot[_EVENT_HAS_HANDS] = 0
+
+
+def decode_event(slot: np.ndarray) -> GameEvent:
+    """
+    Decode a game event from a slot of the shared memory.
+
+    Args:
+        slot: int8 array of size SLOT_SIZE
+    Returns:
+        the event
+    """
+    event_type, player, dealer, trump, card, trick_nr = (int(v) for v in slot[_EVENT_SCALARS:_EVENT_SCALARS + 6])
+    points = slot[_EVENT_POINTS:_EVENT_POINTS + 4].view(np.int16).astype(np.int32)
+    points = points if event_type == GameEvent.GAME_END else int(points[0])
+    hand = slot[_EVENT_HAND:_EVENT_HAND + 36].astype(np.int32) if slot[_EVENT_HAS_HAND] else None
+    seats_mask = int(slot[_EVENT_SEATS])
+    seats = tuple(seat for seat in range(4) if seats_mask & (1 << seat)) if seats_mask else None
+    hands = None
+    if slot[_EVENT_HAS_HANDS]:
+        owners = slot[_EVENT_HAND_OWNERS:_EVENT_HAND_OWNERS + 36]
+        hands = (owners == np.arange(4)[:, np.newaxis]).astype(np.int32)
+    return GameEvent(event_type, player=player, dealer=dealer, trump=trump, card=card, trick_nr=trick_nr,
+                     points=points, hand=hand, seats=seats, hands=hands)
+
+
+def _serve(agent_factory: Callable[[], Agent], shm_name: str, nr_slots: int, free, filled, response) -> None:
+    """
+    Main loop of the agent process: handle the messages from the ring in order and write the actions into the
+    response slot.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffer = np.ndarray((nr_slots + 1, SLOT_SIZE), dtype=np.int8, buffer=shm.buf)
+        agent = agent_factory()
+        index = 0
+        while True:
+            filled.acquire()
+            slot = buffer[index]
+            msg_type = int(slot[0])
+            if msg_type == MSG_STOP:
+                break
+            if msg_type == MSG_TRUMP:
+                action = agent.action_trump(decode_observation(slot))
+            elif msg_type == MSG_PLAY_CARD:
+                action = agent.action_play_card(decode_observation(slot))
+            elif msg_type == MSG_FORCED_CARD:
+                agent.on_forced_card(decode_observation(slot), int(slot[_OBS_CARD]))
+            else:
+                agent.on_game_event(decode_event(slot))
+            index = (index + 1) % nr_slots
+            free.release()
+            if msg_type in (MSG_TRUMP, MSG_PLAY_CARD):
+                buffer[nr_slots, _RESPONSE_ACTION] = action
+                response.release()
+        del buffer, slot
+    finally:
+        shm.close()
+
+
+class AgentProcessProxy(Agent):
+    """
+    Run an agent in its own process, so that it does not compete for the GIL with the arena and other agents,
+    and a crash of the agent does not stop the arena.
+
+    The messages to the agent are written into a ring of fixed size slots in shared memory, using a fixed int8
+    layout for the observations and events, so no pickling is necessary. Notifications (on_game_event and
+    on_forced_card) do not wait for the agent, actions wait for the answer in a separate response slot.
+
+    If the agent process terminates or does not answer within the timeout, a random agent is used as standin
+    player for the remaining actions.
+
+    The proxy should be closed after use (or used as a context manager) to stop the process and release the
+    shared memory.
+    """
+
+    def __init__(self, agent_factory: Callable[[], Agent], nr_slots: int = 64, timeout: float = None):
+        """
+        Args:
+            agent_factory: function or class that creates the agent in the new process, it must be picklable if
+                processes are not started by fork
+            nr_slots: number of slots in the ring
+            timeout: maximal time in seconds to wait for an action, None to wait as long as the process is alive
+        """
+        self._logger = logging.getLogger(__name__)
+        self._nr_slots = nr_slots
+        self._timeout = timeout
+        self._standin_player = AgentRandomSchieber()
+        self._nr_standin_actions = 0
+
+        self._shm = shared_memory.SharedMemory(create=True, size=(nr_slots + 1) * SLOT_SIZE)
+        self._buffer = np.ndarray((nr_slots + 1, SLOT_SIZE), dtype=np.int8, buffer=self._shm.buf)
+        self._index = 0
+
+        self._free = multiprocessing.Semaphore(nr_slots)
+        self._filled = multiprocessing.Semaphore(0)
+        self._response = multiprocessing.Semaphore(0)
+        self._process = multiprocessing.Process(target=_serve,
+                                                args=(agent_factory, self._shm.name, nr_slots, self._free,
+                                                      self._filled, self._response),
+                                                daemon=True)
+        self._process.start()
+        self._alive = True
+
+    @property
+    def nr_standin_actions(self) -> int:
+        """
+        Number of actions that were made by the standin player.
+        """
+        return self._nr_standin_actions
+
+    @property
+    def alive(self) -> bool:
+        """
+        True if the agent process is used, False if it terminated and the standin player is used.
+        """
+        return self._alive
+
+    def _wait(self, semaphore) -> bool:
+        # wait for the semaphore, checking regularly whether the process is still alive
+        waited = 0.0
+        while not semaphore.acquire(timeout=0.1):
+            waited += 0.1
+            if not self._process.is_alive() or (self._timeout is not None and waited >= self._timeout):
+                self._logger.error('Agent process not responding, using standin player')
+                self._alive = False
+                return False
+        return True
+
+    def _next_slot(self) -> np.ndarray or None:
+        if not self._alive or not self._wait(self._free):
+            return None
+        slot = self._buffer[self._index]
+        self._index = (self._index + 1) % self._nr_slots
+        return slot
+
+    def _send_obs(self, msg_type: int, obs: GameObservation, card: int = -1) -> bool:
+        slot = self._next_slot()
+        if slot is None:
+            return False
+        slot[0] = msg_type
+        slot[_OBS_CARD] = card
+        encode_observation(obs, slot)
+        self._filled.release()
+        return True
+
+    def _request(self, msg_type: int, obs: GameObservation) -> int or None:
+        if not self._send_obs(msg_type, obs) or not self._wait(self._response):
+            return None
+        return int(self._buffer[self._nr_slots, _RESPONSE_ACTION])
+
+    def action_trump(self, obs: GameObservation) -> int:
+        action = self._request(MSG_TRUMP, obs)
+        if action is None:
+            self._nr_standin_actions += 1
+            return self._standin_player.action_trump(obs)
+        return action
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        action = self._request(MSG_PLAY_CARD, obs)
+        if action is None:
+            self._nr_standin_actions += 1
+            return self._standin_player.action_play_card(obs)
+        return action
+
+    def on_forced_card(self, obs: GameObservation, card: int) -> None:
+        self._send_obs(MSG_FORCED_CARD, obs, card)
+
+    def on_game_event(self, event: GameEvent) -> None:
+        if event.event_type == GameEvent.GAME_INFO:
+            return
+        slot = self._next_slot()
+        if slot is not None:
+            slot[0] = MSG_GAME_EVENT
+            encode_event(event, slot)
+            self._filled.release()
+
+    def close(self) -> None:
+        """
+        Stop the agent process and release the shared memory.
+        """
+        if self._process is None:
+            return
+        slot = self._next_slot()
+        if slot is not None:
+            slot[0] = MSG_STOP
+            self._filled.release()
+        self._process.join(timeout=5.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+        self._alive = False
+        del self._buffer
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
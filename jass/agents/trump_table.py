@@ -0,0 +1,157 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import numpy as np
+
+from jass.game.const import PUSH, PUSH_ALT, MAX_TRUMP
+from jass.game.game_observation import GameObservation
+
+# weights to convert the 9 cards of a color into a bit mask
+_color_bit_weights = np.left_shift(1, np.arange(9, dtype=np.int64))
+
+
+def get_canonical_hand_key(hand: np.ndarray) -> (int, np.ndarray):
+    """
+    Calculate the canonical key of a hand. Hands that only differ by a permutation of the colors have the same
+    canonical key. The colors of the hand are sorted by their bit masks (highest first) and the sorted masks are
+    combined into one 36 bit key.
+
+    Args:
+        hand: one-hot encoded hand (36 entries)
+
+    Returns:
+        the canonical key and the color permutation, i.e. canonical color i corresponds to color permutation[i]
+        of the hand
+    """
+    masks = hand.reshape(4, 9).astype(np.int64) @ _color_bit_weights
+    permutation = np.argsort(-masks, kind='stable')
+    key = 0
+    for i, color in enumerate(permutation):
+        key |= int(masks[color]) << (9 * i)
+    return key, permutation
+
+
+def get_hand_from_canonical_key(key: int) -> np.ndarray:
+    """
+    Get a hand from its canonical key, the colors of the hand will be in canonical order.
+
+    Args:
+        key: the canonical key
+    Returns:
+        one-hot encoded hand
+    """
+    hand = np.zeros(36, dtype=np.int32)
+    for i in range(36):
+        if (key >> i) & 1:
+            hand[i] = 1
+    return hand
+
+
+class TrumpTable:
+    """
+    Lookup table for the trump selection. The table contains the expected points for each trump (and for pushing)
+    for the team of the player that makes the trump decision, both for the forehand player and for the partner after
+    the forehand player pushed.
+
+    As the values are invariant under a permutation of the colors, only canonical hands are stored (see
+    get_canonical_hand_key). The keys are stored sorted, so that a hand can be found by binary search. Keys and values
+    are saved as numpy files, that can be memory mapped on load, so that large tables can be shared between processes.
+
+    Tables are usually generated offline by TrumpTableBuilder.
+    """
+
+    # index into the second dimension of the values
+    FOREHAND = 0
+    PUSHED = 1
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        """
+        Initialize the table.
+
+        Args:
+            keys: sorted canonical keys of the hands, shape [n]
+            values: expected points for the keys, shape [n, 2, 7], the second index is FOREHAND or PUSHED and the
+                last index is the trump (or PUSH_ALT for pushing, which is only valid for FOREHAND)
+        """
+        self._keys = keys
+        self._values = values
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def __len__(self):
+        return self._keys.shape[0]
+
+    @classmethod
+    def load(cls, basename: str, mmap: bool = True) -> 'TrumpTable':
+        """
+        Load the table from the files written by save.
+
+        Args:
+            basename: base file name of the table
+            mmap: True if the files should be memory mapped read only instead of read into memory
+        Returns:
+            the table
+        """
+        mmap_mode = 'r' if mmap else None
+        keys = np.load(basename + '_keys.npy', mmap_mode=mmap_mode)
+        values = np.load(basename + '_values.npy', mmap_mode=mmap_mode)
+        return TrumpTable(keys, values)
+
+    def save(self, basename: str) -> None:
+        """
+        Save the table into two numpy files <basename>_keys.npy and <basename>_values.npy.
+
+        Args:
+            basename: base file name, including the path
+        """
+        np.save(basename + '_keys.npy', np.asarray(self._keys, dtype=np.int64))
+        np.save(basename + '_values.npy', np.asarray(self._values, dtype=np.float32))
+
+    def lookup(self, hand: np.ndarray, forehand: bool) -> np.ndarray or None:
+        """
+        Get the expected points for the trump actions of a hand.
+
+        Args:
+            hand: one-hot encoded hand of the player
+            forehand: True if the player is forehand, False if the partner pushed
+        Returns:
+            array of length 7 with the expected points for the trumps DIAMONDS to UNE_UFE and for pushing
+            (at index PUSH_ALT, nan if not forehand), or None if the hand is not in the table
+        """
+        key, permutation = get_canonical_hand_key(hand)
+        index = int(np.searchsorted(self._keys, key))
+        if index == self._keys.shape[0] or self._keys[index] != key:
+            return None
+        values_canonical = self._values[index, TrumpTable.FOREHAND if forehand else TrumpTable.PUSHED]
+
+        # map the colors back from canonical order to the order of the hand
+        values = np.array(values_canonical, dtype=np.float32)
+        values[permutation] = values_canonical[0:4]
+        return values
+
+    def action_trump(self, obs: GameObservation) -> int or None:
+        """
+        Determine the trump action from the table. This can be used in the action_trump method of an agent, a
+        return value of None indicates that the agent has to use another method to select the trump.
+
+        Args:
+            obs: the game observation, it must be in a state for trump selection
+        Returns:
+            selected trump as encoded in jass.game.const or jass.game.const.PUSH, or None if the hand of the
+            observation is not in the table
+        """
+        forehand = obs.forehand == -1
+        values = self.lookup(obs.hand, forehand)
+        if values is None:
+            return None
+        if not forehand:
+            values = values[0:MAX_TRUMP + 1]
+        action = int(np.argmax(values))
+        return PUSH if action == PUSH_ALT else action
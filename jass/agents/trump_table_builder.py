@@ -0,0 +1,167 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import logging
+import multiprocessing
+from typing import Callable, Iterable
+
+import numpy as np
+
+from jass.agents.trump_table import TrumpTable, get_canonical_hand_key, get_hand_from_canonical_key
+from jass.game.const import NORTH, EAST, SOUTH, WEST, PUSH, PUSH_ALT, MAX_TRUMP, card_values
+from jass.game.game_sim import GameSim
+from jass.game.game_state import GameState
+from jass.game.rule_schieber import RuleSchieber
+
+_rule = RuleSchieber()
+
+
+def random_rollout(state: GameState, rng: np.random.Generator) -> int:
+    """
+    Backend for the builder that plays the game to the end with random valid cards.
+
+    Args:
+        state: state of the game after trump has been declared
+        rng: random number generator to use
+    Returns:
+        the points of team 0 at the end of the game
+    """
+    sim = GameSim(rule=_rule)
+    sim.init_from_state(state)
+    while not sim.is_done():
+        valid_cards = _rule.get_valid_cards_from_state(sim.state)
+        sim.action_play_card(rng.choice(np.flatnonzero(valid_cards)))
+    return int(sim.state.points[0])
+
+
+def select_trump_by_card_values(hand: np.ndarray) -> int:
+    """
+    Simple policy for the partner after pushing: select the trump for which the cards in the hand have the
+    highest value.
+
+    Args:
+        hand: one-hot encoded hand
+    Returns:
+        the selected trump
+    """
+    return int(np.argmax(card_values @ hand))
+
+
+def _play(hands: np.ndarray, dealer: int, trump: int, pushed: bool, backend: Callable, rng) -> int:
+    sim = GameSim(rule=_rule)
+    sim.init_from_cards(hands=hands, dealer=dealer)
+    if pushed:
+        sim.action_trump(PUSH)
+    sim.action_trump(trump)
+    return backend(sim.state, rng)
+
+
+def _estimate_values(args) -> np.ndarray:
+    """
+    Estimate the values for one hand, the player with the hand is NORTH. For the forehand values EAST deals, so
+    NORTH declares trump and leads, for the pushed values WEST deals, so SOUTH leads after pushing to NORTH.
+    """
+    hand, nr_samples, backend, partner_policy, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+
+    # points for [forehand/pushed, sample, trump]
+    points = np.zeros([2, nr_samples, MAX_TRUMP + 1], dtype=np.float64)
+    partner_trump = np.zeros(nr_samples, dtype=np.int64)
+
+    other_cards = np.flatnonzero(hand == 0)
+    hands = np.zeros([4, 36], dtype=np.int32)
+    hands[NORTH, :] = hand
+    for sample in range(nr_samples):
+        cards = rng.permutation(other_cards)
+        hands[EAST:4, :] = 0
+        hands[EAST, cards[0:9]] = 1
+        hands[SOUTH, cards[9:18]] = 1
+        hands[WEST, cards[18:27]] = 1
+
+        # the order of play does not depend on who declared trump, so the forehand games are also used to
+        # evaluate pushing, with the trump that the partner selects
+        partner_trump[sample] = partner_policy(hands[SOUTH])
+        for trump in range(MAX_TRUMP + 1):
+            points[TrumpTable.FOREHAND, sample, trump] = _play(hands, EAST, trump, False, backend, rng)
+            points[TrumpTable.PUSHED, sample, trump] = _play(hands, WEST, trump, True, backend, rng)
+
+    values = np.full([2, PUSH_ALT + 1], np.nan, dtype=np.float32)
+    values[:, 0:MAX_TRUMP + 1] = points.mean(axis=1)
+    values[TrumpTable.FOREHAND, PUSH_ALT] = points[TrumpTable.FOREHAND, np.arange(nr_samples), partner_trump].mean()
+    return values
+
+
+class TrumpTableBuilder:
+    """
+    Build a TrumpTable offline by estimating the expected points of each trump for a number of canonical hands.
+
+    For each hand, the cards of the other players are sampled and each trump is evaluated by the backend. The
+    default backend plays the game out randomly, but any function that evaluates a GameState after trump selection
+    (for example a solver) can be used. The value of pushing is estimated using a policy for the trump selection
+    of the partner.
+
+    The hands are evaluated in parallel if more than one worker is used. Each hand gets its own random generator
+    spawned from the seed, so the table does not depend on the number of workers. The backend and partner
+    policy must be picklable for that (i.e. functions defined at module level).
+    """
+    def __init__(self,
+                 nr_samples: int = 100,
+                 backend: Callable[[GameState, np.random.Generator], int] = random_rollout,
+                 partner_policy: Callable[[np.ndarray], int] = select_trump_by_card_values,
+                 nr_workers: int = 1,
+                 seed: int = None):
+        """
+        Args:
+            nr_samples: number of sampled distributions of the other cards per hand
+            backend: function that returns the points of team 0 at the end of the game for a state
+            partner_policy: function that returns the trump that the partner selects for a hand after pushing
+            nr_workers: number of processes to use
+            seed: seed for the random generators
+        """
+        self._logger = logging.getLogger(__name__)
+        self._nr_samples = nr_samples
+        self._backend = backend
+        self._partner_policy = partner_policy
+        self._nr_workers = nr_workers
+        self._seed = seed
+
+    def build_from_hands(self, hands: Iterable[np.ndarray]) -> TrumpTable:
+        """
+        Build a table for the given hands. Hands that have the same canonical key are only evaluated once.
+
+        Args:
+            hands: one-hot encoded hands
+        Returns:
+            the table
+        """
+        keys = np.array(sorted({get_canonical_hand_key(hand)[0] for hand in hands}), dtype=np.int64)
+        seeds = np.random.SeedSequence(self._seed).spawn(keys.shape[0])
+        tasks = ((get_hand_from_canonical_key(int(key)), self._nr_samples, self._backend, self._partner_policy,
+                  seed) for key, seed in zip(keys, seeds))
+
+        self._logger.info('Evaluating {} canonical hands'.format(keys.shape[0]))
+        values = np.zeros([keys.shape[0], 2, PUSH_ALT + 1], dtype=np.float32)
+        if self._nr_workers > 1:
+            with multiprocessing.Pool(self._nr_workers) as pool:
+                for i, value in enumerate(pool.imap(_estimate_values, tasks, chunksize=4)):
+                    values[i] = value
+        else:
+            for i, task in enumerate(tasks):
+                values[i] = _estimate_values(task)
+        return TrumpTable(keys, values)
+
+    def build_random(self, nr_hands: int) -> TrumpTable:
+        """
+        Build a table for randomly sampled hands.
+
+        Args:
+            nr_hands: number of hands to sample (the table might be smaller, if hands with the same key are drawn)
+        Returns:
+            the table
+        """
+        rng = np.random.default_rng(self._seed)
+        hands = np.zeros([nr_hands, 36], dtype=np.int32)
+        for i in range(nr_hands):
+            hands[i, rng.choice(36, size=9, replace=False)] = 1
+        return self.build_from_hands(hands)
@@ -3,9 +3,12 @@
 # Created by Thomas Koller on 27.07.20
 #
 import logging
+import os
+import pickle
 import sys
+import time
 from datetime import datetime
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import numpy as np
 
@@ -13,7 +16,10 @@ from jass.agents.agent import Agent
 from jass.agents.agent_cheating import AgentCheating
 from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
 from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.arena.latency_statistics import LatencyStatistics
+from jass.arena.stopping_rule import StoppingRule
 from jass.game.const import NORTH, EAST, SOUTH, WEST, DIAMONDS, MAX_TRUMP, PUSH, next_player
+from jass.game.game_event import GameEvent
 from jass.game.game_observation import GameObservation
 from jass.game.game_sim import GameSim
 from jass.game.rule_schieber import RuleSchieber
@@ -21,6 +27,22 @@ from jass.logs.game_log_entry import GameLogEntry
 from jass.logs.log_entry_file_generator import LogEntryFileGenerator
 
 
+def get_dealer(game_nr: int) -> int:
+    """
+    Get the dealer of a game, when the first game is dealt by north and the dealer changes after each game
+    (as in play_all_games).
+
+    Args:
+        game_nr: number of the game, starting with 0
+    Returns:
+        the dealer
+    """
+    dealer = NORTH
+    for _ in range(game_nr % 4):
+        dealer = next_player[dealer]
+    return dealer
+
+
 class Arena:
     """
     Class for arenas. An arena plays a number of games between two pairs of players. The number of
@@ -37,7 +59,14 @@ class Arena:
                  print_every_x_games: int = 5,
                  check_move_validity=True,
                  save_filename=None,
-                 cheating_mode=False):
+                 cheating_mode=False,
+                 record_latency=False,
+                 stopping_rule: StoppingRule = None,
+                 checkpoint_filename: str = None,
+                 checkpoint_every_x_games: int = 1000,
+                 skip_forced_moves: bool = False,
+                 notify_game_events: bool = False,
+                 observation_views: bool = False):
         """
 
         Args:
@@ -47,6 +76,17 @@ class Arena:
             check_move_validity: True if moves from the agents should be checked for validity
             save_filename: True if results should be save
             cheating_mode: True if agents will receive the full game state
+            record_latency: True if the time of the decisions of the agents should be recorded
+            stopping_rule: rule to stop before nr_games_to_play games, when the result is clear
+            checkpoint_filename: file to save checkpoints to, None if no checkpoints should be saved
+            checkpoint_every_x_games: save a checkpoint every x games (and when the games are finished or stopped)
+            skip_forced_moves: True if the card should be played without asking the agent, if it is the only valid
+                card (the agent is notified by on_forced_card)
+            notify_game_events: True if the agents should receive the events of the game by on_game_event (once for
+                each agent instance, also if it plays on several seats)
+            observation_views: True if the agents should receive read-only views onto the game state as observations
+                (see ObservationView), which are only valid during the call of the agent, False if they should
+                receive a copy that they may keep
         """
         self._cheating_mode = cheating_mode
         self._logger = logging.getLogger(__name__)
@@ -69,9 +109,14 @@ class Arena:
         # the current game that is being played
         self._game = GameSim(rule=RuleSchieber())  # schieber rule is default
 
-        # we store the points for each game
-        self._points_team_0 = np.zeros(self._nr_games_to_play)
-        self._points_team_1 = np.zeros(self._nr_games_to_play)
+        # we store the points for each game, the number of games might be smaller than nr_games_to_play if the
+        # arena stops early
+        self._points_team_0 = []
+        self._points_team_1 = []
+        self._stopping_rule = stopping_rule
+
+        self._checkpoint_filename = checkpoint_filename
+        self._checkpoint_every_x_games = checkpoint_every_x_games
 
         # Print  progress
         self._print_every_x_games = print_every_x_games
@@ -87,9 +132,30 @@ class Arena:
         # if cheating mode agents observation corresponds to the full game state
         if self._cheating_mode:
             self.get_agent_observation = lambda: self._game.state
+        elif observation_views:
+            self.get_agent_observation = self._game.get_observation_view
         else:
             self.get_agent_observation = self._game.get_observation
 
+        # the agents are asked for their actions by these methods, which additionally measure the time if enabled
+        if record_latency:
+            self._latency_statistics = LatencyStatistics()
+            self.request_trump = self._request_trump_timed
+            self.request_card = self._request_card_timed
+        else:
+            self._latency_statistics = None
+            self.request_trump = lambda player, obs: self._players[player].action_trump(obs)
+            self.request_card = lambda player, obs: self._players[player].action_play_card(obs)
+
+        self._notify_game_events = notify_game_events
+        self._agent_seats = []
+
+        # number of cards that were played without asking the agent, for each player
+        self._nr_forced_moves = np.zeros(4, dtype=np.int64)
+        if skip_forced_moves:
+            self._request_card_from_agent = self.request_card
+            self.request_card = self._request_card_or_forced
+
     @property
     def nr_games_to_play(self):
         return self._nr_games_to_play
@@ -138,12 +204,31 @@ class Arena:
         return self._nr_games_played
 
     @property
-    def points_team_0(self):
-        return self._points_team_0
+    def points_team_0(self) -> np.ndarray:
+        return np.array(self._points_team_0, dtype=np.float64)
+
+    @property
+    def points_team_1(self) -> np.ndarray:
+        return np.array(self._points_team_1, dtype=np.float64)
+
+    @property
+    def nr_forced_moves(self) -> np.ndarray:
+        """
+        Number of cards for each player that were played without asking the agent (if skip_forced_moves is
+        enabled).
+        """
+        return self._nr_forced_moves
+
+    @property
+    def stopping_rule(self) -> StoppingRule or None:
+        return self._stopping_rule
 
     @property
-    def points_team_1(self):
-        return self._points_team_1
+    def latency_statistics(self) -> LatencyStatistics or None:
+        """
+        Statistics of the decision times of the agents, None if record_latency was not enabled.
+        """
+        return self._latency_statistics
 
     def get_observation(self) -> GameObservation:
         """
@@ -184,6 +269,64 @@ class Arena:
         elif not self._cheating_mode and not all([issubclass(type(x), Agent) for x in self._players]):
             raise AssertionError(f"All agents must be a subclass of {Agent} in non cheating mode.")
 
+    def _request_timed(self, player: int, phase: int, action):
+        agent = self._players[player]
+        # agents that use a fallback (such as AgentByNetwork) count the number of times it was used
+        fallbacks = getattr(agent, 'nr_standin_actions', 0)
+        start = time.perf_counter()
+        result = action(agent)
+        seconds = time.perf_counter() - start
+        fallbacks = getattr(agent, 'nr_standin_actions', 0) - fallbacks
+        self._latency_statistics.add(player, phase, seconds, fallbacks)
+        return result
+
+    def _request_trump_timed(self, player: int, obs) -> int:
+        return self._request_timed(player, LatencyStatistics.PHASE_TRUMP, lambda agent: agent.action_trump(obs))
+
+    def _request_card_timed(self, player: int, obs) -> int:
+        return self._request_timed(player, self._game.state.nr_tricks + 1, lambda agent: agent.action_play_card(obs))
+
+    def _request_card_or_forced(self, player: int, obs) -> int:
+        state = self._game.state
+        if state.nr_tricks == 8:
+            # only one card left in the last trick
+            valid_cards = np.flatnonzero(state.hands[player])
+        else:
+            valid_cards = np.flatnonzero(self._game.rule.get_valid_cards_from_state(state))
+        if len(valid_cards) == 1:
+            card = int(valid_cards[0])
+            self._nr_forced_moves[player] += 1
+            self._players[player].on_forced_card(obs, card)
+            return card
+        return self._request_card_from_agent(player, obs)
+
+    def _get_agent_seats(self) -> List[Tuple[Union[Agent, AgentCheating], Tuple[int, ...]]]:
+        # the distinct agents with their seats, an agent instance can play on several seats
+        agent_seats = []
+        for seat, agent in enumerate(self._players):
+            for i, (other, seats) in enumerate(agent_seats):
+                if other is agent:
+                    agent_seats[i] = (other, seats + (seat,))
+                    break
+            else:
+                agent_seats.append((agent, (seat,)))
+        return agent_seats
+
+    def _send_game_event(self, event_type: int, **kwargs) -> None:
+        # send the event once to each agent, with the seats of the agent
+        for agent, seats in self._agent_seats:
+            agent.on_game_event(GameEvent(event_type, seats=seats, **kwargs))
+
+    def _send_card_events(self, player: int, card: int) -> None:
+        # send the events for the card that was just played, and for the end of the trick if it was completed
+        state = self._game.state
+        trick_completed = state.nr_cards_in_trick == 0
+        trick_nr = state.nr_tricks - 1 if trick_completed else state.nr_tricks
+        self._send_game_event(GameEvent.CARD_PLAYED, player=player, card=card, trick_nr=trick_nr)
+        if trick_completed:
+            self._send_game_event(GameEvent.TRICK_END, player=int(state.trick_winner[trick_nr]), trick_nr=trick_nr,
+                                  points=int(state.trick_points[trick_nr]))
+
     def play_game(self, dealer: int) -> None:
         """
         Play a complete game (36 cards).
@@ -192,36 +335,54 @@ class Arena:
         self._game.init_from_cards(dealer=dealer, hands=self._dealing_card_strategy.deal_cards(
             game_nr=self._nr_games_played,
             total_nr_games=self._nr_games_to_play))
+        if self._notify_game_events:
+            self._agent_seats = self._get_agent_seats()
+            for agent, seats in self._agent_seats:
+                hands = np.zeros_like(self._game.state.hands)
+                hands[list(seats)] = self._game.state.hands[list(seats)]
+                agent.on_game_event(GameEvent(GameEvent.GAME_START, player=seats[0], dealer=dealer,
+                                              hand=hands[seats[0]].copy(), seats=seats, hands=hands))
 
         # determine trump
         # ask first player
 
-        trump_action = self._players[self._game.state.player].action_trump(self.get_agent_observation())
+        player = self._game.state.player
+        trump_action = self.request_trump(player, self.get_agent_observation())
         if trump_action < DIAMONDS or (trump_action > MAX_TRUMP and trump_action != PUSH):
             self._logger.error('Illegal trump (' + str(trump_action) + ') selected')
             raise RuntimeError('Illegal trump (' + str(trump_action) + ') selected')
         self._game.action_trump(trump_action)
+        if self._notify_game_events:
+            self._send_game_event(GameEvent.TRUMP, player=player, trump=trump_action)
         if trump_action == PUSH:
             # ask second player
-            trump_action = self._players[self._game.state.player].action_trump(self.get_agent_observation())
+            player = self._game.state.player
+            trump_action = self.request_trump(player, self.get_agent_observation())
             if trump_action < DIAMONDS or trump_action > MAX_TRUMP:
                 self._logger.error('Illegal trump (' + str(trump_action) + ') selected')
                 raise RuntimeError('Illegal trump (' + str(trump_action) + ') selected')
             self._game.action_trump(trump_action)
+            if self._notify_game_events:
+                self._send_game_event(GameEvent.TRUMP, player=player, trump=trump_action)
 
         # play cards
         for cards in range(36):
+            player = self._game.state.player
             obs = self.get_agent_observation()
-            card_action = self._players[self._game.state.player].action_play_card(obs)
+            card_action = self.request_card(player, obs)
             if self._check_moves_validity:
                 assert card_action in np.flatnonzero(self._game.rule.get_valid_actions_from_state(obs)) \
                     if self._cheating_mode else \
                     card_action in np.flatnonzero(self._game.rule.get_valid_cards_from_obs(obs)), 'Invalid card played!'
             self._game.action_play_card(card_action)
+            if self._notify_game_events:
+                self._send_card_events(player, card_action)
 
         # update results
-        self._points_team_0[self._nr_games_played] = self._game.state.points[0]
-        self._points_team_1[self._nr_games_played] = self._game.state.points[1]
+        self._points_team_0.append(self._game.state.points[0])
+        self._points_team_1.append(self._game.state.points[1])
+        if self._notify_game_events:
+            self._send_game_event(GameEvent.GAME_END, points=self._game.state.points.copy())
         self.save_game()
 
         self._nr_games_played += 1
@@ -236,15 +397,86 @@ class Arena:
             entry = GameLogEntry(game=self._game.state, date=datetime.now(), player_ids=self._player_ids)
             self._file_generator.add_entry(entry.to_json())
 
-    def play_all_games(self):
+    def save_checkpoint(self, filename: str) -> None:
+        """
+        Save the state of the arena, so that the games can be continued with play_all_games(resume_from=filename).
+        The checkpoint contains the results so far, the dealing strategy (including the state of its random
+        generator and of the global numpy random generator) and the position in the saved games. The file is
+        replaced atomically, so that a valid checkpoint remains if the process is stopped while saving.
+
+        The state of the agents is not saved.
+
+        Args:
+            filename: name of the checkpoint file
+        """
+        file_position = None
+        if self._save_games:
+            self._file_generator.flush()
+            file_position = self._file_generator.position
+        checkpoint = dict(nr_games_played=self._nr_games_played,
+                          points_team_0=self._points_team_0,
+                          points_team_1=self._points_team_1,
+                          dealing_card_strategy=self._dealing_card_strategy,
+                          numpy_random_state=np.random.get_state(),
+                          stopping_rule=self._stopping_rule,
+                          latency_statistics=self._latency_statistics,
+                          nr_forced_moves=self._nr_forced_moves,
+                          file_position=file_position)
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, mode='wb') as file:
+            pickle.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_filename, filename)
+
+    def load_checkpoint(self, filename: str) -> None:
+        """
+        Restore the state of the arena from a checkpoint. The saved games file (if enabled) is truncated to the
+        games played at the time of the checkpoint.
+
+        Args:
+            filename: name of the checkpoint file
         """
-        Play the number of games.
+        with open(filename, mode='rb') as file:
+            checkpoint = pickle.load(file)
+        self._nr_games_played = checkpoint['nr_games_played']
+        self._points_team_0 = checkpoint['points_team_0']
+        self._points_team_1 = checkpoint['points_team_1']
+        self._dealing_card_strategy = checkpoint['dealing_card_strategy']
+        np.random.set_state(checkpoint['numpy_random_state'])
+        self._stopping_rule = checkpoint['stopping_rule']
+        self._nr_forced_moves = checkpoint['nr_forced_moves']
+        if self._latency_statistics is not None and checkpoint['latency_statistics'] is not None:
+            self._latency_statistics = checkpoint['latency_statistics']
+        if self._save_games:
+            self._file_generator.resume(checkpoint['file_position'] or (0, 0, 0))
+
+    def play_all_games(self, resume_from: str = None):
+        """
+        Play the number of games, or less if the stopping rule is met.
+
+        Args:
+            resume_from: checkpoint file to continue a previous run from
         """
         if self._save_games:
             self._file_generator.__enter__()
-        dealer = NORTH
-        for game_id in range(self._nr_games_to_play):
+        if resume_from is not None:
+            self.load_checkpoint(resume_from)
+        dealer = get_dealer(self._nr_games_played)
+        # a run that was resumed after the stopping rule was met does not play any more games
+        nr_games_to_play = self._nr_games_played if self._stopping_rule is not None and self._stopping_rule.stopped \
+            else self._nr_games_to_play
+        for game_id in range(self._nr_games_played, nr_games_to_play):
             self.play_game(dealer=dealer)
+            stopped = self._stopping_rule is not None and \
+                self._stopping_rule.add(self._points_team_0[-1] - self._points_team_1[-1])
+            if stopped:
+                lower, upper = self._stopping_rule.interval()
+                sys.stdout.write('\nStopped after {} games: {}, point difference in [{:.2f}, {:.2f}]'.format(
+                    self.nr_games_played, self._stopping_rule.decision, lower, upper))
+                break
+            if self._checkpoint_filename is not None and self.nr_games_played % self._checkpoint_every_x_games == 0:
+                self.save_checkpoint(self._checkpoint_filename)
             if self.nr_games_played % self._print_every_x_games == 0:
                 points_to_write = int(self.nr_games_played / self._nr_games_to_play * 40)
                 spaces_to_write = 40 - points_to_write
@@ -253,6 +485,10 @@ class Arena:
                                                                           self.nr_games_played,
                                                                           self._nr_games_to_play))
             dealer = next_player[dealer]
+        # the last games (after a stop or if the number of games is not a multiple) must also be in the checkpoint,
+        # otherwise resuming would play games again that are already saved
+        if self._checkpoint_filename is not None:
+            self.save_checkpoint(self._checkpoint_filename)
         if self._save_games:
             self._file_generator.__exit__(None, None, None)
         sys.stdout.write('\n')
@@ -0,0 +1,175 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import asyncio
+import sys
+from datetime import datetime
+from typing import List, Union
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_async import AgentAsync, AgentAsyncFromAgent
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.arena.arena import get_dealer
+from jass.game.const import NORTH, EAST, SOUTH, WEST, DIAMONDS, MAX_TRUMP, PUSH
+from jass.game.game_sim import GameSim
+from jass.game.rule_schieber import RuleSchieber
+from jass.logs.game_log_entry import GameLogEntry
+
+
+class AsyncArena(Arena):
+    """
+    Arena that plays a number of games concurrently on an asyncio event loop. The moves within a game are made
+    strictly in order, but while one game waits for the action of an agent, the other games continue. This is
+    useful for playing against agents that run as a service (see AgentByNetworkAsync), as the throughput is then
+    limited by the service and not by the round trip time of the requests.
+
+    The cards of the games are dealt in the order of the games, and the points and saved games are stored in the
+    order of the games, independent of the order in which the games finish.
+
+    Cheating mode is not supported, as the agents in a service only receive observations.
+    """
+
+    def __init__(self,
+                 nr_games_to_play: int,
+                 dealing_card_strategy: DealingCardStrategy = None,
+                 nr_concurrent_games: int = 16,
+                 print_every_x_games: int = 5,
+                 check_move_validity=True,
+                 save_filename=None):
+        """
+
+        Args:
+            nr_games_to_play: number of games in the arena
+            dealing_card_strategy: strategy for dealing cards
+            nr_concurrent_games: maximal number of games that are played at the same time
+            print_every_x_games: print results every x games
+            check_move_validity: True if moves from the agents should be checked for validity
+            save_filename: True if results should be save
+        """
+        super().__init__(nr_games_to_play=nr_games_to_play,
+                         dealing_card_strategy=dealing_card_strategy,
+                         print_every_x_games=print_every_x_games,
+                         check_move_validity=check_move_validity,
+                         save_filename=save_filename,
+                         cheating_mode=False)
+        self._nr_concurrent_games = nr_concurrent_games
+        self._players: List[AgentAsync or None] = [None, None, None, None]
+        self._rule = RuleSchieber()
+
+        # index of the next game to start and buffer of finished games that are not yet added to the results
+        self._next_game_nr = 0
+        self._next_game_nr_to_add = 0
+        self._finished_games = {}
+
+    def set_players(self, north: Union[AgentAsync, Agent], east: Union[AgentAsync, Agent],
+                    south: Union[AgentAsync, Agent], west: Union[AgentAsync, Agent],
+                    north_id=0, east_id=0, south_id=0, west_id=0) -> None:
+        """
+        Set the players. Synchronous agents are wrapped to be used as asynchronous agents.
+        Args:
+            north: North player
+            east: East player
+            south: South player
+            west: West player
+            north_id: id to use for north in the save file
+            east_id: id to use for east in the save file
+            south_id: id to use for south in the save file
+            west_id: id to use for west in the save file
+        """
+        players = [north, east, south, west]
+        if not all([isinstance(x, (AgentAsync, Agent)) for x in players]):
+            raise AssertionError(f"All agents must be a subclass of {AgentAsync} or {Agent}.")
+        players = [AgentAsyncFromAgent(x) if isinstance(x, Agent) else x for x in players]
+
+        self._players[NORTH] = players[NORTH]
+        self._players[EAST] = players[EAST]
+        self._players[SOUTH] = players[SOUTH]
+        self._players[WEST] = players[WEST]
+        self._player_ids[NORTH] = north_id
+        self._player_ids[EAST] = east_id
+        self._player_ids[SOUTH] = south_id
+        self._player_ids[WEST] = west_id
+
+    async def play_game_async(self, game_nr: int) -> None:
+        """
+        Play a complete game (36 cards).
+
+        Args:
+            game_nr: number of the game, which determines the dealer and where the result is stored
+        """
+        game = GameSim(rule=self._rule)
+        game.init_from_cards(dealer=get_dealer(game_nr), hands=self._dealing_card_strategy.deal_cards(
+            game_nr=game_nr,
+            total_nr_games=self._nr_games_to_play))
+
+        # determine trump
+        trump_action = await self._players[game.state.player].action_trump(game.get_observation())
+        if trump_action < DIAMONDS or (trump_action > MAX_TRUMP and trump_action != PUSH):
+            self._logger.error('Illegal trump (' + str(trump_action) + ') selected')
+            raise RuntimeError('Illegal trump (' + str(trump_action) + ') selected')
+        game.action_trump(trump_action)
+        if trump_action == PUSH:
+            trump_action = await self._players[game.state.player].action_trump(game.get_observation())
+            if trump_action < DIAMONDS or trump_action > MAX_TRUMP:
+                self._logger.error('Illegal trump (' + str(trump_action) + ') selected')
+                raise RuntimeError('Illegal trump (' + str(trump_action) + ') selected')
+            game.action_trump(trump_action)
+
+        # play cards
+        for cards in range(36):
+            obs = game.get_observation()
+            card_action = await self._players[game.state.player].action_play_card(obs)
+            if self._check_moves_validity:
+                assert card_action in np.flatnonzero(self._rule.get_valid_cards_from_obs(obs)), 'Invalid card played!'
+            game.action_play_card(card_action)
+
+        # update results
+        self._add_result_in_order(game_nr, game)
+
+    def _add_result_in_order(self, game_nr: int, game: GameSim):
+        # games can finish in any order, the results are added once all previous games are finished
+        self._finished_games[game_nr] = (game.state, datetime.now())
+        while self._next_game_nr_to_add in self._finished_games:
+            state, date = self._finished_games.pop(self._next_game_nr_to_add)
+            self._points_team_0.append(state.points[0])
+            self._points_team_1.append(state.points[1])
+            if self._save_games:
+                entry = GameLogEntry(game=state, date=date, player_ids=self._player_ids)
+                self._file_generator.add_entry(entry.to_json())
+            self._nr_games_played += 1
+            self._next_game_nr_to_add += 1
+
+    async def _play_games(self) -> None:
+        # each task plays games until all games have been started
+        while self._next_game_nr < self._nr_games_to_play:
+            game_nr = self._next_game_nr
+            self._next_game_nr += 1
+            await self.play_game_async(game_nr)
+            if self.nr_games_played % self._print_every_x_games == 0:
+                sys.stdout.write('\r{:6}/{:6} games played'.format(self.nr_games_played, self._nr_games_to_play))
+
+    async def play_all_games_async(self):
+        """
+        Play the number of games, coroutine version of play_all_games to be used within a running event loop.
+        """
+        if self._save_games:
+            self._file_generator.__enter__()
+        try:
+            nr_tasks = min(self._nr_concurrent_games, self._nr_games_to_play)
+            await asyncio.gather(*[self._play_games() for _ in range(nr_tasks)])
+        finally:
+            for player in set(self._players):
+                await player.close()
+            if self._save_games:
+                self._file_generator.__exit__(None, None, None)
+        sys.stdout.write('\n')
+
+    def play_all_games(self):
+        """
+        Play the number of games.
+        """
+        asyncio.run(self.play_all_games_async())
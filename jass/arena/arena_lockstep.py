@@ -0,0 +1,157 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import sys
+from datetime import datetime
+from typing import List
+
+import numpy as np
+
+from jass.agents.agent_batch import BatchAgent
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.arena.arena import get_dealer
+from jass.arena.stopping_rule import StoppingRule
+from jass.game.const import DIAMONDS, MAX_TRUMP, PUSH
+from jass.game.game_sim import GameSim
+from jass.game.rule_schieber import RuleSchieber
+from jass.logs.game_log_entry import GameLogEntry
+
+
+class LockstepArena(Arena):
+    """
+    Arena that advances a number of games in lockstep. In each step, the pending decisions of all games are
+    collected and grouped by agent, so that agents implementing BatchAgent get all their observations in one
+    call of action_trump_batch or action_play_card_batch. Other agents are called for each observation.
+
+    The games are dealt in the order of the games, so that the results are the same as in Arena for deterministic
+    agents.
+    """
+
+    def __init__(self,
+                 nr_games_to_play: int,
+                 nr_parallel_games: int = 64,
+                 dealing_card_strategy: DealingCardStrategy = None,
+                 print_every_x_games: int = 5,
+                 check_move_validity=True,
+                 save_filename=None,
+                 cheating_mode=False,
+                 stopping_rule: StoppingRule = None):
+        """
+
+        Args:
+            nr_games_to_play: number of games in the arena
+            nr_parallel_games: number of games that are played in lockstep
+            dealing_card_strategy: strategy for dealing cards
+            print_every_x_games: print results every x games
+            check_move_validity: True if moves from the agents should be checked for validity
+            save_filename: True if results should be save
+            cheating_mode: True if agents will receive the full game state
+            stopping_rule: rule to stop before nr_games_to_play games, the rule is checked after each step of
+                nr_parallel_games games
+        """
+        super().__init__(nr_games_to_play=nr_games_to_play,
+                         dealing_card_strategy=dealing_card_strategy,
+                         print_every_x_games=print_every_x_games,
+                         check_move_validity=check_move_validity,
+                         save_filename=save_filename,
+                         cheating_mode=cheating_mode,
+                         stopping_rule=stopping_rule)
+        self._nr_parallel_games = nr_parallel_games
+        self._rule = RuleSchieber()
+        if self._cheating_mode:
+            self._get_observation_of_game = lambda game: game.state
+        else:
+            self._get_observation_of_game = lambda game: game.get_observation()
+
+    def _get_actions(self, agent, obs_list: List, trump: bool) -> List[int]:
+        if isinstance(agent, BatchAgent):
+            if trump:
+                return agent.action_trump_batch(obs_list)
+            else:
+                return agent.action_play_card_batch(obs_list)
+        if trump:
+            return [agent.action_trump(obs) for obs in obs_list]
+        else:
+            return [agent.action_play_card(obs) for obs in obs_list]
+
+    def _check_trump_action(self, game: GameSim, trump_action: int):
+        push_allowed = game.state.forehand == -1
+        if trump_action < DIAMONDS or (trump_action > MAX_TRUMP and not (push_allowed and trump_action == PUSH)):
+            self._logger.error('Illegal trump (' + str(trump_action) + ') selected')
+            raise RuntimeError('Illegal trump (' + str(trump_action) + ') selected')
+
+    def _check_card_action(self, obs, card_action: int):
+        if self._check_moves_validity:
+            assert card_action in np.flatnonzero(self._rule.get_valid_actions_from_state(obs)) \
+                if self._cheating_mode else \
+                card_action in np.flatnonzero(self._rule.get_valid_cards_from_obs(obs)), 'Invalid card played!'
+
+    def play_games(self, first_game_nr: int, nr_games: int) -> None:
+        """
+        Play a number of complete games in lockstep.
+
+        Args:
+            first_game_nr: number of the first game
+            nr_games: number of games to play
+        """
+        games = []
+        for game_nr in range(first_game_nr, first_game_nr + nr_games):
+            game = GameSim(rule=self._rule)
+            game.init_from_cards(dealer=get_dealer(game_nr), hands=self._dealing_card_strategy.deal_cards(
+                game_nr=game_nr,
+                total_nr_games=self._nr_games_to_play))
+            games.append(game)
+
+        active_games = games
+        while len(active_games) > 0:
+            # collect the decisions for each agent and phase, the same agent can play at several positions
+            requests = {}
+            for game in active_games:
+                agent = self._players[game.state.player]
+                trump = game.state.trump == -1
+                requests.setdefault((id(agent), trump), (agent, []))[1].append(game)
+
+            for (_, trump), (agent, agent_games) in requests.items():
+                obs_list = [self._get_observation_of_game(game) for game in agent_games]
+                actions = self._get_actions(agent, obs_list, trump)
+                for game, obs, action in zip(agent_games, obs_list, actions):
+                    if trump:
+                        self._check_trump_action(game, action)
+                        game.action_trump(action)
+                    else:
+                        self._check_card_action(obs, action)
+                        game.action_play_card(action)
+
+            active_games = [game for game in active_games if not game.is_done()]
+
+        # update results
+        for game in games:
+            self._points_team_0.append(game.state.points[0])
+            self._points_team_1.append(game.state.points[1])
+            if self._stopping_rule is not None:
+                self._stopping_rule.add(game.state.points[0] - game.state.points[1])
+            if self._save_games:
+                entry = GameLogEntry(game=game.state, date=datetime.now(), player_ids=self._player_ids)
+                self._file_generator.add_entry(entry.to_json())
+        self._nr_games_played += nr_games
+
+    def play_all_games(self):
+        """
+        Play the number of games, or less if the stopping rule is met.
+        """
+        if self._save_games:
+            self._file_generator.__enter__()
+        for first_game_nr in range(0, self._nr_games_to_play, self._nr_parallel_games):
+            nr_games = min(self._nr_parallel_games, self._nr_games_to_play - first_game_nr)
+            self.play_games(first_game_nr, nr_games)
+            sys.stdout.write('\r{:6}/{:6} games played'.format(self.nr_games_played, self._nr_games_to_play))
+            if self._stopping_rule is not None and self._stopping_rule.stopped:
+                lower, upper = self._stopping_rule.interval()
+                sys.stdout.write('\nStopped after {} games: {}, point difference in [{:.2f}, {:.2f}]'.format(
+                    self.nr_games_played, self._stopping_rule.decision, lower, upper))
+                break
+        if self._save_games:
+            self._file_generator.__exit__(None, None, None)
+        sys.stdout.write('\n')
@@ -0,0 +1,124 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import itertools
+from typing import Dict, Tuple
+
+import numpy as np
+
+from jass.arena.arena import get_dealer
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.game.consistent_worlds import ConstrainedCardAssignment
+
+
+class DealingCardConstrainedStrategy(DealingCardStrategy):
+    """
+    Deal the cards uniformly from all deals that satisfy constraints on the hands, for example to benchmark agents
+    in specific situations. The constraints are:
+    - the minimal and maximal number of cards of each color for each player
+    - cards that a player must hold
+    - cards that a player must not hold
+
+    The deals are sampled without rejection: the number of ways to distribute the cards of a color with given
+    numbers of cards per player is counted with ConstrainedCardAssignment, and the number of cards of each color
+    per player is drawn color by color with probabilities proportional to the number of deals.
+
+    By default the constraints are given for the deals with NORTH as dealer (so the forehand player is
+    next_player[NORTH]), and the hands are rotated with the dealer of the game as in the arena, so that the
+    constraints always apply to the same player relative to the dealer.
+    """
+    def __init__(self,
+                 min_cards: np.ndarray = None,
+                 max_cards: np.ndarray = None,
+                 required_cards: np.ndarray = None,
+                 forbidden_cards: np.ndarray = None,
+                 relative_to_dealer: bool = True,
+                 rng: np.random.Generator = None):
+        """
+        Args:
+            min_cards: minimal number of cards of each color for each player, shape [4, 4] (player, color)
+            max_cards: maximal number of cards of each color for each player, shape [4, 4] (player, color)
+            required_cards: one-hot encoded cards that each player must hold, shape [4, 36]
+            forbidden_cards: one-hot encoded cards that each player must not hold, shape [4, 36]
+            relative_to_dealer: True if the constraints are given for NORTH as dealer and the hands should be
+                rotated with the dealer of the game
+            rng: random generator to use, the global numpy random state is used if None
+        """
+        self._min_cards = np.zeros([4, 4], dtype=np.int32) if min_cards is None else np.asarray(min_cards)
+        self._max_cards = np.full([4, 4], 9, dtype=np.int32) if max_cards is None else np.asarray(max_cards)
+        self._relative_to_dealer = relative_to_dealer
+        self._rng = rng if rng is not None else np.random
+
+        allowed = np.ones([36, 4], dtype=bool)
+        if forbidden_cards is not None:
+            allowed &= np.asarray(forbidden_cards).T == 0
+        if required_cards is not None:
+            required_cards = np.asarray(required_cards)
+            if (required_cards.sum(axis=0) > 1).any():
+                raise ValueError('A card can only be required for one player')
+            for player, card in zip(*np.nonzero(required_cards)):
+                if not allowed[card, player]:
+                    raise ValueError('Card {} is required and forbidden for player {}'.format(card, player))
+                allowed[card, :] = False
+                allowed[card, player] = True
+
+        # the possible numbers of cards of each color for the players, with the assignment of the cards
+        self._color_assignments = [self._get_color_assignments(color, allowed) for color in range(4)]
+        self._memo = {}
+        if self.count() == 0:
+            raise ValueError('No deal satisfies the constraints')
+
+    def _get_color_assignments(self, color: int,
+                               allowed: np.ndarray) -> Dict[Tuple[int, ...], ConstrainedCardAssignment]:
+        cards = np.arange(color * 9, color * 9 + 9)
+        result = {}
+        ranges = [range(self._min_cards[player, color], self._max_cards[player, color] + 1) for player in range(4)]
+        for counts in itertools.product(*ranges):
+            if sum(counts) != 9:
+                continue
+            assignment = ConstrainedCardAssignment(cards, allowed[cards], counts)
+            if assignment.count() > 0:
+                result[counts] = assignment
+        return result
+
+    def _count(self, color: int, remaining: Tuple[int, ...]) -> int:
+        # number of deals of the colors from color on, if the players can still receive the remaining cards
+        if color == 4:
+            return 1 if sum(remaining) == 0 else 0
+        key = (color, remaining)
+        if key not in self._memo:
+            total = 0
+            for counts, assignment in self._color_assignments[color].items():
+                rest = tuple(r - c for r, c in zip(remaining, counts))
+                if min(rest) >= 0:
+                    total += assignment.count() * self._count(color + 1, rest)
+            self._memo[key] = total
+        return self._memo[key]
+
+    def count(self) -> int:
+        """
+        Returns:
+            the number of deals that satisfy the constraints
+        """
+        return self._count(0, (9, 9, 9, 9))
+
+    def deal_cards(self, game_nr: int = 0, total_nr_games: int = 0) -> np.ndarray:
+        hands = np.zeros([4, 36], dtype=np.int32)
+        remaining = (9, 9, 9, 9)
+        for color in range(4):
+            options = []
+            weights = []
+            for counts, assignment in self._color_assignments[color].items():
+                rest = tuple(r - c for r, c in zip(remaining, counts))
+                if min(rest) >= 0:
+                    weight = assignment.count() * self._count(color + 1, rest)
+                    if weight > 0:
+                        options.append((counts, assignment, rest))
+                        weights.append(float(weight))
+            weights = np.array(weights)
+            _, assignment, remaining = options[self._rng.choice(len(options), p=weights / weights.sum())]
+            hands += assignment.sample(1, self._rng)[0]
+        if self._relative_to_dealer:
+            hands = np.roll(hands, get_dealer(game_nr), axis=0)
+        return hands
@@ -0,0 +1,41 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import numpy as np
+
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+
+
+class DealingCardDuplicateStrategy(DealingCardStrategy):
+    """
+    Deal the cards for duplicate games: each deal is played twice in consecutive games, in the second game the
+    hands are moved by one seat, so that each team plays the cards of the other team in the first game.
+
+    As the dealer also moves by one seat after each game in the arena, the hand that declares trump and the
+    order of play are the same in both games. The point difference of the two games therefore mostly
+    depends on the agents and not on the cards (see StoppingRule with paired=True).
+
+    The new deals for the even games are obtained from another strategy, which is called with the number of the
+    even game. The number of games played with one instance should be even, and the games must be dealt in order
+    (in ParallelArena, games_per_block and the number of games in the last block must be even).
+    """
+    def __init__(self, strategy: DealingCardStrategy = None):
+        """
+        Args:
+            strategy: strategy for the deals of the even games, random if None
+        """
+        self._strategy = strategy if strategy is not None else DealingCardRandomStrategy()
+        self._hands = None
+        self._game_nr = -1
+
+    def deal_cards(self, game_nr: int = 0, total_nr_games: int = 0) -> np.ndarray:
+        if game_nr % 2 == 0:
+            self._hands = self._strategy.deal_cards(game_nr, total_nr_games)
+            self._game_nr = game_nr
+            return self._hands
+        if self._game_nr != game_nr - 1:
+            raise ValueError('Game {} can only be dealt after game {}'.format(game_nr, game_nr - 1))
+        # the hand of player p + 1 (next_player[p] is p - 1) is given to player p
+        return np.roll(self._hands, -1, axis=0)
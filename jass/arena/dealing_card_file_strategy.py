@@ -0,0 +1,127 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import json
+from typing import Iterable
+
+import numpy as np
+
+from jass.arena.arena import get_dealer
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.game.game_state_util import calculate_starting_hands_from_game
+from jass.logs.game_log_entry import GameLogEntry
+
+_card_index = np.arange(36)
+
+
+def get_owners_from_hands(hands: np.ndarray, dealer: int = 0) -> np.ndarray:
+    """
+    Convert the hands to the owner of each card, relative to the dealer.
+
+    Args:
+        hands: one-hot encoded hands of the 4 players, shape [4, 36]
+        dealer: the dealer of the game
+    Returns:
+        array of length 36 with the owner of each card, as if the cards had been dealt by north
+    """
+    return ((np.argmax(hands, axis=0) - dealer) % 4).astype(np.int8)
+
+
+def get_hands_from_owners(owners: np.ndarray, dealer: int = 0) -> np.ndarray:
+    """
+    Convert the owner of each card to the hands, so that the dealer takes the place of north.
+
+    Args:
+        owners: the owner of each card, as if the cards had been dealt by north
+        dealer: the dealer of the game
+    Returns:
+        one-hot encoded hands of the 4 players, shape [4, 36]
+    """
+    hands = np.zeros([4, 36], dtype=np.int32)
+    hands[(owners.astype(np.int64) + dealer) % 4, _card_index] = 1
+    return hands
+
+
+def generate_deal_file(filename: str, nr_deals: int, seed: int = None) -> None:
+    """
+    Generate a file with random deals.
+
+    Args:
+        filename: name of the .npy file
+        nr_deals: number of deals
+        seed: seed for the random generator
+    """
+    rng = np.random.default_rng(seed)
+    owners = np.tile(np.repeat(np.arange(4, dtype=np.int8), 9), (nr_deals, 1))
+    owners = rng.permuted(owners, axis=1)
+    np.save(filename, owners)
+
+
+def extract_deal_file_from_game_logs(filenames: Iterable[str], filename: str) -> int:
+    """
+    Extract the deals of the games in log files (as written by the arena or converted from the swisslos logs)
+    into a deal file. The hands are stored relative to the dealer, so that the player that declares trump gets the
+    same cards when the deal is played in the arena.
+
+    Args:
+        filenames: log files with one GameLogEntry per line
+        filename: name of the .npy file
+    Returns:
+        the number of deals written
+    """
+    deals = []
+    for log_filename in filenames:
+        with open(log_filename, mode='r') as file:
+            for line in file:
+                game = GameLogEntry.from_json(json.loads(line)).game
+                hands = calculate_starting_hands_from_game(game)
+                deals.append(get_owners_from_hands(hands, game.dealer))
+    owners = np.array(deals, dtype=np.int8).reshape(-1, 36)
+    np.save(filename, owners)
+    return owners.shape[0]
+
+
+class DealingCardFileStrategy(DealingCardStrategy):
+    """
+    Deal the cards from a file of pre-generated deals. The file is a numpy array of shape [n, 36] (int8), that
+    contains the owner of each card relative to the dealer, so each deal needs 36 bytes.
+
+    The file is memory mapped by default, so that it can be shared by many processes (for example in
+    ParallelArena) without reading it into memory. Game game_nr gets the deal at index offset + game_nr.
+    """
+    def __init__(self, filename: str, offset: int = 0, cycle: bool = False, mmap: bool = True):
+        """
+        Args:
+            filename: name of the .npy file, generated by generate_deal_file or extract_deal_file_from_game_logs
+            offset: index of the deal for the first game
+            cycle: True if the deals should be repeated, when there are more games than deals
+            mmap: True if the file should be memory mapped read only instead of read into memory
+        """
+        self._filename = filename
+        self._mmap = mmap
+        self._owners = np.load(filename, mmap_mode='r' if mmap else None)
+        self._offset = offset
+        self._cycle = cycle
+
+    def __getstate__(self):
+        # the deals are loaded again from the file when unpickled (for example from an arena checkpoint)
+        state = self.__dict__.copy()
+        del state['_owners']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._owners = np.load(self._filename, mmap_mode='r' if self._mmap else None)
+
+    @property
+    def nr_deals(self) -> int:
+        return self._owners.shape[0]
+
+    def deal_cards(self, game_nr: int = 0, total_nr_games: int = 0) -> np.ndarray:
+        index = self._offset + game_nr
+        if self._cycle:
+            index %= self.nr_deals
+        elif index >= self.nr_deals:
+            raise ValueError('No deal for game {} in file with {} deals'.format(game_nr, self.nr_deals))
+        return get_hands_from_owners(self._owners[index], get_dealer(game_nr))
@@ -12,5 +12,12 @@ class DealingCardRandomStrategy(DealingCardStrategy):
     """
     Deal cards randomly. This is the default implementation.
     """
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Args:
+            rng: random generator to use, the global numpy random state is used if None
+        """
+        self._rng = rng
+
     def deal_cards(self, game_nr: int = 0, total_nr_games: int = 0) -> np.ndarray:
-        return deal_random_hand()
+        return deal_random_hand(self._rng)
@@ -0,0 +1,419 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import base64
+import json
+import logging
+import socket
+import struct
+import sys
+import threading
+import time
+import zlib
+from typing import List
+
+import numpy as np
+
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.parallel_arena import AgentFactory, BlockArena, DealingCardStrategyFactory
+from jass.arena.stopping_rule import StoppingRule
+from jass.logs.log_entry_file_generator import LogEntryFileGenerator
+
+# Protocol: each message is a json object encoded in utf-8, preceded by its length as 4 byte unsigned int
+# (big endian). After connecting, the coordinator sends a 'setup' message, then the worker sends 'request' to get
+# a 'block' of games, and returns the points and the compressed game logs of the block in a 'result' message,
+# which also requests the next block. If there are no more blocks, the coordinator answers with 'done'.
+_header = struct.Struct('>I')
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    """
+    Send a message with a length prefix.
+    """
+    data = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    sock.sendall(_header.pack(len(data)) + data)
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes or None:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data.extend(chunk)
+    return bytes(data)
+
+
+def receive_message(sock: socket.socket) -> dict or None:
+    """
+    Receive a message with a length prefix.
+
+    Returns:
+        the message, or None if the connection was closed
+    """
+    header = _receive_exactly(sock, _header.size)
+    if header is None:
+        return None
+    data = _receive_exactly(sock, _header.unpack(header)[0])
+    if data is None:
+        return None
+    return json.loads(data.decode('utf-8'))
+
+
+def compress_game_logs(game_logs: List[dict]) -> str:
+    """
+    Compress the game logs of a block for the transfer in a json message.
+    """
+    lines = '\n'.join(json.dumps(entry, separators=(',', ':')) for entry in game_logs)
+    return base64.b64encode(zlib.compress(lines.encode('utf-8'))).decode('ascii')
+
+
+def decompress_game_logs(data: str) -> List[str]:
+    """
+    Decompress the game logs of a block.
+
+    Returns:
+        the json formatted lines of the game logs
+    """
+    lines = zlib.decompress(base64.b64decode(data)).decode('utf-8')
+    return lines.split('\n') if lines else []
+
+
+class DistributedArenaCoordinator:
+    """
+    Coordinator of an arena that plays the games on remote workers (DistributedArenaWorker) over tcp. The games
+    are split into blocks of fixed size, each with its own seed spawned from the seed of the coordinator as in
+    ParallelArena, so the cards dealt do not depend on the number of workers or on which worker plays a block.
+
+    The workers request a new block whenever they have finished one, so faster workers play more blocks. If a
+    worker disconnects (or does not return a block within block_timeout), its blocks are given to the other
+    workers. The results and the saved games are merged in the order of the blocks.
+
+    The agents are created by the workers, the coordinator only hands out the blocks and collects the results.
+    """
+
+    def __init__(self,
+                 nr_games_to_play: int,
+                 games_per_block: int = 100,
+                 seed: int = None,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 block_timeout: float = None,
+                 print_every_x_blocks: int = 1,
+                 save_filename: str = None,
+                 stopping_rule: StoppingRule = None):
+        """
+        Args:
+            nr_games_to_play: number of games in the arena
+            games_per_block: number of games played by a worker in one task
+            seed: seed to generate the random generators for dealing
+            host: host name or address to listen on, only the local machine by default. Workers on other
+                machines need the address of a network interface (or '' for all interfaces), the connections are
+                not authenticated, so the coordinator should only be exposed on trusted networks
+            port: port to listen on, a free port is chosen if 0 (see address)
+            block_timeout: maximal time in seconds for a worker to play a block, None for no limit
+            print_every_x_blocks: print results every x blocks
+            save_filename: basename of the files for the saved games, None if the games should not be saved
+            stopping_rule: rule to stop before nr_games_to_play games, the rule is checked after each block
+        """
+        self._logger = logging.getLogger(__name__)
+        self._nr_games_to_play = nr_games_to_play
+        self._games_per_block = games_per_block
+        self._seed = seed
+        self._block_timeout = block_timeout
+        self._print_every_x_blocks = print_every_x_blocks
+        self._save_filename = save_filename
+        self._stopping_rule = stopping_rule
+
+        self._nr_games_played = 0
+        self._points_team_0 = []
+        self._points_team_1 = []
+        self._nr_reassigned_blocks = 0
+
+        self._condition = threading.Condition()
+        self._blocks = self._get_blocks()
+        self._pending: List[int] = list(range(len(self._blocks)))
+        self._results = {}
+        self._next_block_to_add = 0
+        self._finished = len(self._blocks) == 0
+        self._connections = set()
+        self._file_generator = None
+
+        self._server = socket.create_server((host, port))
+
+    @property
+    def address(self) -> (str, int):
+        """
+        Address the coordinator listens on.
+        """
+        return self._server.getsockname()[0:2]
+
+    @property
+    def nr_games_to_play(self):
+        return self._nr_games_to_play
+
+    @property
+    def nr_games_played(self):
+        return self._nr_games_played
+
+    @property
+    def nr_reassigned_blocks(self) -> int:
+        """
+        Number of blocks that were given to another worker, because their worker disconnected.
+        """
+        return self._nr_reassigned_blocks
+
+    @property
+    def points_team_0(self) -> np.ndarray:
+        return np.array(self._points_team_0, dtype=np.float64)
+
+    @property
+    def points_team_1(self) -> np.ndarray:
+        return np.array(self._points_team_1, dtype=np.float64)
+
+    @property
+    def stopping_rule(self) -> StoppingRule or None:
+        return self._stopping_rule
+
+    def _get_blocks(self) -> List[dict]:
+        nr_blocks = (self._nr_games_to_play + self._games_per_block - 1) // self._games_per_block
+        seeds = np.random.SeedSequence(self._seed).spawn(nr_blocks)
+        blocks = []
+        for block_nr in range(nr_blocks):
+            first_game_nr = block_nr * self._games_per_block
+            blocks.append(dict(type='block',
+                               block_nr=block_nr,
+                               first_game_nr=first_game_nr,
+                               nr_games=min(self._games_per_block, self._nr_games_to_play - first_game_nr),
+                               total_nr_games=self._nr_games_to_play,
+                               entropy=seeds[block_nr].entropy,
+                               spawn_key=list(seeds[block_nr].spawn_key)))
+        return blocks
+
+    def play_all_games(self):
+        """
+        Accept workers and wait until the games have been played, or less if the stopping rule is met.
+        """
+        if self._save_filename is not None:
+            self._file_generator = LogEntryFileGenerator(basename=self._save_filename, max_entries=100000,
+                                                         shuffle=False)
+            self._file_generator.__enter__()
+        self._logger.info('Waiting for workers on {}'.format(self.address))
+        accept_thread = threading.Thread(target=self._accept, daemon=True)
+        accept_thread.start()
+        try:
+            with self._condition:
+                while not self._finished:
+                    self._condition.wait()
+        finally:
+            if self._file_generator is not None:
+                with self._condition:
+                    self._file_generator.__exit__(None, None, None)
+                    self._file_generator = None
+        sys.stdout.write('\n')
+
+    def close(self) -> None:
+        """
+        Stop listening and close the connections to the workers.
+        """
+        self._server.close()
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+            for connection in self._connections:
+                connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection, address = self._server.accept()
+            except OSError:
+                # the server socket was closed
+                return
+            self._logger.info('Worker connected from {}'.format(address))
+            threading.Thread(target=self._handle_worker, args=(connection, address), daemon=True).start()
+
+    def _next_block(self) -> dict or None:
+        # wait for a block, blocks of other workers might be given back if they disconnect
+        with self._condition:
+            while not self._pending and not self._finished:
+                self._condition.wait()
+            if self._finished:
+                return None
+            return self._blocks[self._pending.pop(0)]
+
+    def _handle_worker(self, connection: socket.socket, address) -> None:
+        assigned = set()
+        with self._condition:
+            self._connections.add(connection)
+        try:
+            connection.settimeout(self._block_timeout)
+            send_message(connection, dict(type='setup', save_games=self._save_filename is not None))
+            while True:
+                message = receive_message(connection)
+                if message is None:
+                    break
+                if message['type'] == 'result':
+                    assigned.discard(message['block_nr'])
+                    self._add_result(message)
+                block = self._next_block()
+                if block is None:
+                    send_message(connection, dict(type='done'))
+                    break
+                assigned.add(block['block_nr'])
+                send_message(connection, block)
+        except (OSError, ValueError, KeyError) as e:
+            self._logger.warning('Connection to worker {} failed: {}'.format(address, e))
+        finally:
+            connection.close()
+            with self._condition:
+                self._connections.discard(connection)
+                # give the unfinished blocks of the worker to the other workers (in order)
+                lost = sorted(block_nr for block_nr in assigned
+                              if block_nr >= self._next_block_to_add and block_nr not in self._results)
+                if lost and not self._finished:
+                    self._logger.warning('Worker {} disconnected, reassigning blocks {}'.format(address, lost))
+                    self._nr_reassigned_blocks += len(lost)
+                    self._pending = lost + self._pending
+                    self._condition.notify_all()
+
+    def _add_result(self, message: dict) -> None:
+        with self._condition:
+            block_nr = message['block_nr']
+            if self._finished or block_nr < self._next_block_to_add or block_nr in self._results:
+                # the block was played twice, as the first worker was assumed to be lost
+                return
+            self._results[block_nr] = message
+            while self._next_block_to_add in self._results and not self._finished:
+                self._add_block(self._results.pop(self._next_block_to_add))
+                self._next_block_to_add += 1
+            if self._next_block_to_add == len(self._blocks):
+                self._finished = True
+            self._condition.notify_all()
+
+    def _add_block(self, message: dict) -> None:
+        points_team_0 = np.array(message['points_team_0'], dtype=np.float64)
+        points_team_1 = np.array(message['points_team_1'], dtype=np.float64)
+        self._points_team_0.extend(points_team_0)
+        self._points_team_1.extend(points_team_1)
+        self._nr_games_played += len(points_team_0)
+        if self._file_generator is not None:
+            for line in decompress_game_logs(message['game_logs']):
+                self._file_generator.add_entry_line(line)
+        if (message['block_nr'] + 1) % self._print_every_x_blocks == 0:
+            sys.stdout.write('\r{:6}/{:6} games played'.format(self._nr_games_played, self._nr_games_to_play))
+        if self._stopping_rule is not None:
+            for difference in points_team_0 - points_team_1:
+                self._stopping_rule.add(difference)
+            if self._stopping_rule.stopped:
+                lower, upper = self._stopping_rule.interval()
+                sys.stdout.write('\nStopped after {} games: {}, point difference in [{:.2f}, {:.2f}]'.format(
+                    self._nr_games_played, self._stopping_rule.decision, lower, upper))
+                self._finished = True
+
+
+class DistributedArenaWorker:
+    """
+    Worker of a distributed arena, that connects to a DistributedArenaCoordinator and plays the blocks of games
+    it receives, until there are no more blocks.
+
+    The agents are created from the factories when the worker runs and are used for all blocks. In order to get
+    the same results independent of the distribution of the blocks, the agents must be deterministic or use
+    seeded random generators, and all workers must use the same dealing_card_strategy_factory.
+    """
+
+    def __init__(self,
+                 host: str,
+                 port: int,
+                 dealing_card_strategy_factory: DealingCardStrategyFactory = DealingCardRandomStrategy,
+                 check_move_validity: bool = True,
+                 cheating_mode: bool = False,
+                 connect_timeout: float = 10.0):
+        """
+        Args:
+            host: host name or address of the coordinator
+            port: port of the coordinator
+            dealing_card_strategy_factory: function that creates the strategy for dealing from a random generator
+            check_move_validity: True if moves from the agents should be checked for validity
+            cheating_mode: True if agents will receive the full game state
+            connect_timeout: time in seconds to retry connecting, if the coordinator is not yet listening
+        """
+        self._logger = logging.getLogger(__name__)
+        self._host = host
+        self._port = port
+        self._dealing_card_strategy_factory = dealing_card_strategy_factory
+        self._check_move_validity = check_move_validity
+        self._cheating_mode = cheating_mode
+        self._connect_timeout = connect_timeout
+
+        self._agent_factories: List[AgentFactory or None] = [None, None, None, None]
+        self._player_ids: List[int] = [0, 0, 0, 0]
+
+    def set_players(self, north: AgentFactory, east: AgentFactory, south: AgentFactory, west: AgentFactory,
+                    north_id=0, east_id=0, south_id=0, west_id=0) -> None:
+        """
+        Set the factories for the players.
+        Args:
+            north: factory for the north player
+            east: factory for the east player
+            south: factory for the south player
+            west: factory for the west player
+            north_id: id to use for north in the save file
+            east_id: id to use for east in the save file
+            south_id: id to use for south in the save file
+            west_id: id to use for west in the save file
+        """
+        self._agent_factories = [north, east, south, west]
+        self._player_ids = [north_id, east_id, south_id, west_id]
+
+    def _connect(self) -> socket.socket:
+        end_time = time.monotonic() + self._connect_timeout
+        while True:
+            try:
+                return socket.create_connection((self._host, self._port))
+            except OSError:
+                if time.monotonic() > end_time:
+                    raise
+                time.sleep(0.1)
+
+    def run(self) -> int:
+        """
+        Play blocks of games until the coordinator has no more blocks.
+
+        Returns:
+            the number of blocks played
+        """
+        nr_blocks = 0
+        with self._connect() as sock:
+            setup = receive_message(sock)
+            if setup is None:
+                return nr_blocks
+            arena = BlockArena(check_move_validity=self._check_move_validity, save_games=setup['save_games'],
+                               cheating_mode=self._cheating_mode)
+            agents = [factory() for factory in self._agent_factories]
+            arena.set_players(*agents, *self._player_ids)
+            send_message(sock, dict(type='request'))
+            while True:
+                block = receive_message(sock)
+                if block is None or block['type'] == 'done':
+                    break
+                seed_seq = np.random.SeedSequence(block['entropy'], spawn_key=tuple(block['spawn_key']))
+                strategy = self._dealing_card_strategy_factory(np.random.default_rng(seed_seq))
+                points_team_0, points_team_1, game_logs = arena.play_block(strategy, block['first_game_nr'],
+                                                                           block['nr_games'],
+                                                                           block['total_nr_games'])
+                send_message(sock, dict(type='result',
+                                        block_nr=block['block_nr'],
+                                        points_team_0=points_team_0.tolist(),
+                                        points_team_1=points_team_1.tolist(),
+                                        game_logs=compress_game_logs(game_logs)))
+                nr_blocks += 1
+        self._logger.info('Played {} blocks'.format(nr_blocks))
+        return nr_blocks
@@ -0,0 +1,144 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import csv
+import json
+import math
+
+import numpy as np
+
+
+class LatencyStatistics:
+    """
+    Histogram of the decision latencies of the agents in an arena, for each seat and phase. The phase is
+    PHASE_TRUMP for the trump selection and the trick number plus one for playing a card.
+
+    The latencies are counted in logarithmic buckets (BUCKETS_PER_OCTAVE buckets for each doubling of the time,
+    starting at MIN_LATENCY), so that adding a value is cheap and the memory does not depend on the number of
+    decisions. Percentiles are reported as the upper bound of the bucket, i.e. they are accurate to about 19%.
+
+    The number of decisions, in which an agent used a fallback (for example the standin player of
+    AgentByNetwork) is counted as well.
+    """
+    PHASE_TRUMP = 0
+    NR_PHASES = 10
+
+    MIN_LATENCY = 1e-6
+    BUCKETS_PER_OCTAVE = 4
+    NR_BUCKETS = 112
+
+    def __init__(self):
+        self._counts = np.zeros([4, self.NR_PHASES, self.NR_BUCKETS], dtype=np.int64)
+        self._sum = np.zeros([4, self.NR_PHASES], dtype=np.float64)
+        self._max = np.zeros([4, self.NR_PHASES], dtype=np.float64)
+        self._fallbacks = np.zeros([4, self.NR_PHASES], dtype=np.int64)
+
+        # upper bounds of the buckets in seconds
+        self._bucket_bounds = self.MIN_LATENCY * np.power(2.0, np.arange(self.NR_BUCKETS) / self.BUCKETS_PER_OCTAVE)
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def fallbacks(self) -> np.ndarray:
+        return self._fallbacks
+
+    def add(self, seat: int, phase: int, seconds: float, fallbacks: int = 0) -> None:
+        """
+        Add the latency of a decision.
+
+        Args:
+            seat: the player that made the decision
+            phase: PHASE_TRUMP or the trick number plus one
+            seconds: the time for the decision
+            fallbacks: number of fallbacks used by the agent for the decision
+        """
+        if seconds <= self.MIN_LATENCY:
+            bucket = 0
+        else:
+            bucket = min(math.ceil(self.BUCKETS_PER_OCTAVE * math.log2(seconds / self.MIN_LATENCY)),
+                         self.NR_BUCKETS - 1)
+        self._counts[seat, phase, bucket] += 1
+        self._sum[seat, phase] += seconds
+        if seconds > self._max[seat, phase]:
+            self._max[seat, phase] = seconds
+        self._fallbacks[seat, phase] += fallbacks
+
+    def _percentile(self, counts: np.ndarray, q: float) -> float:
+        total = counts.sum()
+        if total == 0:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(counts), q * total))
+        return float(self._bucket_bounds[bucket])
+
+    def _summary_entry(self, counts: np.ndarray, total: float, maximum: float, fallbacks: int) -> dict:
+        nr_decisions = int(counts.sum())
+        return {
+            'count': nr_decisions,
+            'mean': total / nr_decisions if nr_decisions > 0 else 0.0,
+            'p50': self._percentile(counts, 0.5),
+            'p95': self._percentile(counts, 0.95),
+            'p99': self._percentile(counts, 0.99),
+            'max': float(maximum),
+            'fallbacks': int(fallbacks)
+        }
+
+    def summary(self, by_phase: bool = True) -> list:
+        """
+        Summarize the latencies.
+
+        Args:
+            by_phase: True if the latencies should be summarized for each seat and phase, False for each seat only
+        Returns:
+            list with a dict for each seat (and phase) with the number of decisions, mean, p50, p95, p99, max
+            and the number of fallbacks. Phases without decisions are omitted.
+        """
+        result = []
+        for seat in range(4):
+            if by_phase:
+                for phase in range(self.NR_PHASES):
+                    counts = self._counts[seat, phase]
+                    if counts.sum() == 0:
+                        continue
+                    entry = dict(seat=seat, phase=phase)
+                    entry.update(self._summary_entry(counts, self._sum[seat, phase], self._max[seat, phase],
+                                                     self._fallbacks[seat, phase]))
+                    result.append(entry)
+            else:
+                entry = dict(seat=seat)
+                entry.update(self._summary_entry(self._counts[seat].sum(axis=0), self._sum[seat].sum(),
+                                                 self._max[seat].max(), self._fallbacks[seat].sum()))
+                result.append(entry)
+        return result
+
+    def to_json(self) -> dict:
+        """
+        Generate a dict representation that can be converted to json. The histogram is included so that the
+        statistics can be merged or plotted later.
+        """
+        return {
+            'minLatency': self.MIN_LATENCY,
+            'bucketsPerOctave': self.BUCKETS_PER_OCTAVE,
+            'summary': self.summary(),
+            'counts': self._counts.tolist(),
+            'fallbacks': self._fallbacks.tolist()
+        }
+
+    def save_json(self, filename: str) -> None:
+        """
+        Save the statistics as json file.
+        """
+        with open(filename, mode='w') as file:
+            json.dump(self.to_json(), file)
+
+    def save_csv(self, filename: str) -> None:
+        """
+        Save the summary by seat and phase as csv file.
+        """
+        fields = ['seat', 'phase', 'count', 'mean', 'p50', 'p95', 'p99', 'max', 'fallbacks']
+        with open(filename, mode='w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.summary())
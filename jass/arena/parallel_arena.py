@@ -0,0 +1,255 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import logging
+import multiprocessing
+import sys
+from datetime import datetime
+from typing import Callable, List, Union
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_cheating import AgentCheating
+from jass.arena.arena import Arena, get_dealer
+from jass.arena.dealing_card_duplicate_strategy import DealingCardDuplicateStrategy
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.dealing_card_strategy import DealingCardStrategy
+from jass.arena.stopping_rule import StoppingRule
+from jass.logs.game_log_entry import GameLogEntry
+from jass.logs.log_entry_file_generator import LogEntryFileGenerator
+
+AgentFactory = Callable[[], Union[Agent, AgentCheating]]
+DealingCardStrategyFactory = Callable[[np.random.Generator], DealingCardStrategy]
+
+
+class _OffsetDealingCardStrategy(DealingCardStrategy):
+    """
+    Forward the dealing to another strategy with the game number of the whole run instead of the block.
+    """
+    def __init__(self, strategy: DealingCardStrategy, first_game_nr: int, total_nr_games: int):
+        self._strategy = strategy
+        self._first_game_nr = first_game_nr
+        self._total_nr_games = total_nr_games
+
+    def deal_cards(self, game_nr: int = 0, total_nr_games: int = 0) -> np.ndarray:
+        return self._strategy.deal_cards(self._first_game_nr + game_nr, self._total_nr_games)
+
+
+class BlockArena(Arena):
+    """
+    Arena that plays a block of consecutive games of a larger run and collects the game logs in memory instead
+    of writing them to a file. It is used by the workers of ParallelArena and of other arenas that split the
+    games into blocks.
+    """
+    def __init__(self, check_move_validity: bool = True, save_games: bool = False, cheating_mode: bool = False):
+        super().__init__(nr_games_to_play=0, check_move_validity=check_move_validity, cheating_mode=cheating_mode)
+        self._save_games = save_games
+        self._game_logs = []
+
+    def save_game(self):
+        if self._save_games:
+            entry = GameLogEntry(game=self._game.state, date=datetime.now(), player_ids=self._player_ids)
+            self._game_logs.append(entry.to_json())
+
+    def play_block(self, dealing_card_strategy: DealingCardStrategy, first_game_nr: int, nr_games: int,
+                   total_nr_games: int) -> (np.ndarray, np.ndarray, List[dict]):
+        """
+        Play a block of games.
+
+        Args:
+            dealing_card_strategy: strategy for dealing the cards of the block
+            first_game_nr: number of the first game of the block in the whole run
+            nr_games: number of games in the block
+            total_nr_games: total number of games of the run
+        Returns:
+            points of team 0 and team 1 for each game and the game logs (if saving is enabled)
+        """
+        self._dealing_card_strategy = _OffsetDealingCardStrategy(dealing_card_strategy, first_game_nr,
+                                                                 total_nr_games)
+        self._nr_games_to_play = nr_games
+        self._nr_games_played = 0
+        self._points_team_0 = []
+        self._points_team_1 = []
+        self._game_logs = []
+        for game_nr in range(first_game_nr, first_game_nr + nr_games):
+            self.play_game(dealer=get_dealer(game_nr))
+        return self.points_team_0, self.points_team_1, self._game_logs
+
+
+# arena of the worker process, created by the initializer of the pool
+_worker_arena: BlockArena or None = None
+
+
+def _init_worker(agent_factories: List[AgentFactory], player_ids: List[int], check_move_validity: bool,
+                 save_games: bool, cheating_mode: bool):
+    global _worker_arena
+    _worker_arena = BlockArena(check_move_validity=check_move_validity, save_games=save_games,
+                               cheating_mode=cheating_mode)
+    agents = [factory() for factory in agent_factories]
+    _worker_arena.set_players(*agents, *player_ids)
+
+
+def _play_block(args):
+    dealing_card_strategy_factory, seed_seq, first_game_nr, nr_games, total_nr_games = args
+    strategy = dealing_card_strategy_factory(np.random.default_rng(seed_seq))
+    return _worker_arena.play_block(strategy, first_game_nr, nr_games, total_nr_games)
+
+
+class ParallelArena:
+    """
+    Arena that plays the games in a pool of processes. The games are split into blocks of fixed size, each block
+    gets its own dealing strategy with a random generator spawned from the seed, so the cards dealt do not depend
+    on the number of workers. The results and the saved games are merged in the order of the games.
+
+    Each worker creates its own agents from the factories. The factories must be picklable (e.g. classes or
+    functions defined at module level) if the processes are not started by fork. In order to get the same points
+    independent of the number of workers, the agents must be deterministic or use seeded random generators.
+    """
+
+    def __init__(self,
+                 nr_games_to_play: int,
+                 nr_workers: int = None,
+                 games_per_block: int = 100,
+                 seed: int = None,
+                 dealing_card_strategy_factory: DealingCardStrategyFactory = DealingCardRandomStrategy,
+                 print_every_x_blocks: int = 1,
+                 check_move_validity: bool = True,
+                 save_filename: str = None,
+                 cheating_mode: bool = False,
+                 stopping_rule: StoppingRule = None):
+        """
+        Args:
+            nr_games_to_play: number of games in the arena
+            nr_workers: number of processes, the number of cpus if None
+            games_per_block: number of games played by a worker in one task, must be even for duplicate deals (as
+                the number of games in the last block)
+            seed: seed to generate the random generators for dealing
+            dealing_card_strategy_factory: function that creates the strategy for dealing from a random generator
+            print_every_x_blocks: print results every x blocks
+            check_move_validity: True if moves from the agents should be checked for validity
+            save_filename: basename of the files for the saved games, None if the games should not be saved
+            cheating_mode: True if agents will receive the full game state
+            stopping_rule: rule to stop before nr_games_to_play games, the rule is checked after each block
+        """
+        # both games of a duplicate deal must be played in the same block, in order
+        if isinstance(dealing_card_strategy_factory(np.random.default_rng()), DealingCardDuplicateStrategy):
+            if games_per_block % 2 != 0:
+                raise ValueError('games_per_block must be even for duplicate deals')
+            if nr_games_to_play % games_per_block % 2 != 0:
+                raise ValueError('The number of games in the last block must be even for duplicate deals')
+        self._logger = logging.getLogger(__name__)
+        self._nr_games_to_play = nr_games_to_play
+        self._nr_workers = nr_workers if nr_workers is not None else multiprocessing.cpu_count()
+        self._games_per_block = games_per_block
+        self._seed = seed
+        self._dealing_card_strategy_factory = dealing_card_strategy_factory
+        self._print_every_x_blocks = print_every_x_blocks
+        self._check_move_validity = check_move_validity
+        self._save_filename = save_filename
+        self._cheating_mode = cheating_mode
+
+        self._agent_factories: List[AgentFactory or None] = [None, None, None, None]
+        self._player_ids: List[int] = [0, 0, 0, 0]
+
+        self._stopping_rule = stopping_rule
+
+        self._nr_games_played = 0
+        self._points_team_0 = []
+        self._points_team_1 = []
+
+    @property
+    def nr_games_to_play(self):
+        return self._nr_games_to_play
+
+    @property
+    def nr_games_played(self):
+        return self._nr_games_played
+
+    @property
+    def points_team_0(self) -> np.ndarray:
+        return np.array(self._points_team_0, dtype=np.float64)
+
+    @property
+    def points_team_1(self) -> np.ndarray:
+        return np.array(self._points_team_1, dtype=np.float64)
+
+    @property
+    def stopping_rule(self) -> StoppingRule or None:
+        return self._stopping_rule
+
+    def set_players(self, north: AgentFactory, east: AgentFactory, south: AgentFactory, west: AgentFactory,
+                    north_id=0, east_id=0, south_id=0, west_id=0) -> None:
+        """
+        Set the factories for the players.
+        Args:
+            north: factory for the north player
+            east: factory for the east player
+            south: factory for the south player
+            west: factory for the west player
+            north_id: id to use for north in the save file
+            east_id: id to use for east in the save file
+            south_id: id to use for south in the save file
+            west_id: id to use for west in the save file
+        """
+        self._agent_factories = [north, east, south, west]
+        self._player_ids = [north_id, east_id, south_id, west_id]
+
+    def _get_blocks(self) -> list:
+        nr_blocks = (self._nr_games_to_play + self._games_per_block - 1) // self._games_per_block
+        seeds = np.random.SeedSequence(self._seed).spawn(nr_blocks)
+        blocks = []
+        for block_nr in range(nr_blocks):
+            first_game_nr = block_nr * self._games_per_block
+            nr_games = min(self._games_per_block, self._nr_games_to_play - first_game_nr)
+            blocks.append((self._dealing_card_strategy_factory, seeds[block_nr], first_game_nr, nr_games,
+                           self._nr_games_to_play))
+        return blocks
+
+    def play_all_games(self):
+        """
+        Play the number of games, or less if the stopping rule is met.
+        """
+        init_args = (self._agent_factories, self._player_ids, self._check_move_validity,
+                     self._save_filename is not None, self._cheating_mode)
+        file_generator = None
+        if self._save_filename is not None:
+            file_generator = LogEntryFileGenerator(basename=self._save_filename, max_entries=100000, shuffle=False)
+            file_generator.__enter__()
+
+        blocks = self._get_blocks()
+        pool = None
+        if self._nr_workers > 1:
+            pool = multiprocessing.Pool(self._nr_workers, initializer=_init_worker, initargs=init_args)
+            results = pool.imap(_play_block, blocks)
+        else:
+            _init_worker(*init_args)
+            results = map(_play_block, blocks)
+
+        try:
+            for block_nr, (points_team_0, points_team_1, game_logs) in enumerate(results):
+                self._points_team_0.extend(points_team_0)
+                self._points_team_1.extend(points_team_1)
+                self._nr_games_played += points_team_0.shape[0]
+                if file_generator is not None:
+                    for entry in game_logs:
+                        file_generator.add_entry(entry)
+                if (block_nr + 1) % self._print_every_x_blocks == 0:
+                    sys.stdout.write('\r{:6}/{:6} games played'.format(self._nr_games_played, self._nr_games_to_play))
+                if self._stopping_rule is not None:
+                    for difference in points_team_0 - points_team_1:
+                        self._stopping_rule.add(difference)
+                    if self._stopping_rule.stopped:
+                        lower, upper = self._stopping_rule.interval()
+                        sys.stdout.write('\nStopped after {} games: {}, point difference in [{:.2f}, {:.2f}]'.format(
+                            self._nr_games_played, self._stopping_rule.decision, lower, upper))
+                        break
+        finally:
+            if pool is not None:
+                # blocks that are still running are not needed if the games were stopped
+                pool.terminate()
+                pool.join()
+            if file_generator is not None:
+                file_generator.__exit__(None, None, None)
+        sys.stdout.write('\n')
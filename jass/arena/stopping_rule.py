@@ -0,0 +1,123 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import math
+
+
+class StoppingRule:
+    """
+    Rule to stop an arena before all games have been played, once the result of the comparison of the two teams
+    is clear. The rule receives the point difference (team 0 minus team 1) of each game.
+
+    With paired=True, the differences of two consecutive games are averaged before they are used. This should be
+    used with duplicate deals, where the same cards are played in two consecutive games with the seats exchanged,
+    which removes most of the variance from the cards.
+
+    The rule uses an (asymptotic) confidence sequence for the mean point difference, i.e. a confidence interval
+    that is valid simultaneously for all numbers of games, so that it can be checked after every game without
+    inflating the error rate. The width of the interval is optimized for the number of games min_games.
+    """
+    UNDECIDED = 'undecided'
+    TEAM_0_BETTER = 'team 0 better'
+    TEAM_1_BETTER = 'team 1 better'
+    EQUIVALENT = 'equivalent'
+
+    def __init__(self, alpha: float = 0.05, min_games: int = 100, futility_margin: float = None,
+                 paired: bool = False):
+        """
+        Args:
+            alpha: probability that the interval does not contain the mean at any time
+            min_games: minimal number of games (or pairs of games) before the rule can stop
+            futility_margin: stop if the interval is within [-futility_margin, futility_margin], i.e. the
+                difference is too small to be relevant, or None to only stop if a team is better
+            paired: True if the differences of two consecutive games should be averaged
+        """
+        self._alpha = alpha
+        self._min_games = min_games
+        self._futility_margin = futility_margin
+        self._paired = paired
+
+        # tuning parameter of the confidence sequence, so that it is tightest at min_games
+        log_alpha = -2.0 * math.log(alpha)
+        self._rho = math.sqrt((log_alpha + math.log(log_alpha + 1.0)) / min_games)
+
+        # running sums of the (paired) differences
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._pending = None
+
+        self._decision = StoppingRule.UNDECIDED
+
+    @property
+    def nr_games(self) -> int:
+        """
+        Number of games that have been added.
+        """
+        return 2 * self._n + (self._pending is not None) if self._paired else self._n
+
+    @property
+    def nr_samples(self) -> int:
+        """
+        Number of (paired) differences used for the interval.
+        """
+        return self._n
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def decision(self) -> str:
+        return self._decision
+
+    @property
+    def stopped(self) -> bool:
+        return self._decision != StoppingRule.UNDECIDED
+
+    def interval(self) -> (float, float):
+        """
+        Returns:
+            the current confidence interval for the mean point difference per game
+        """
+        if self._n < 2:
+            return -math.inf, math.inf
+        n = self._n
+        std = math.sqrt(self._m2 / (n - 1))
+        nr2 = n * self._rho ** 2
+        radius = std * math.sqrt(2.0 * (nr2 + 1.0) / (n * nr2) * math.log(math.sqrt(nr2 + 1.0) / self._alpha))
+        return self._mean - radius, self._mean + radius
+
+    def add(self, difference: float) -> bool:
+        """
+        Add the point difference of a game and check if the games can be stopped.
+
+        Args:
+            difference: points of team 0 minus points of team 1
+        Returns:
+            True if no more games need to be played
+        """
+        if self._paired:
+            if self._pending is None:
+                self._pending = difference
+                return self.stopped
+            difference = 0.5 * (self._pending + difference)
+            self._pending = None
+
+        # Welford's algorithm for the mean and variance
+        self._n += 1
+        delta = difference - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (difference - self._mean)
+
+        if self._n >= self._min_games and not self.stopped:
+            lower, upper = self.interval()
+            if lower > 0.0:
+                self._decision = StoppingRule.TEAM_0_BETTER
+            elif upper < 0.0:
+                self._decision = StoppingRule.TEAM_1_BETTER
+            elif self._futility_margin is not None and -self._futility_margin < lower and \
+                    upper < self._futility_margin:
+                self._decision = StoppingRule.EQUIVALENT
+        return self.stopped
@@ -0,0 +1,230 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import itertools
+import logging
+import multiprocessing
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from jass.arena.dealing_card_duplicate_strategy import DealingCardDuplicateStrategy
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.parallel_arena import AgentFactory, BlockArena
+
+# agents of the worker process, created when they are first needed and then reused for all games
+_worker_factories: Dict[str, AgentFactory] = {}
+_worker_agents: Dict[str, object] = {}
+_worker_arena: BlockArena or None = None
+
+
+def _init_worker(factories: Dict[str, AgentFactory]):
+    global _worker_factories, _worker_agents, _worker_arena
+    _worker_factories = factories
+    _worker_agents = {}
+    _worker_arena = BlockArena()
+
+
+def _get_agent(name: str):
+    if name not in _worker_agents:
+        _worker_agents[name] = _worker_factories[name]()
+    return _worker_agents[name]
+
+
+def _play_block(args) -> Tuple[int, int, np.ndarray]:
+    pairing_nr, name_0, name_1, seed_seq, first_game_nr, nr_games, total_nr_games = args
+    agent_0 = _get_agent(name_0)
+    agent_1 = _get_agent(name_1)
+    _worker_arena.set_players(agent_0, agent_1, agent_0, agent_1)
+    strategy = DealingCardDuplicateStrategy(DealingCardRandomStrategy(np.random.default_rng(seed_seq)))
+    points_team_0, points_team_1, _ = _worker_arena.play_block(strategy, first_game_nr, nr_games, total_nr_games)
+    return pairing_nr, first_game_nr, points_team_0 - points_team_1
+
+
+class Tournament:
+    """
+    Round robin tournament between a number of agents. Each agent plays as a team (on both seats of a team)
+    against each other agent. The games of each pairing are played with duplicate deals
+    (DealingCardDuplicateStrategy), and all pairings play the same deals, as the deals of each block of games are
+    generated from the same seed.
+
+    The blocks of games of all pairings are played in a pool of processes. Each worker creates an agent from its
+    factory when it is first needed and reuses it for all later games.
+
+    The ratings are updated whenever a block of games has finished, so that the standings can be inspected while
+    the tournament runs (for example in the callback of play). Two ratings are maintained: an Elo rating that is
+    updated incrementally after each game, and a Bradley-Terry rating that is calculated from the number of games
+    won in all pairings (on the same scale as the Elo rating).
+    """
+
+    def __init__(self,
+                 agents: Dict[str, AgentFactory],
+                 nr_games_per_pairing: int = 1000,
+                 games_per_block: int = 100,
+                 nr_workers: int = None,
+                 seed: int = None,
+                 elo_k: float = 4.0):
+        """
+        Args:
+            agents: factories for the agents, by their name
+            nr_games_per_pairing: number of games in each pairing of two agents
+            games_per_block: number of games played by a worker in one task, must be even for the duplicate deals
+            nr_workers: number of processes, the number of cpus if None
+            seed: seed to generate the deals
+            elo_k: factor for the update of the Elo rating after each game
+        """
+        if games_per_block % 2 != 0:
+            raise ValueError('games_per_block must be even for duplicate deals')
+        self._logger = logging.getLogger(__name__)
+        self._names = list(agents.keys())
+        self._factories = agents
+        self._nr_games_per_pairing = nr_games_per_pairing
+        self._games_per_block = games_per_block
+        self._nr_workers = nr_workers if nr_workers is not None else multiprocessing.cpu_count()
+        self._seed = seed
+        self._elo_k = elo_k
+
+        self._pairings: List[Tuple[int, int]] = list(itertools.combinations(range(len(self._names)), 2))
+
+        nr_agents = len(self._names)
+        self._elo = np.zeros(nr_agents, dtype=np.float64)
+        # games won by i against j (draws count as half a win)
+        self._wins = np.zeros([nr_agents, nr_agents], dtype=np.float64)
+        self._nr_games = np.zeros([nr_agents, nr_agents], dtype=np.int64)
+        self._point_difference = np.zeros([nr_agents, nr_agents], dtype=np.float64)
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def pairings(self) -> List[Tuple[str, str]]:
+        return [(self._names[i], self._names[j]) for i, j in self._pairings]
+
+    @property
+    def elo(self) -> np.ndarray:
+        return self._elo
+
+    @property
+    def wins(self) -> np.ndarray:
+        """
+        Number of games won by agent i against agent j (draws count as half a win).
+        """
+        return self._wins
+
+    @property
+    def nr_games(self) -> np.ndarray:
+        """
+        Number of games played between agent i and agent j.
+        """
+        return self._nr_games
+
+    @property
+    def nr_games_played(self) -> int:
+        return int(self._nr_games.sum()) // 2
+
+    def _get_tasks(self) -> list:
+        nr_blocks = (self._nr_games_per_pairing + self._games_per_block - 1) // self._games_per_block
+        # the same seeds are used for all pairings, so that they play the same deals
+        seeds = np.random.SeedSequence(self._seed).spawn(nr_blocks)
+        tasks = []
+        for block_nr in range(nr_blocks):
+            first_game_nr = block_nr * self._games_per_block
+            nr_games = min(self._games_per_block, self._nr_games_per_pairing - first_game_nr)
+            for pairing_nr, (i, j) in enumerate(self._pairings):
+                tasks.append((pairing_nr, self._names[i], self._names[j], seeds[block_nr], first_game_nr, nr_games,
+                              self._nr_games_per_pairing))
+        return tasks
+
+    def add_results(self, pairing_nr: int, point_differences: np.ndarray) -> None:
+        """
+        Add the results of games of a pairing and update the ratings.
+
+        Args:
+            pairing_nr: index of the pairing
+            point_differences: points of the first agent minus the points of the second agent for each game
+        """
+        i, j = self._pairings[pairing_nr]
+        for difference in point_differences:
+            score = 1.0 if difference > 0 else (0.0 if difference < 0 else 0.5)
+            expected = 1.0 / (1.0 + 10.0 ** ((self._elo[j] - self._elo[i]) / 400.0))
+            self._elo[i] += self._elo_k * (score - expected)
+            self._elo[j] -= self._elo_k * (score - expected)
+            self._wins[i, j] += score
+            self._wins[j, i] += 1.0 - score
+        self._nr_games[i, j] += len(point_differences)
+        self._nr_games[j, i] += len(point_differences)
+        self._point_difference[i, j] += np.sum(point_differences)
+        self._point_difference[j, i] -= np.sum(point_differences)
+
+    def bradley_terry(self, nr_iterations: int = 100, prior: float = 0.5) -> np.ndarray:
+        """
+        Calculate the Bradley-Terry ratings from the games won, using the minorization-maximization algorithm.
+
+        Args:
+            nr_iterations: number of iterations
+            prior: number of virtual wins and losses added to each played pairing, so that the ratings are finite
+                if an agent won or lost all games
+        Returns:
+            the ratings on the Elo scale, with mean 0
+        """
+        played = self._nr_games > 0
+        wins = self._wins + prior * played
+        games = wins + wins.T
+        total_wins = wins.sum(axis=1)
+        strength = np.ones(len(self._names))
+        for _ in range(nr_iterations):
+            denominator = np.where(played, games / (strength[:, None] + strength[None, :]), 0.0).sum(axis=1)
+            strength = np.where(denominator > 0, total_wins / np.maximum(denominator, 1e-12), strength)
+            strength /= np.exp(np.mean(np.log(strength)))
+        ratings = 400.0 * np.log10(strength)
+        return ratings - ratings.mean()
+
+    def standings(self) -> List[dict]:
+        """
+        Get the current standings, sorted by the Elo rating.
+
+        Returns:
+            list with a dict for each agent with name, elo, bradley_terry, games, wins and the mean point difference
+            per game
+        """
+        bradley_terry = self.bradley_terry()
+        result = []
+        for i, name in enumerate(self._names):
+            nr_games = int(self._nr_games[i].sum())
+            result.append(dict(name=name,
+                               elo=float(self._elo[i]),
+                               bradley_terry=float(bradley_terry[i]),
+                               games=nr_games,
+                               wins=float(self._wins[i].sum()),
+                               point_difference=float(self._point_difference[i].sum() / max(nr_games, 1))))
+        result.sort(key=lambda entry: entry['elo'], reverse=True)
+        return result
+
+    def play(self, callback: Callable[['Tournament'], None] = None) -> List[dict]:
+        """
+        Play all games of the tournament.
+
+        Args:
+            callback: function that is called after the results of each block of games have been added
+        Returns:
+            the final standings
+        """
+        tasks = self._get_tasks()
+        self._logger.info('Playing {} blocks of games in {} pairings'.format(len(tasks), len(self._pairings)))
+        if self._nr_workers > 1:
+            with multiprocessing.Pool(self._nr_workers, initializer=_init_worker, initargs=(self._factories,)) as pool:
+                for result in pool.imap(_play_block, tasks):
+                    self._add_block_result(result, callback)
+        else:
+            _init_worker(self._factories)
+            for task in tasks:
+                self._add_block_result(_play_block(task), callback)
+        return self.standings()
+
+    def _add_block_result(self, result, callback) -> None:
+        pairing_nr, _, point_differences = result
+        self.add_results(pairing_nr, point_differences)
+        if callback is not None:
+            callback(self)
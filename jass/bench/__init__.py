@@ -0,0 +1,7 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+from jass.bench.game_tree import perft, PerftResult
+
+__all__ = ['perft', 'PerftResult']
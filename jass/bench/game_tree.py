@@ -0,0 +1,176 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Perft style counting of the nodes of the game tree, used to validate and benchmark implementations of the rules
+(similar to perft in chess engines).
+"""
+import time
+from typing import List, Callable
+
+import numpy as np
+
+from jass.game.game_rule import GameRule
+from jass.game.game_sim import GameSim
+from jass.game.game_state import GameState
+from jass.game.rule_schieber import RuleSchieber
+
+
+class PerftResult:
+    """
+    Result of counting the nodes of a game tree.
+    """
+    def __init__(self, depth: int, nodes_per_depth: List[int], nr_leaf_nodes: int, seconds: float):
+        """
+        Args:
+            depth: depth of the search
+            nodes_per_depth: number of nodes at each depth from 0 (the root) to depth
+            nr_leaf_nodes: number of nodes at the given depth plus the number of end of game nodes at lower depths
+            seconds: time used for the search
+        """
+        self.depth = depth
+        self.nodes_per_depth = nodes_per_depth
+        self.nr_leaf_nodes = nr_leaf_nodes
+        self.seconds = seconds
+
+    @property
+    def nr_nodes(self) -> int:
+        return sum(self.nodes_per_depth)
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nr_nodes / self.seconds if self.seconds > 0 else float('inf')
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+def perft(state: GameState, depth: int, rule: GameRule = None) -> PerftResult:
+    """
+    Count the nodes reachable from the state by valid actions using GameSim. If trump has not been declared yet,
+    the trump actions (including push) are part of the tree, otherwise the cards.
+
+    Args:
+        state: the state at the root of the tree
+        depth: number of actions to search
+        rule: rule to use, RuleSchieber if None
+    Returns:
+        the node counts
+    """
+    if rule is None:
+        rule = RuleSchieber()
+    nodes_per_depth = [0] * (depth + 1)
+    start = time.perf_counter()
+    nr_leaf_nodes = _perft(state, depth, 0, rule, nodes_per_depth)
+    seconds = time.perf_counter() - start
+    return PerftResult(depth, nodes_per_depth, nr_leaf_nodes, seconds)
+
+
+def _perft(state: GameState, depth: int, current_depth: int, rule: GameRule, nodes_per_depth: List[int]) -> int:
+    nodes_per_depth[current_depth] += 1
+    if current_depth == depth or state.nr_played_cards == 36:
+        return 1
+    nr_leaf_nodes = 0
+    if state.trump == -1:
+        actions = np.flatnonzero(rule.get_valid_actions_from_state(state))
+    else:
+        actions = np.flatnonzero(rule.get_valid_cards_from_state(state))
+    for action in actions:
+        sim = GameSim(rule=rule)
+        sim.init_from_state(state)
+        if state.trump == -1:
+            sim.action(action)
+        else:
+            sim.action_play_card(action)
+        nr_leaf_nodes += _perft(sim.state, depth, current_depth + 1, rule, nodes_per_depth)
+    return nr_leaf_nodes
+
+
+#
+# Reference positions in the json format of GameState, so that they can also be read by implementations in other
+# languages, and the expected number of leaf nodes for depth 1, 2, ...
+#
+reference_positions = [
+    # start of the game, trump not declared yet
+    (
+        {'version': 'V0.2', 'trump': -1, 'dealer': 0, 'currentPlayer': 3, 'forehand': -1, 'tricks': [],
+         'player': [{'hand': ['DA', 'DQ', 'D9', 'HK', 'H8', 'SA', 'S7', 'CQ', 'C6']},
+                    {'hand': ['DK', 'D8', 'HA', 'H10', 'H6', 'SJ', 'S8', 'CJ', 'C9']},
+                    {'hand': ['DJ', 'D7', 'HQ', 'H9', 'SK', 'S10', 'S6', 'CK', 'C8']},
+                    {'hand': ['D10', 'D6', 'HJ', 'H7', 'SQ', 'S9', 'CA', 'C10', 'C7']}],
+         'jassTyp': 'SCHIEBER'},
+        [7, 60, 235, 790, 2627]
+    ),
+    # trump hearts declared, first trick started
+    (
+        {'version': 'V0.2', 'trump': 1, 'dealer': 0, 'currentPlayer': 3, 'forehand': 1,
+         'tricks': [{'first': 3}],
+         'player': [{'hand': ['DA', 'DQ', 'D9', 'HK', 'H8', 'SA', 'S7', 'CQ', 'C6']},
+                    {'hand': ['DK', 'D8', 'HA', 'H10', 'H6', 'SJ', 'S8', 'CJ', 'C9']},
+                    {'hand': ['DJ', 'D7', 'HQ', 'H9', 'SK', 'S10', 'S6', 'CK', 'C8']},
+                    {'hand': ['D10', 'D6', 'HJ', 'H7', 'SQ', 'S9', 'CA', 'C10', 'C7']}],
+         'jassTyp': 'SCHIEBER'},
+        [9, 34, 127, 417, 3336]
+    ),
+    # obe abe after three tricks, with one card in the current trick
+    (
+        {'version': 'V0.2', 'trump': 4, 'dealer': 1, 'currentPlayer': 2, 'forehand': 0,
+         'tricks': [{'cards': ['SA', 'S6', 'SJ', 'S9'], 'points': 13, 'win': 0, 'first': 0},
+                    {'cards': ['DA', 'DK', 'D7', 'D6'], 'points': 15, 'win': 0, 'first': 0},
+                    {'cards': ['CQ', 'CA', 'C8', 'C9'], 'points': 22, 'win': 3, 'first': 0},
+                    {'cards': ['C10'], 'first': 3}],
+         'player': [{'hand': ['DQ', 'D9', 'HK', 'H8', 'S7', 'C6']},
+                    {'hand': ['D8', 'HA', 'H10', 'H6', 'S8', 'CJ']},
+                    {'hand': ['DJ', 'HQ', 'H9', 'SK', 'S10', 'CK']},
+                    {'hand': ['D10', 'HJ', 'H7', 'SQ', 'C7']}],
+         'jassTyp': 'SCHIEBER'},
+        [1, 1, 1, 5, 9, 16]
+    ),
+    # une ufe in the fifth trick
+    (
+        {'version': 'V0.2', 'trump': 5, 'dealer': 3, 'currentPlayer': 3, 'forehand': 0,
+         'tricks': [{'cards': ['C7', 'CK', 'C6', 'CJ'], 'points': 17, 'win': 0, 'first': 2},
+                    {'cards': ['S7', 'SJ', 'SA', 'C10'], 'points': 12, 'win': 0, 'first': 0},
+                    {'cards': ['S9', 'S6', 'SQ', 'D10'], 'points': 24, 'win': 3, 'first': 0},
+                    {'cards': ['H10', 'HJ', 'H6', 'HQ'], 'points': 26, 'win': 1, 'first': 3},
+                    {'cards': ['H7', 'DA'], 'first': 1}],
+         'player': [{'hand': ['D6', 'S10', 'S8', 'CA']},
+                    {'hand': ['DQ', 'D8', 'HK', 'H9']},
+                    {'hand': ['DK', 'DJ', 'CQ', 'C9', 'C8']},
+                    {'hand': ['D9', 'D7', 'HA', 'H8', 'SK']}],
+         'jassTyp': 'SCHIEBER'},
+        [2, 10, 40, 100, 120, 384, 1152, 2240]
+    ),
+]
+
+
+def get_reference_state(index: int) -> GameState:
+    """
+    Get the state of a reference position.
+
+    Args:
+        index: index of the reference position
+    Returns:
+        the state
+    """
+    return GameState.from_json(reference_positions[index][0])
+
+
+def verify_reference_positions(perft_function: Callable[[GameState, int], int], max_depth: int = 3) -> List[str]:
+    """
+    Verify an implementation against the counts of the reference positions.
+
+    Args:
+        perft_function: function that returns the number of leaf nodes for a state and a depth
+        max_depth: maximal depth to verify
+    Returns:
+        list of messages describing the differences, empty if all counts are correct
+    """
+    errors = []
+    for index, (_, expected_counts) in enumerate(reference_positions):
+        for depth, expected in enumerate(expected_counts[0:max_depth], start=1):
+            count = perft_function(get_reference_state(index), depth)
+            if count != expected:
+                errors.append('Position {}, depth {}: expected {}, got {}'.format(index, depth, expected, count))
+    return errors
@@ -0,0 +1,4 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
@@ -0,0 +1,350 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Evaluate how well an agent predicts the recorded actions in files of GameObsActionLogEntry (for example the
+actions of human players in the swisslos logs, see examples/io/convert_games_to_obs_labels.py).
+
+Usage:
+    python -m jass.eval.policy_evaluation --agent jass.agents.agent_random_schieber.AgentRandomSchieber files...
+"""
+import argparse
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+from typing import Callable, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_batch import BatchAgent
+from jass.game.const import PUSH, PUSH_ALT, TRUMP_FULL_OFFSET, MAX_TRUMP, trump_strings_short
+from jass.game.game_observation import GameObservation
+
+AgentFactory = Callable[[], Agent]
+
+# part of a file, as file name and the start and end byte offset
+FileChunk = Tuple[str, int, int]
+
+PHASE_TRUMP = 0
+PHASE_CARD = 1
+
+
+def normalize_trump_action(action: int) -> int:
+    """
+    Convert a trump action, that might be encoded in the full action set (TRUMP_FULL_OFFSET), to the trump as
+    encoded in jass.game.const or PUSH.
+    """
+    if action >= TRUMP_FULL_OFFSET:
+        action -= TRUMP_FULL_OFFSET
+    if action == PUSH_ALT:
+        action = PUSH
+    return action
+
+
+class PolicyEvaluation:
+    """
+    Number of decisions and number of correctly predicted decisions, by phase, by trick number and by trump.
+
+    The trump decisions are counted by the recorded trump (with index 6 for PUSH), the card decisions by the trick
+    number and by the trump of the game.
+    """
+    def __init__(self):
+        self.nr_decisions = np.zeros(2, dtype=np.int64)
+        self.nr_correct = np.zeros(2, dtype=np.int64)
+        self.nr_decisions_by_trick = np.zeros(9, dtype=np.int64)
+        self.nr_correct_by_trick = np.zeros(9, dtype=np.int64)
+        self.nr_decisions_by_trump = np.zeros(MAX_TRUMP + 1, dtype=np.int64)
+        self.nr_correct_by_trump = np.zeros(MAX_TRUMP + 1, dtype=np.int64)
+        self.nr_decisions_by_trump_action = np.zeros(MAX_TRUMP + 2, dtype=np.int64)
+        self.nr_correct_by_trump_action = np.zeros(MAX_TRUMP + 2, dtype=np.int64)
+
+    def add_trump_decisions(self, actions: np.ndarray, predicted: np.ndarray) -> None:
+        """
+        Add trump decisions.
+
+        Args:
+            actions: the recorded trump actions (normalized, see normalize_trump_action)
+            predicted: the trump actions of the agent
+        """
+        correct = actions == predicted
+        index = np.where(actions == PUSH, MAX_TRUMP + 1, actions)
+        self.nr_decisions[PHASE_TRUMP] += len(actions)
+        self.nr_correct[PHASE_TRUMP] += np.sum(correct)
+        np.add.at(self.nr_decisions_by_trump_action, index, 1)
+        np.add.at(self.nr_correct_by_trump_action, index, correct)
+
+    def add_card_decisions(self, actions: np.ndarray, predicted: np.ndarray, tricks: np.ndarray,
+                           trumps: np.ndarray) -> None:
+        """
+        Add card decisions.
+
+        Args:
+            actions: the recorded cards
+            predicted: the cards played by the agent
+            tricks: the trick number of each decision
+            trumps: the trump of the game of each decision
+        """
+        correct = actions == predicted
+        self.nr_decisions[PHASE_CARD] += len(actions)
+        self.nr_correct[PHASE_CARD] += np.sum(correct)
+        np.add.at(self.nr_decisions_by_trick, tricks, 1)
+        np.add.at(self.nr_correct_by_trick, tricks, correct)
+        np.add.at(self.nr_decisions_by_trump, trumps, 1)
+        np.add.at(self.nr_correct_by_trump, trumps, correct)
+
+    def merge(self, other: 'PolicyEvaluation') -> None:
+        """
+        Add the counts of another evaluation (for example of another file).
+        """
+        for name, value in vars(other).items():
+            counts = getattr(self, name)
+            counts += value
+
+    @staticmethod
+    def _accuracy(nr_correct: np.ndarray, nr_decisions: np.ndarray) -> np.ndarray:
+        return nr_correct / np.maximum(nr_decisions, 1)
+
+    @property
+    def accuracy(self) -> float:
+        """
+        Top-1 accuracy over all decisions.
+        """
+        return float(self.nr_correct.sum() / max(self.nr_decisions.sum(), 1))
+
+    @property
+    def accuracy_by_phase(self) -> np.ndarray:
+        return self._accuracy(self.nr_correct, self.nr_decisions)
+
+    @property
+    def accuracy_by_trick(self) -> np.ndarray:
+        return self._accuracy(self.nr_correct_by_trick, self.nr_decisions_by_trick)
+
+    @property
+    def accuracy_by_trump(self) -> np.ndarray:
+        return self._accuracy(self.nr_correct_by_trump, self.nr_decisions_by_trump)
+
+    @property
+    def accuracy_by_trump_action(self) -> np.ndarray:
+        return self._accuracy(self.nr_correct_by_trump_action, self.nr_decisions_by_trump_action)
+
+    def to_json(self) -> dict:
+        trump_names = trump_strings_short[0:MAX_TRUMP + 1]
+        return dict(
+            nr_decisions=int(self.nr_decisions.sum()),
+            accuracy=self.accuracy,
+            trump=dict(nr_decisions=int(self.nr_decisions[PHASE_TRUMP]),
+                       accuracy=float(self.accuracy_by_phase[PHASE_TRUMP]),
+                       by_action={name: dict(nr_decisions=int(n), accuracy=float(a)) for name, n, a in
+                                  zip(trump_names + ['PUSH'], self.nr_decisions_by_trump_action,
+                                      self.accuracy_by_trump_action)}),
+            card=dict(nr_decisions=int(self.nr_decisions[PHASE_CARD]),
+                      accuracy=float(self.accuracy_by_phase[PHASE_CARD]),
+                      by_trick=[dict(nr_decisions=int(n), accuracy=float(a)) for n, a in
+                                zip(self.nr_decisions_by_trick, self.accuracy_by_trick)],
+                      by_trump={name: dict(nr_decisions=int(n), accuracy=float(a)) for name, n, a in
+                                zip(trump_names, self.nr_decisions_by_trump, self.accuracy_by_trump)}))
+
+
+def _predict_trump(agent: Agent, obs_list: List[GameObservation]) -> np.ndarray:
+    if isinstance(agent, BatchAgent):
+        return np.array(agent.action_trump_batch(obs_list), dtype=np.int64)
+    return np.array([agent.action_trump(obs) for obs in obs_list], dtype=np.int64)
+
+
+def _predict_card(agent: Agent, obs_list: List[GameObservation]) -> np.ndarray:
+    if isinstance(agent, BatchAgent):
+        return np.array(agent.action_play_card_batch(obs_list), dtype=np.int64)
+    return np.array([agent.action_play_card(obs) for obs in obs_list], dtype=np.int64)
+
+
+class _Batch:
+    """
+    Observations and recorded actions of one phase, that are evaluated together.
+    """
+    def __init__(self):
+        self.obs_list = []
+        self.actions = []
+
+    def __len__(self):
+        return len(self.obs_list)
+
+    def clear(self):
+        self.obs_list = []
+        self.actions = []
+
+
+def evaluate_entries(agent: Agent, lines: Iterable[str], batch_size: int = 256,
+                     evaluation: PolicyEvaluation = None) -> PolicyEvaluation:
+    """
+    Evaluate the agent on json formatted GameObsActionLogEntry lines. The observations are passed to the agent
+    in batches if it is a BatchAgent.
+
+    Args:
+        agent: the agent
+        lines: the json formatted entries
+        batch_size: number of decisions that are evaluated together
+        evaluation: evaluation to add the results to, a new evaluation is created if None
+    Returns:
+        the evaluation
+    """
+    evaluation = evaluation if evaluation is not None else PolicyEvaluation()
+    trump_batch = _Batch()
+    card_batch = _Batch()
+
+    def evaluate_trump_batch():
+        actions = np.array([normalize_trump_action(action) for action in trump_batch.actions], dtype=np.int64)
+        predicted = np.array([normalize_trump_action(action) for action in _predict_trump(agent, trump_batch.obs_list)],
+                             dtype=np.int64)
+        evaluation.add_trump_decisions(actions, predicted)
+        trump_batch.clear()
+
+    def evaluate_card_batch():
+        evaluation.add_card_decisions(np.array(card_batch.actions, dtype=np.int64),
+                                      _predict_card(agent, card_batch.obs_list),
+                                      np.array([obs.nr_tricks for obs in card_batch.obs_list], dtype=np.int64),
+                                      np.array([obs.trump for obs in card_batch.obs_list], dtype=np.int64))
+        card_batch.clear()
+
+    for line in lines:
+        # only the observation and the action are needed, so the date is not parsed
+        data = json.loads(line)
+        obs = GameObservation.from_json(data['obs'])
+        batch = trump_batch if obs.trump == -1 else card_batch
+        batch.obs_list.append(obs)
+        batch.actions.append(int(data['action']))
+        if len(trump_batch) >= batch_size:
+            evaluate_trump_batch()
+        if len(card_batch) >= batch_size:
+            evaluate_card_batch()
+    if len(trump_batch) > 0:
+        evaluate_trump_batch()
+    if len(card_batch) > 0:
+        evaluate_card_batch()
+    return evaluation
+
+
+def evaluate_file(agent: Agent, filename: str, batch_size: int = 256) -> PolicyEvaluation:
+    """
+    Evaluate the agent on a file of GameObsActionLogEntry.
+    """
+    with open(filename, mode='r') as file:
+        return evaluate_entries(agent, file, batch_size)
+
+
+def split_file(filename: str, chunk_size: int) -> List[FileChunk]:
+    """
+    Split a file into chunks of about chunk_size bytes, so that the lines of large files can be evaluated in
+    parallel. The chunks end at line boundaries.
+
+    Args:
+        filename: the file
+        chunk_size: minimal size of a chunk in bytes (except for the last chunk)
+    Returns:
+        the chunks, covering the whole file in order
+    """
+    size = os.path.getsize(filename)
+    chunks = []
+    start = 0
+    with open(filename, mode='rb') as file:
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                # extend the chunk to the end of the line
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+            end = min(end, size)
+            chunks.append((filename, start, end))
+            start = end
+    return chunks
+
+
+def evaluate_chunk(agent: Agent, chunk: FileChunk, batch_size: int = 256) -> PolicyEvaluation:
+    """
+    Evaluate the agent on a chunk of a file of GameObsActionLogEntry (see split_file).
+    """
+    filename, start, end = chunk
+    with open(filename, mode='rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    return evaluate_entries(agent, (line for line in text.split('\n') if line), batch_size)
+
+
+# agent of the worker process, created by the initializer of the pool
+_worker_agent: Agent or None = None
+_worker_batch_size = 256
+
+
+def _init_worker(agent_factory: AgentFactory, batch_size: int):
+    global _worker_agent, _worker_batch_size
+    _worker_agent = agent_factory()
+    _worker_batch_size = batch_size
+
+
+def _evaluate_chunk(chunk: FileChunk) -> PolicyEvaluation:
+    return evaluate_chunk(_worker_agent, chunk, _worker_batch_size)
+
+
+def evaluate_files(agent_factory: AgentFactory, filenames: List[str], nr_workers: int = None,
+                   batch_size: int = 256, chunk_size: int = 1 << 24) -> PolicyEvaluation:
+    """
+    Evaluate an agent on files of GameObsActionLogEntry. The files are split into chunks of lines (see split_file),
+    which are evaluated in a pool of processes, so that also a single large file uses all workers. Each worker
+    creates its own agent from the factory, which must be picklable if the processes are not started by fork.
+
+    Args:
+        agent_factory: function or class to create the agent
+        filenames: the files to evaluate
+        nr_workers: number of processes, the number of cpus if None
+        batch_size: number of decisions that are evaluated together
+        chunk_size: size of the chunks of the files in bytes
+    Returns:
+        the evaluation of all files
+    """
+    nr_workers = nr_workers if nr_workers is not None else multiprocessing.cpu_count()
+    evaluation = PolicyEvaluation()
+    chunks = [chunk for filename in filenames for chunk in split_file(filename, chunk_size)]
+    if nr_workers > 1 and len(chunks) > 1:
+        with multiprocessing.Pool(min(nr_workers, len(chunks)), initializer=_init_worker,
+                                  initargs=(agent_factory, batch_size)) as pool:
+            for result in pool.imap_unordered(_evaluate_chunk, chunks):
+                evaluation.merge(result)
+    else:
+        agent = agent_factory()
+        for filename in filenames:
+            evaluation.merge(evaluate_file(agent, filename, batch_size))
+    return evaluation
+
+
+def _get_class(name: str) -> Union[Callable, type]:
+    module_name, class_name = name.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(description='Evaluate the accuracy of an agent on observation/action logs')
+    parser.add_argument('--agent', type=str, required=True, help='Class of the agent, as module.Class')
+    parser.add_argument('--nr_workers', type=int, default=None, help='Number of processes')
+    parser.add_argument('--batch_size', type=int, default=256, help='Number of decisions evaluated together')
+    parser.add_argument('--chunk_size', type=int, default=1 << 24,
+                        help='Size in bytes of the parts of the files that are evaluated in parallel')
+    parser.add_argument('--output', type=str, default=None, help='File to write the results as json')
+    parser.add_argument('files', type=str, nargs='+', help='The log files to evaluate')
+    arg = parser.parse_args()
+
+    evaluation = evaluate_files(_get_class(arg.agent), arg.files, arg.nr_workers, arg.batch_size,
+                                arg.chunk_size)
+    result = evaluation.to_json()
+    if arg.output is not None:
+        with open(arg.output, mode='w') as file:
+            json.dump(result, file, indent=2)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
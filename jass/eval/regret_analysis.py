@@ -0,0 +1,274 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Analyze the card decisions in files of GameLogEntry (for example the swisslos logs or the games saved by an arena)
+against the perfect information optimum: for each decision, the regret is the difference between the points the
+team of the player makes in the rest of the game after the best card and after the card actually played, if all
+players know all cards and play optimally afterwards.
+
+Usage:
+    python -m jass.eval.regret_analysis --cache regret_cache.txt files...
+"""
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from jass.game.const import MAX_TRUMP, trump_strings_short
+from jass.game.game_state import GameState
+from jass.game.game_state_util import state_from_complete_game
+from jass.game.perfect_information_solver import PerfectInformationSolver
+
+# a decision is stored as (player, trick number, card played, value of the card played, value of the best card)
+Decision = Tuple[int, int, int, int, int]
+
+
+def analyze_game(game: GameState, solver: PerfectInformationSolver, max_cards_remaining: int = 16) -> List[Decision]:
+    """
+    Calculate the values of the card played and of the best card for the decisions in a game.
+
+    Args:
+        game: the completed game
+        solver: the solver to use
+        max_cards_remaining: only the decisions with at most this number of cards remaining in the hands are
+            analyzed, as the search for the earlier decisions takes much longer (36 for all decisions)
+    Returns:
+        the decisions, with the values as points of the team of the player in the rest of the game
+    """
+    decisions = []
+    for cards_played in range(max(0, 36 - max_cards_remaining), 36):
+        state = state_from_complete_game(game, cards_played)
+        card = int(game.tricks[state.nr_tricks, state.nr_cards_in_trick])
+        values = solver.action_values(state)
+        decisions.append((int(state.player), int(state.nr_tricks), card, int(values[card]), int(values.max())))
+    return decisions
+
+
+class RegretStatistics:
+    """
+    Number of decisions, sum of the regret and number of optimal decisions, by trick number, by trump and by
+    player id.
+    """
+    def __init__(self):
+        self.nr_decisions_by_trick = np.zeros(9, dtype=np.int64)
+        self.regret_by_trick = np.zeros(9, dtype=np.int64)
+        self.nr_optimal_by_trick = np.zeros(9, dtype=np.int64)
+        self.nr_decisions_by_trump = np.zeros(MAX_TRUMP + 1, dtype=np.int64)
+        self.regret_by_trump = np.zeros(MAX_TRUMP + 1, dtype=np.int64)
+        self.nr_optimal_by_trump = np.zeros(MAX_TRUMP + 1, dtype=np.int64)
+        # [nr_decisions, regret, nr_optimal] for each player id
+        self.by_player_id: Dict[int, List[int]] = {}
+
+    @property
+    def nr_decisions(self) -> int:
+        return int(self.nr_decisions_by_trick.sum())
+
+    @property
+    def mean_regret(self) -> float:
+        return float(self.regret_by_trick.sum() / max(self.nr_decisions, 1))
+
+    def add_game(self, decisions: List[Decision], trump: int, player_ids: List[int] = None) -> None:
+        """
+        Add the decisions of a game.
+
+        Args:
+            decisions: the decisions as returned by analyze_game
+            trump: the trump of the game
+            player_ids: the ids of the players of the game, if available
+        """
+        for player, trick_nr, _, value, best_value in decisions:
+            regret = best_value - value
+            optimal = 1 if regret == 0 else 0
+            self.nr_decisions_by_trick[trick_nr] += 1
+            self.regret_by_trick[trick_nr] += regret
+            self.nr_optimal_by_trick[trick_nr] += optimal
+            self.nr_decisions_by_trump[trump] += 1
+            self.regret_by_trump[trump] += regret
+            self.nr_optimal_by_trump[trump] += optimal
+            if player_ids is not None:
+                entry = self.by_player_id.setdefault(int(player_ids[player]), [0, 0, 0])
+                entry[0] += 1
+                entry[1] += regret
+                entry[2] += optimal
+
+    def merge(self, other: 'RegretStatistics') -> None:
+        """
+        Add the statistics of another analysis.
+        """
+        for name, value in vars(other).items():
+            if name == 'by_player_id':
+                for player_id, counts in value.items():
+                    entry = self.by_player_id.setdefault(player_id, [0, 0, 0])
+                    for i in range(3):
+                        entry[i] += counts[i]
+            else:
+                counts = getattr(self, name)
+                counts += value
+
+    @staticmethod
+    def _summary(nr_decisions: int, regret: int, nr_optimal: int) -> dict:
+        return dict(nr_decisions=int(nr_decisions),
+                    mean_regret=float(regret / max(nr_decisions, 1)),
+                    optimal=float(nr_optimal / max(nr_decisions, 1)))
+
+    def to_json(self) -> dict:
+        return dict(
+            nr_decisions=self.nr_decisions,
+            mean_regret=self.mean_regret,
+            by_trick=[self._summary(*counts) for counts in
+                      zip(self.nr_decisions_by_trick, self.regret_by_trick, self.nr_optimal_by_trick)],
+            by_trump={name: self._summary(*counts) for name, *counts in
+                      zip(trump_strings_short, self.nr_decisions_by_trump, self.regret_by_trump,
+                          self.nr_optimal_by_trump)},
+            by_player_id={str(player_id): self._summary(*counts) for player_id, counts in
+                          sorted(self.by_player_id.items())})
+
+
+class RegretCache:
+    """
+    Persistent cache of the analyzed games, so that the analysis can be continued or repeated with other
+    aggregations. The games are stored by a hash of the game (and the number of cards analyzed), one json line
+    per game, which is appended to the file when it is added.
+    """
+    def __init__(self, filename: str = None):
+        """
+        Args:
+            filename: the file of the cache, it is created if it does not exist, the cache is only kept in memory
+                if None
+        """
+        self._filename = filename
+        self._entries: Dict[str, List[Decision]] = {}
+        if filename is not None and os.path.exists(filename):
+            with open(filename, mode='r') as file:
+                for line in file:
+                    data = json.loads(line)
+                    self._entries[data['key']] = [tuple(decision) for decision in data['decisions']]
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(game: dict, max_cards_remaining: int) -> str:
+        """
+        Calculate the key of a game.
+
+        Args:
+            game: the game in json format
+            max_cards_remaining: the number of cards analyzed
+        """
+        data = json.dumps(game, sort_keys=True, separators=(',', ':')) + str(max_cards_remaining)
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> List[Decision] or None:
+        return self._entries.get(key)
+
+    def add(self, key: str, decisions: List[Decision]) -> None:
+        self._entries[key] = decisions
+        if self._filename is not None:
+            with open(self._filename, mode='a') as file:
+                file.write(json.dumps(dict(key=key, decisions=decisions), separators=(',', ':')) + '\n')
+
+
+# solver of the worker process
+_worker_solver: PerfectInformationSolver or None = None
+
+
+def _init_worker():
+    global _worker_solver
+    _worker_solver = PerfectInformationSolver()
+
+
+def _analyze_game(args) -> (str, List[Decision]):
+    key, game, max_cards_remaining = args
+    return key, analyze_game(GameState.from_json(game), _worker_solver, max_cards_remaining)
+
+
+def _read_games(filenames: Iterable[str]):
+    for filename in filenames:
+        with open(filename, mode='r') as file:
+            for line in file:
+                data = json.loads(line)
+                yield data['game'], data.get('player_ids')
+
+
+def analyze_files(filenames: List[str], nr_workers: int = None, max_cards_remaining: int = 16,
+                  cache_filename: str = None) -> RegretStatistics:
+    """
+    Analyze the games in files of GameLogEntry. The games that are not in the cache are analyzed in a pool of
+    processes and added to the cache.
+
+    Args:
+        filenames: the files to analyze
+        nr_workers: number of processes, the number of cpus if None
+        max_cards_remaining: only the decisions with at most this number of cards remaining in the hands are
+            analyzed (36 for all decisions)
+        cache_filename: file of the persistent cache, None for no persistent cache
+    Returns:
+        the statistics of all games
+    """
+    logger = logging.getLogger(__name__)
+    nr_workers = nr_workers if nr_workers is not None else multiprocessing.cpu_count()
+    cache = RegretCache(cache_filename)
+    statistics = RegretStatistics()
+
+    # the games are read once, the player ids and trumps are needed again when the results arrive
+    games = {}
+    tasks = []
+    nr_cached = 0
+    for game, player_ids in _read_games(filenames):
+        key = RegretCache.get_key(game, max_cards_remaining)
+        decisions = cache.get(key)
+        if decisions is not None:
+            statistics.add_game(decisions, game['trump'], player_ids)
+            nr_cached += 1
+        else:
+            if key not in games:
+                tasks.append((key, game, max_cards_remaining))
+            games.setdefault(key, []).append((game['trump'], player_ids))
+    logger.info('{} games in the cache, {} games to analyze'.format(nr_cached, len(tasks)))
+
+    def add_result(result):
+        key, decisions = result
+        cache.add(key, decisions)
+        for trump, player_ids in games[key]:
+            statistics.add_game(decisions, trump, player_ids)
+
+    if nr_workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(nr_workers, initializer=_init_worker) as pool:
+            for result in pool.imap_unordered(_analyze_game, tasks, chunksize=4):
+                add_result(result)
+    else:
+        _init_worker()
+        for task in tasks:
+            add_result(_analyze_game(task))
+    return statistics
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='Analyze the regret of the card decisions in game logs')
+    parser.add_argument('--nr_workers', type=int, default=None, help='Number of processes')
+    parser.add_argument('--max_cards_remaining', type=int, default=16,
+                        help='Analyze the decisions with at most this number of cards in the hands (36 for all)')
+    parser.add_argument('--cache', type=str, default=None, help='File of the persistent cache of the results')
+    parser.add_argument('--output', type=str, default=None, help='File to write the results as json')
+    parser.add_argument('files', type=str, nargs='+', help='The log files to analyze')
+    arg = parser.parse_args()
+
+    statistics = analyze_files(arg.files, arg.nr_workers, arg.max_cards_remaining, arg.cache)
+    result = statistics.to_json()
+    if arg.output is not None:
+        with open(arg.output, mode='w') as file:
+            json.dump(result, file, indent=2)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Count, enumerate and sample the card distributions (worlds) that are consistent with an observation.
+"""
+import itertools
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+from jass.game.const import color_of_card, color_masks, lower_trump, J_offset, OBE_ABE
+from jass.game.game_observation import GameObservation
+
+
+class ConstrainedCardAssignment:
+    """
+    Assignment of cards to the 4 players, where each card can only be given to some of the players and each
+    player must receive a given number of cards.
+
+    Cards with the same set of allowed players are grouped, so that the number of assignments can be calculated
+    combinatorially by distributing the number of cards of each group among its players. This allows to count the
+    assignments exactly, to enumerate them and to sample them uniformly without rejection.
+    """
+    def __init__(self, cards: np.ndarray or List[int], allowed: np.ndarray, counts: np.ndarray or List[int]):
+        """
+        Args:
+            cards: the cards to assign
+            allowed: boolean array of shape [len(cards), 4], True if the card can be given to the player
+            counts: the number of cards each player must receive
+        """
+        groups = {}
+        for card, allowed_players in zip(cards, allowed):
+            players = tuple(int(p) for p in np.flatnonzero(allowed_players))
+            groups.setdefault(players, []).append(int(card))
+
+        # list of (players, cards) of each group, groups with fewer players first to limit the branching
+        self._groups: List[Tuple[Tuple[int, ...], List[int]]] = sorted(groups.items(), key=lambda g: len(g[0]))
+        self._counts = tuple(int(c) for c in counts)
+
+        # number of cards in the groups from index i to the end
+        self._remaining_cards = [0] * (len(self._groups) + 1)
+        for i in range(len(self._groups) - 1, -1, -1):
+            self._remaining_cards[i] = self._remaining_cards[i + 1] + len(self._groups[i][1])
+
+        self._memo = {}
+
+    def count(self) -> int:
+        """
+        Returns:
+            the number of possible assignments
+        """
+        return self._count(0, self._counts)
+
+    def enumerate(self) -> np.ndarray:
+        """
+        Enumerate all possible assignments.
+
+        Returns:
+            one-hot encoded hands of all assignments, shape [K, 4, 36]
+        """
+        result = np.zeros([self.count(), 4, 36], dtype=np.int32)
+        for i, assignment in enumerate(self._enumerate(0, self._counts)):
+            for player, cards in assignment:
+                result[i, player, cards] = 1
+        return result
+
+    def sample(self, nr_samples: int, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Sample assignments uniformly.
+
+        Args:
+            nr_samples: number of assignments to sample
+            rng: random generator to use
+        Returns:
+            one-hot encoded hands of the sampled assignments, shape [nr_samples, 4, 36]
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        if self.count() == 0:
+            raise ValueError('No assignment of the cards is possible')
+        result = np.zeros([nr_samples, 4, 36], dtype=np.int32)
+        for i in range(nr_samples):
+            remaining = self._counts
+            for group_nr, (players, cards) in enumerate(self._groups):
+                distributions = list(self._distributions(len(cards), players, remaining))
+                weights = np.array([float(self._multinomial(len(cards), k) *
+                                          self._count(group_nr + 1, self._subtract(remaining, players, k)))
+                                    for k in distributions])
+                k = distributions[rng.choice(len(distributions), p=weights / weights.sum())]
+                shuffled = rng.permutation(cards)
+                start = 0
+                for player, nr_cards in zip(players, k):
+                    result[i, player, shuffled[start:start + nr_cards]] = 1
+                    start += nr_cards
+                remaining = self._subtract(remaining, players, k)
+        return result
+
+    def _count(self, group_nr: int, remaining: Tuple[int, ...]) -> int:
+        if sum(remaining) != self._remaining_cards[group_nr]:
+            return 0
+        if group_nr == len(self._groups):
+            return 1
+        key = (group_nr, remaining)
+        if key in self._memo:
+            return self._memo[key]
+        players, cards = self._groups[group_nr]
+        total = 0
+        for k in self._distributions(len(cards), players, remaining):
+            total += self._multinomial(len(cards), k) * \
+                self._count(group_nr + 1, self._subtract(remaining, players, k))
+        self._memo[key] = total
+        return total
+
+    def _enumerate(self, group_nr: int, remaining: Tuple[int, ...]):
+        if self._count(group_nr, remaining) == 0:
+            return
+        if group_nr == len(self._groups):
+            yield []
+            return
+        players, cards = self._groups[group_nr]
+        for k in self._distributions(len(cards), players, remaining):
+            rest = self._subtract(remaining, players, k)
+            if self._count(group_nr + 1, rest) == 0:
+                continue
+            for split in self._splits(cards, k):
+                for assignment in self._enumerate(group_nr + 1, rest):
+                    yield list(zip(players, split)) + assignment
+
+    @staticmethod
+    def _distributions(nr_cards: int, players: Tuple[int, ...], remaining: Tuple[int, ...]):
+        """
+        Generate the possible numbers of cards for each player of a group.
+        """
+        if len(players) == 0:
+            if nr_cards == 0:
+                yield ()
+            return
+        if len(players) == 1:
+            if nr_cards <= remaining[players[0]]:
+                yield (nr_cards,)
+            return
+        for k in range(min(nr_cards, remaining[players[0]]) + 1):
+            for rest in ConstrainedCardAssignment._distributions(nr_cards - k, players[1:], remaining):
+                yield (k,) + rest
+
+    @staticmethod
+    def _splits(cards: List[int], k: Tuple[int, ...]):
+        """
+        Generate all splits of the cards into parts of the sizes in k.
+        """
+        if len(k) == 1:
+            yield [cards]
+            return
+        for first in itertools.combinations(cards, k[0]):
+            rest = [card for card in cards if card not in first]
+            for split in ConstrainedCardAssignment._splits(rest, k[1:]):
+                yield [list(first)] + split
+
+    @staticmethod
+    def _multinomial(n: int, k: Tuple[int, ...]) -> int:
+        result = 1
+        for k_i in k:
+            result *= math.comb(n, k_i)
+            n -= k_i
+        return result
+
+    @staticmethod
+    def _subtract(remaining: Tuple[int, ...], players: Tuple[int, ...], k: Tuple[int, ...]) -> Tuple[int, ...]:
+        result = list(remaining)
+        for player, k_i in zip(players, k):
+            result[player] -= k_i
+        return tuple(result)
+
+
+def get_assignment_from_observation(obs: GameObservation) -> ConstrainedCardAssignment:
+    """
+    Get the constraints on the cards that are not known in the observation. The cards of the player of the
+    observation (if any) are known, the other cards are constrained by the number of cards each player still holds
+    and by the colors a player can not hold anymore as they did not follow suit.
+
+    The voids are derived from the rule for Schieber:
+    - a player that did not play the color of the first card and no trump, does not have this color
+    - a player that did not play trump when trump was led, has no trump except possibly the jack
+    - a player that played a trump lower than a trump already played in the trick (as determined by
+      RuleSchieber.get_valid_cards), has only trumps left
+
+    Args:
+        obs: the observation
+    Returns:
+        the constraints for the unknown cards
+    """
+    allowed = np.ones([36, 4], dtype=bool)
+    nr_cards_played = np.zeros(4, dtype=np.int32)
+
+    known_cards = np.zeros(36, dtype=bool)
+    if obs.player_view != -1:
+        known_cards[obs.hand > 0] = True
+        allowed[:, obs.player_view] = False
+
+    nr_tricks = min(obs.nr_tricks + 1, 9)
+    for trick_nr in range(nr_tricks):
+        trick = obs.tricks[trick_nr]
+        first_player = obs.trick_first_player[trick_nr]
+        for i in range(4):
+            card = trick[i]
+            if card == -1:
+                break
+            known_cards[card] = True
+            player = (first_player - i) % 4
+            nr_cards_played[player] += 1
+            if i == 0:
+                continue
+            color_played = color_of_card[trick[0]]
+            color = color_of_card[card]
+            if obs.trump >= OBE_ABE:
+                if color != color_played:
+                    allowed[color_masks[color_played] > 0, player] = False
+            elif color_played == obs.trump:
+                if color != obs.trump:
+                    # only the jack of trump can still be held
+                    trump_mask = color_masks[obs.trump] > 0
+                    trump_mask[obs.trump * 9 + J_offset] = False
+                    allowed[trump_mask, player] = False
+            elif color == obs.trump:
+                # trump played on another color, check if it was lower than a previous trump in the same way as the
+                # rule does
+                lowest_trump_played = None
+                for j in range(1, i):
+                    if color_of_card[trick[j]] == obs.trump:
+                        if lowest_trump_played is None or lowest_trump_played < trick[j]:
+                            lowest_trump_played = trick[j]
+                if lowest_trump_played is not None and lower_trump[lowest_trump_played, card]:
+                    # only trump left
+                    allowed[color_masks[obs.trump] == 0, player] = False
+            elif color != color_played:
+                allowed[color_masks[color_played] > 0, player] = False
+
+    counts = 9 - nr_cards_played
+    if obs.player_view != -1:
+        counts[obs.player_view] = 0
+    cards = np.flatnonzero(~known_cards)
+    return ConstrainedCardAssignment(cards, allowed[cards], counts)
+
+
+def _add_hand_of_observation(worlds: np.ndarray, obs: GameObservation) -> np.ndarray:
+    if obs.player_view != -1:
+        worlds[:, obs.player_view, :] = obs.hand
+    return worlds
+
+
+def count_consistent_worlds(obs: GameObservation) -> int:
+    """
+    Count the distributions of the cards that are still held by the players, that are consistent with the
+    observation.
+
+    Args:
+        obs: the observation
+    Returns:
+        the number of consistent distributions
+    """
+    return get_assignment_from_observation(obs).count()
+
+
+def enumerate_consistent_worlds(obs: GameObservation) -> np.ndarray:
+    """
+    Enumerate all distributions of the cards that are still held by the players, that are consistent with the
+    observation. The hand of the observation is included for the player of the observation.
+
+    Args:
+        obs: the observation
+    Returns:
+        one-hot encoded hands of all players for each distribution, shape [K, 4, 36]
+    """
+    return _add_hand_of_observation(get_assignment_from_observation(obs).enumerate(), obs)
+
+
+def sample_consistent_worlds(obs: GameObservation, nr_samples: int, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Sample uniformly from the distributions of the cards that are consistent with the observation.
+
+    Args:
+        obs: the observation
+        nr_samples: the number of samples
+        rng: random generator to use
+    Returns:
+        one-hot encoded hands of all players for each sample, shape [nr_samples, 4, 36]
+    """
+    return _add_hand_of_observation(get_assignment_from_observation(obs).sample(nr_samples, rng), obs)
+
+
+def get_consistent_worlds(obs: GameObservation,
+                          max_worlds: int,
+                          nr_samples: int,
+                          rng: np.random.Generator = None) -> (np.ndarray, bool):
+    """
+    Get either all consistent worlds (if there are not more than max_worlds of them) or a uniform sample of them.
+    Agents can use the second return value to switch from sampling to an exact evaluation.
+
+    Args:
+        obs: the observation
+        max_worlds: maximal number of worlds to enumerate
+        nr_samples: number of samples if there are more worlds
+        rng: random generator to use
+    Returns:
+        the hands of each world, shape [K, 4, 36] and True if all worlds were enumerated
+    """
+    assignment = get_assignment_from_observation(obs)
+    if assignment.count() <= max_worlds:
+        return _add_hand_of_observation(assignment.enumerate(), obs), True
+    else:
+        return _add_hand_of_observation(assignment.sample(nr_samples, rng), obs), False
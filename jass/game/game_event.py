@@ -0,0 +1,75 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+from typing import Tuple
+
+import numpy as np
+
+from jass.game.game_observation import GameObservation
+
+
+class GameEvent:
+    """
+    Event in a game, that is sent to the agents (see Agent.on_game_event), so that they can update their
+    information incrementally instead of deriving it from the observation for each action.
+
+    The arena sends the events in the order they happen in the game, each event once to each agent. An agent
+    that plays on several seats receives the event only once, seats contains the seats of the receiving agent:
+    - GAME_START: the cards have been dealt, hand contains the hand of the receiving player (player, the first of
+      the seats) and hands contains the hands of all the seats of the agent
+    - TRUMP: player selected trump (or PUSH)
+    - CARD_PLAYED: player played card in trick trick_nr
+    - TRICK_END: trick trick_nr was won by player with points
+    - GAME_END: the game is finished, points contains the points of both teams
+    - GAME_INFO: information from the server received by a player service, obs contains the observation
+    """
+    GAME_START = 0
+    TRUMP = 1
+    CARD_PLAYED = 2
+    TRICK_END = 3
+    GAME_END = 4
+    GAME_INFO = 5
+
+    def __init__(self,
+                 event_type: int,
+                 player: int = -1,
+                 dealer: int = -1,
+                 trump: int = -1,
+                 card: int = -1,
+                 trick_nr: int = -1,
+                 points: int or np.ndarray = 0,
+                 hand: np.ndarray = None,
+                 obs: GameObservation = None,
+                 seats: Tuple[int, ...] = None,
+                 hands: np.ndarray = None):
+        """
+        Args:
+            event_type: type of the event
+            player: player of the event
+            dealer: dealer of the game (GAME_START)
+            trump: the selected trump (TRUMP)
+            card: the played card (CARD_PLAYED)
+            trick_nr: the number of the trick (CARD_PLAYED and TRICK_END)
+            points: points of the trick (TRICK_END) or the points of both teams (GAME_END)
+            hand: hand of the player (GAME_START)
+            obs: observation (GAME_INFO)
+            seats: the seats of the receiving agent
+            hands: hands of the seats of the receiving agent, with shape [4, 36] and no cards for the other seats
+                (GAME_START)
+        """
+        self.event_type = event_type
+        self.player = player
+        self.dealer = dealer
+        self.trump = trump
+        self.card = card
+        self.trick_nr = trick_nr
+        self.points = points
+        self.hand = hand
+        self.obs = obs
+        self.seats = seats
+        self.hands = hands
+
+    def __repr__(self):
+        return 'GameEvent(type={}, player={}, trump={}, card={}, trick_nr={}, points={}, seats={})'.format(
+            self.event_type, self.player, self.trump, self.card, self.trick_nr, self.points, self.seats)
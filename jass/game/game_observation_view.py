@@ -0,0 +1,137 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import numpy as np
+
+from jass.game.game_observation import GameObservation
+from jass.game.game_state import GameState
+from jass.game.game_state_util import observation_from_state
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _restore_observation(attributes: dict) -> GameObservation:
+    obs = GameObservation.__new__(GameObservation)
+    obs.__dict__.update(attributes)
+    # the current trick must be a view of the tricks (which is not preserved by copying)
+    if obs.current_trick is not None:
+        obs.current_trick = obs.tricks[obs.nr_tricks]
+    return obs
+
+
+class ObservationView(GameObservation):
+    """
+    Observation of a player that reads the information from the live game state instead of copying it, see
+    observation_from_state. The arrays are read-only numpy views onto the arrays of the state, and only the hand
+    of the player is exposed.
+
+    The view is only valid as long as the state does not change, i.e. during the call of the agent it is passed
+    to. Agents that keep the observation (or modify it) must use materialize() to get a copy. Copying or pickling
+    the view also returns a (materialized) GameObservation.
+    """
+
+    def __init__(self, state: GameState, player: int) -> None:
+        """
+        Args:
+            state: the game state
+            player: player for which to create the observation or -1 for the public observation
+        """
+        # the base class is not initialized, as the arrays are not allocated
+        self._state = state
+        self._player_view = player
+        if player != -1 and state.nr_played_cards < 36:
+            self._hand = _read_only(state.hands[player])
+        else:
+            self._hand = _read_only(np.zeros(36, dtype=np.int32))
+        self._tricks = _read_only(state.tricks)
+        self._trick_winner = _read_only(state.trick_winner)
+        self._trick_points = _read_only(state.trick_points)
+        self._trick_first_player = _read_only(state.trick_first_player)
+        self._points = _read_only(state.points)
+
+    @property
+    def dealer(self) -> int:
+        return self._state.dealer
+
+    @property
+    def player(self) -> int:
+        return self._state.player
+
+    @property
+    def player_view(self) -> int:
+        return self._player_view
+
+    @property
+    def trump(self) -> int:
+        return self._state.trump
+
+    @property
+    def forehand(self) -> int:
+        return self._state.forehand
+
+    @property
+    def declared_trump(self) -> int:
+        return self._state.declared_trump
+
+    @property
+    def hand(self) -> np.ndarray:
+        return self._hand
+
+    @property
+    def tricks(self) -> np.ndarray:
+        return self._tricks
+
+    @property
+    def trick_winner(self) -> np.ndarray:
+        return self._trick_winner
+
+    @property
+    def trick_points(self) -> np.ndarray:
+        return self._trick_points
+
+    @property
+    def trick_first_player(self) -> np.ndarray:
+        return self._trick_first_player
+
+    @property
+    def current_trick(self) -> np.ndarray or None:
+        if self._state.nr_played_cards < 36:
+            return self._tricks[self._state.nr_tricks]
+        return None
+
+    @property
+    def nr_tricks(self) -> int:
+        return self._state.nr_tricks
+
+    @property
+    def nr_cards_in_trick(self) -> int:
+        return self._state.nr_cards_in_trick
+
+    @property
+    def nr_played_cards(self) -> int:
+        return self._state.nr_played_cards
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points
+
+    def materialize(self) -> GameObservation:
+        """
+        Copy the observation, so that it can be kept and modified.
+
+        Returns:
+            the observation as GameObservation with its own arrays
+        """
+        return observation_from_state(self._state, self._player_view)
+
+    def __reduce_ex__(self, protocol):
+        # copy, deepcopy and pickle use the materialized observation instead of the state
+        return _restore_observation, (self.materialize().__dict__,)
+
+    def __repr__(self):
+        return repr(self.materialize())
@@ -10,6 +10,7 @@ import numpy as np
 
 from jass.game.game_util import full_to_trump
 from jass.game.const import next_player, PUSH, partner_player, NORTH, SOUTH, TRUMP_FULL_OFFSET
+from jass.game.game_observation_view import ObservationView
 from jass.game.game_rule import GameRule
 from jass.game.game_state import GameState
 from jass.game.game_state_util import observation_from_state
@@ -64,6 +65,15 @@ class GameSim:
         """
         return observation_from_state(self._state, self._state.player)
 
+    def get_observation_view(self) -> ObservationView:
+        """
+        Get a read-only view of the observation for the current player, that is only valid until the next action.
+
+        Returns:
+            The observation view for the current player.
+        """
+        return ObservationView(self._state, self._state.player)
+
     def action_trump(self, action: int) -> None:
         if self._state.forehand == -1:
             # this is the action of the forehand player
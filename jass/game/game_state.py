@@ -6,8 +6,8 @@ import logging
 import numpy as np
 
 from jass.game.const import JASS_SCHIEBER, partner_player, next_player, card_ids
-from jass.game.game_util import convert_int_encoded_cards_to_str_encoded, \
-    convert_one_hot_encoded_cards_to_str_encoded_list, convert_str_encoded_cards_to_int_encoded
+from jass.game.game_util import convert_one_hot_encoded_hands_to_str_encoded_lists, \
+    convert_str_encoded_cards_to_int_encoded, convert_tricks_to_json
 
 
 class GameState:
@@ -125,37 +125,12 @@ class GameState:
         data['currentPlayer'] = int(self.player)
         data['forehand'] = int(self.forehand)
 
-        # played tricks
-        tricks = []
-
-        # tricks
-        for i in range(min(self.nr_tricks + 1, 9)):
-            # add at most one more trick as finished (for first player)
-            trick = {}
-            # add cards (if not empty)
-            cards = convert_int_encoded_cards_to_str_encoded(self.tricks[i, :].tolist())
-            if len(cards) > 0:
-                trick['cards'] = cards
-                if len(cards) == 4:
-                    # only add points and winners for complete tricks
-                    trick['points'] = int(self.trick_points[i])
-                    trick['win'] = int(self.trick_winner[i])
-
-            if self.trick_first_player[i] != -1:
-                trick['first'] = int(self.trick_first_player[i])
-            if trick:
-                # add if not empty dict
-                tricks.append(trick)
-
-        data['tricks'] = tricks
+        # played tricks, at most one more trick than the completed ones (for the first player)
+        data['tricks'] = convert_tricks_to_json(self.tricks, self.trick_points, self.trick_winner,
+                                                self.trick_first_player, self.nr_tricks)
 
         # cards in the hand of the players (empty if no more cards)
-        hand_empty = dict(hand=[])
-        player_data = [hand_empty, hand_empty, hand_empty, hand_empty]
-        for player in range(4):
-            hand = dict(hand=convert_one_hot_encoded_cards_to_str_encoded_list(self.hands[player]))
-            player_data[player] = hand
-            data['player'] = player_data
+        data['player'] = [dict(hand=hand) for hand in convert_one_hot_encoded_hands_to_str_encoded_lists(self.hands)]
 
         data['jassTyp'] = JASS_SCHIEBER
         return data
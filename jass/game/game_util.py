@@ -12,6 +12,14 @@ from jass.game.const import card_ids, card_strings, TRUMP_FULL_OFFSET, PUSH_ALT,
 Utilities
 """
 
+# card strings as plain python strings (indexing the numpy array card_strings returns numpy strings)
+_CARD_STRINGS = card_strings.tolist()
+
+# cache of the str encoded lists of one hot encoded hands, by the bytes of the hands, see
+# convert_one_hot_encoded_hands_to_str_encoded_lists
+_MAX_CACHED_HANDS = 100000
+_hands_cache = {}
+
 
 def get_cards_encoded(cards: List[int]) -> np.ndarray:
     """
@@ -65,7 +73,7 @@ def convert_int_encoded_cards_to_str_encoded(cards: List[int]) -> List[str]:
     Returns:
         list of the cards, str encoded
     """
-    return [card_strings[i] for i in cards if i != -1]
+    return [_CARD_STRINGS[i] for i in cards if i != -1]
 
 
 def convert_one_hot_encoded_cards_to_str_encoded_list(cards: np.ndarray) -> List[str]:
@@ -77,7 +85,73 @@ def convert_one_hot_encoded_cards_to_str_encoded_list(cards: np.ndarray) -> List
     Returns:
         list of the cards as str
     """
-    return [card_strings[i] for i in np.flatnonzero(cards)]
+    return [_CARD_STRINGS[i] for i in np.flatnonzero(cards).tolist()]
+
+
+def convert_one_hot_encoded_hands_to_str_encoded_lists(hands: np.ndarray) -> List[List[str]]:
+    """
+    Get the str encoded lists of one or more one hot encoded hands, i.e. the same result as calling
+    convert_one_hot_encoded_cards_to_str_encoded_list for each hand.
+
+    The same hands are often converted many times (for example the hands at the beginning of a game for each
+    label of the game, or the empty hands of completed games), so the results are cached by the content of the
+    array.
+
+    Args:
+        hands: the hands, 1-hot encoded, with shape [36] or [nr_hands, 36]
+
+    Returns:
+        list of the cards as str for each hand (one list for an array with shape [36])
+    """
+    key = (hands.dtype.char, hands.shape, hands.tobytes())
+    encoded = _hands_cache.get(key)
+    if encoded is None:
+        if len(_hands_cache) >= _MAX_CACHED_HANDS:
+            _hands_cache.clear()
+        encoded = tuple(tuple(_CARD_STRINGS[i] for i in np.flatnonzero(hand).tolist())
+                        for hand in hands.reshape(-1, 36))
+        _hands_cache[key] = encoded
+    # the lists are copied, so that the results can be modified
+    return [list(hand) for hand in encoded]
+
+
+def convert_tricks_to_json(tricks: np.ndarray, trick_points: np.ndarray, trick_winner: np.ndarray,
+                           trick_first_player: np.ndarray, nr_tricks: int) -> List[dict]:
+    """
+    Get the representation of the tricks of a game state or observation that can be converted to json.
+
+    At most one more trick than the completed ones is added, if it is not empty. Points and winners are only
+    added for complete tricks.
+
+    Args:
+        tricks: the cards of the tricks, int encoded, with shape [9, 4]
+        trick_points: the points of the tricks
+        trick_winner: the winners of the tricks
+        trick_first_player: the first players of the tricks
+        nr_tricks: the number of completed tricks
+
+    Returns:
+        list of the tricks as dict
+    """
+    nr_tricks_added = min(int(nr_tricks) + 1, 9)
+    tricks_list = tricks[0:nr_tricks_added].tolist()
+    points_list = trick_points[0:nr_tricks_added].tolist()
+    winner_list = trick_winner[0:nr_tricks_added].tolist()
+    first_list = trick_first_player[0:nr_tricks_added].tolist()
+    result = []
+    for i in range(nr_tricks_added):
+        trick = {}
+        cards = [_CARD_STRINGS[card] for card in tricks_list[i] if card != -1]
+        if cards:
+            trick['cards'] = cards
+            if len(cards) == 4:
+                trick['points'] = points_list[i]
+                trick['win'] = winner_list[i]
+        if first_list[i] != -1:
+            trick['first'] = first_list[i]
+        if trick:
+            result.append(trick)
+    return result
 
 
 def convert_one_hot_encoded_cards_to_int_encoded_list(cards: np.ndarray):
@@ -111,16 +185,22 @@ def count_colors(cards: np.ndarray) -> np.ndarray:
     return result
 
 
-def deal_random_hand() -> np.ndarray:
+def deal_random_hand(rng: np.random.Generator = None) -> np.ndarray:
     """
     Deal random cards for each hand.
 
+    Args:
+        rng: random generator to use, the global numpy random state is used if None
+
     Returns:
         one hot encoded 4x36 array
     """
     # shuffle card ids
     cards = np.arange(0, 36, dtype=np.int32)
-    np.random.shuffle(cards)
+    if rng is None:
+        np.random.shuffle(cards)
+    else:
+        rng.shuffle(cards)
     hands = np.zeros(shape=[4, 36], dtype=np.int32)
 
     # convert to one hot encoded
@@ -0,0 +1,119 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+from typing import List
+
+import numpy as np
+
+from jass.game.const import JASS_SCHIEBER, card_strings
+from jass.game.game_observation import GameObservation
+from jass.game.game_state import GameState
+
+# json encoded strings of the cards and of the beginning of the observation, as written by json.dumps
+_CARD_JSON = ['"{}"'.format(card) for card in card_strings.tolist()]
+_VERSION_JSON = '{{"version": "{}", "trump": '.format(GameObservation.FORMAT_VERSION)
+_JASS_TYP_JSON = '"jassTyp": "{}"'.format(JASS_SCHIEBER)
+_HAND_EMPTY_JSON = '{"hand": []}'
+
+
+class ObservationJsonEncoder:
+    """
+    Encoder of observations to json (in the format V0.2), as they are sent to the player services.
+
+    The result is the same as json.dumps of GameObservation.to_json() (with the game id added), but it is written
+    in one pass from the arrays of the observation or directly from the game state, without creating the
+    dict and the intermediate lists. The parts of the json text are collected in a buffer that is reused for all
+    calls, so an encoder should not be shared between threads.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def encode(self, obs: GameObservation, game_id: int or None = 0) -> bytes:
+        """
+        Encode an observation.
+
+        Args:
+            obs: the observation
+            game_id: id of the game to add as gameId, None if no game id should be added
+        Returns:
+            the utf-8 encoded json of the observation
+        """
+        return self._encode(obs.dealer, obs.player, obs.player_view, obs.trump, obs.forehand, obs.tricks,
+                            obs.trick_points, obs.trick_winner, obs.trick_first_player, obs.nr_tricks,
+                            obs.hand if obs.player_view != -1 else None, game_id)
+
+    def encode_state(self, state: GameState, player: int, game_id: int or None = 0) -> bytes:
+        """
+        Encode the observation of a player from the game state, the result is the same as encode for the
+        observation created by observation_from_state.
+
+        Args:
+            state: the game state
+            player: player for which to encode the observation or -1 for the public observation
+            game_id: id of the game to add as gameId, None if no game id should be added
+        Returns:
+            the utf-8 encoded json of the observation
+        """
+        if player == -1:
+            hand = None
+        elif state.nr_played_cards < 36:
+            hand = state.hands[player]
+        else:
+            hand = np.zeros(36, dtype=np.int32)
+        return self._encode(state.dealer, state.player, player, state.trump, state.forehand, state.tricks,
+                            state.trick_points, state.trick_winner, state.trick_first_player, state.nr_tricks,
+                            hand, game_id)
+
+    def _encode(self, dealer: int, player: int, player_view: int, trump: int, forehand: int, tricks: np.ndarray,
+                trick_points: np.ndarray, trick_winner: np.ndarray, trick_first_player: np.ndarray, nr_tricks: int,
+                hand: np.ndarray or None, game_id: int or None) -> bytes:
+        parts = self._parts
+        parts.clear()
+        append = parts.append
+        append(_VERSION_JSON)
+        append('{}, "dealer": {}, "currentPlayer": {}, "playerView": {}, "forehand": {}, "tricks": ['.format(
+            int(trump), int(dealer), int(player), int(player_view), int(forehand)))
+
+        # the tricks as in GameObservation.to_json: at most one more trick than completed, if it is not empty
+        nr_tricks_written = min(int(nr_tricks) + 1, 9)
+        tricks_list = tricks[0:nr_tricks_written].tolist()
+        first_list = trick_first_player[0:nr_tricks_written].tolist()
+        separator = ''
+        for i in range(nr_tricks_written):
+            cards = [_CARD_JSON[card] for card in tricks_list[i] if card != -1]
+            first = first_list[i]
+            if not cards and first == -1:
+                continue
+            append(separator)
+            separator = ', '
+            append('{')
+            if cards:
+                append('"cards": [')
+                append(', '.join(cards))
+                append(']')
+                if len(cards) == 4:
+                    append(', "points": {}, "win": {}'.format(int(trick_points[i]), int(trick_winner[i])))
+                if first != -1:
+                    append(', ')
+            if first != -1:
+                append('"first": {}'.format(first))
+            append('}')
+
+        append('], "player": [')
+        for i in range(4):
+            if i > 0:
+                append(', ')
+            if i == player_view and hand is not None:
+                append('{"hand": [')
+                append(', '.join([_CARD_JSON[card] for card in np.flatnonzero(hand).tolist()]))
+                append(']}')
+            else:
+                append(_HAND_EMPTY_JSON)
+        append('], ')
+        append(_JASS_TYP_JSON)
+        if game_id is not None:
+            append(', "gameId": {}'.format(int(game_id)))
+        append('}')
+        return ''.join(parts).encode('utf-8')
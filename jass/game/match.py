@@ -280,11 +280,7 @@ class JassMatch:
         if self.errors:
             data['errors'] = self.errors
 
-        games = []
-        for i in range(self.nr_games):
-            game_data = self._games[i].to_json()
-            games.append(game_data)
-        data['games'] = games
+        data['games'] = [game.to_json() for game in self._games]
         return data
 
     @classmethod
@@ -0,0 +1,203 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+import copy
+
+import numpy as np
+
+from jass.game.const import team, next_player, card_values
+from jass.game.game_state import GameState
+from jass.game.rule_schieber import RuleSchieber
+
+# larger than any number of points in a game
+_INFINITY = 1000
+
+
+class PerfectInformationSolver:
+    """
+    Alpha-beta search for the value of a game with perfect information (all hands known), i.e. the points that
+    team 0 makes in the rest of the game if both teams play optimally.
+
+    The search only considers one card of each class of equivalent cards (see
+    RuleSchieber.get_equivalent_card_representatives), uses RuleSchieber.point_bounds to cut off positions whose
+    value is already determined by the window, and stores bounds on the values of the positions at the start of
+    each trick in a transposition table. The value of a position at the start of a trick only depends on the
+    remaining hands, the player that leads and the trump, so the table remains valid for other positions and
+    games with the same trump (it is cleared when the trump changes).
+    """
+
+    def __init__(self, rule: RuleSchieber = None, max_table_size: int = 1000000):
+        """
+        Args:
+            rule: the rule to use
+            max_table_size: maximal number of positions in the transposition table, the table is cleared if it gets
+                larger
+        """
+        self._rule = rule if rule is not None else RuleSchieber()
+        self._max_table_size = max_table_size
+        self._table = {}
+        self._trump = -1
+        self._state = None
+        self._nr_nodes = 0
+
+    @property
+    def nr_nodes(self) -> int:
+        """
+        Number of positions visited by all searches.
+        """
+        return self._nr_nodes
+
+    def clear(self) -> None:
+        """
+        Clear the transposition table.
+        """
+        self._table = {}
+
+    def solve(self, state: GameState) -> int:
+        """
+        Calculate the value of a position.
+
+        Args:
+            state: the game state, trump must have been declared
+        Returns:
+            the points team 0 makes in the rest of the game (including the cards already in the current trick)
+        """
+        self._start(state)
+        return self._search(-_INFINITY, _INFINITY)
+
+    def action_values(self, state: GameState) -> np.ndarray:
+        """
+        Calculate the value of each valid card of the current player.
+
+        Args:
+            state: the game state, trump must have been declared
+        Returns:
+            array of length 36 with the points that the team of the current player makes in the rest of the game
+            (including the cards already in the current trick) after playing the card, -1 for the cards that
+            are not valid
+        """
+        self._start(state)
+        values = np.full(36, -1, dtype=np.int32)
+        remaining = int(card_values[state.trump] @ state.hands.sum(axis=0)) + 5
+        if state.nr_cards_in_trick > 0:
+            remaining += int(card_values[state.trump, state.current_trick[0:state.nr_cards_in_trick]].sum())
+        player_team = team[state.player]
+        for card in np.flatnonzero(self._rule.get_valid_cards_from_state(self._state)):
+            value = self._search_card(card, -_INFINITY, _INFINITY)
+            values[card] = value if player_team == 0 else remaining - value
+        return values
+
+    def _start(self, state: GameState) -> None:
+        if state.trump != self._trump:
+            self.clear()
+            self._trump = state.trump
+        self._state = copy.deepcopy(state)
+        # the current trick must be a view of the tricks (which is not preserved by the copy)
+        if self._state.nr_tricks < 9:
+            self._state.tricks[self._state.nr_tricks] = state.tricks[state.nr_tricks] if state.current_trick is None \
+                else state.current_trick
+            self._state.current_trick = self._state.tricks[self._state.nr_tricks]
+
+    def _play(self, card: int) -> (int, int):
+        # play the card and return the points and the winner if the trick was completed
+        state = self._state
+        player = state.player
+        state.hands[player, card] = 0
+        state.current_trick[state.nr_cards_in_trick] = card
+        state.nr_played_cards += 1
+        if state.nr_cards_in_trick == 0:
+            state.trick_first_player[state.nr_tricks] = player
+        if state.nr_cards_in_trick < 3:
+            state.nr_cards_in_trick += 1
+            state.player = next_player[player]
+            return 0, -1
+        trick_nr = state.nr_tricks
+        points = self._rule.calc_points(state.current_trick, state.nr_played_cards == 36, state.trump)
+        winner = self._rule.calc_winner(state.current_trick, state.trick_first_player[trick_nr], state.trump)
+        state.trick_points[trick_nr] = points
+        state.trick_winner[trick_nr] = winner
+        state.points[team[winner]] += points
+        state.nr_tricks += 1
+        state.nr_cards_in_trick = 0
+        if state.nr_tricks < 9:
+            state.trick_first_player[state.nr_tricks] = winner
+            state.player = winner
+            state.current_trick = state.tricks[state.nr_tricks]
+        else:
+            state.player = -1
+        return points, winner
+
+    def _undo(self, card: int, player: int, points: int, winner: int) -> None:
+        state = self._state
+        if winner != -1:
+            if state.nr_tricks < 9:
+                state.trick_first_player[state.nr_tricks] = -1
+            state.nr_tricks -= 1
+            state.current_trick = state.tricks[state.nr_tricks]
+            state.points[team[winner]] -= points
+            state.trick_points[state.nr_tricks] = 0
+            state.trick_winner[state.nr_tricks] = -1
+            state.nr_cards_in_trick = 3
+        else:
+            state.nr_cards_in_trick -= 1
+        state.current_trick[state.nr_cards_in_trick] = -1
+        state.nr_played_cards -= 1
+        state.hands[player, card] = 1
+        state.player = player
+
+    def _search_card(self, card: int, alpha: int, beta: int) -> int:
+        # value of the position after playing the card, including the points of the trick if it is completed
+        player = self._state.player
+        points, winner = self._play(card)
+        gained = points if winner != -1 and team[winner] == 0 else 0
+        value = gained + self._search(alpha - gained, beta - gained)
+        self._undo(card, player, points, winner)
+        return value
+
+    def _search(self, alpha: int, beta: int) -> int:
+        state = self._state
+        if state.nr_played_cards == 36:
+            return 0
+        self._nr_nodes += 1
+        lower, upper = self._rule.point_bounds(state)
+        key = None
+        if state.nr_cards_in_trick == 0:
+            key = state.hands.tobytes() + bytes([state.player])
+            entry = self._table.get(key)
+            if entry is not None:
+                lower = max(lower, entry[0])
+                upper = min(upper, entry[1])
+        if lower >= upper or lower >= beta:
+            return lower
+        if upper <= alpha:
+            return upper
+        alpha = max(alpha, lower)
+        beta = min(beta, upper)
+        window = alpha, beta
+
+        maximize = team[state.player] == 0
+        best = -_INFINITY if maximize else _INFINITY
+        for card in np.flatnonzero(self._rule.get_valid_cards_reduced_from_state(state)):
+            value = self._search_card(card, alpha, beta)
+            if maximize:
+                if value > best:
+                    best = value
+                    alpha = max(alpha, value)
+            elif value < best:
+                best = value
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        if key is not None:
+            if len(self._table) >= self._max_table_size:
+                self._table = {}
+            # the search is fail soft: a value outside of the window is a bound on the true value
+            if best <= window[0]:
+                self._table[key] = (lower, best)
+            elif best >= window[1]:
+                self._table[key] = (best, upper)
+            else:
+                self._table[key] = (best, best)
+        return best
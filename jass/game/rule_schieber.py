@@ -5,10 +5,20 @@
 import numpy as np
 
 from jass.game.const import color_of_card, color_masks, J_offset, higher_trump, lower_trump, card_values, UNE_UFE, \
-    OBE_ABE, next_player, partner_player
+    OBE_ABE, next_player, partner_player, team, A_offset, K_offset, Q_offset, Ten_offset, Nine_offset, \
+    Eight_offset, Seven_offset, Six_offset
+from jass.game.game_observation import GameObservation
 from jass.game.game_rule import GameRule
 from jass.game.game_state import GameState
 
+# offsets of the cards of a color from the highest to the lowest card, for trump, for obe (and colors that are not
+# trump) and for une
+trump_card_order = [J_offset, Nine_offset, A_offset, K_offset, Q_offset, Ten_offset, Eight_offset, Seven_offset,
+                    Six_offset]
+obe_card_order = [A_offset, K_offset, Q_offset, J_offset, Ten_offset, Nine_offset, Eight_offset, Seven_offset,
+                  Six_offset]
+une_card_order = obe_card_order[::-1]
+
 
 class RuleSchieber(GameRule):
     """
@@ -146,6 +156,84 @@ class RuleSchieber(GameRule):
                         not_lower_trump_cards = 1 - lower_trump_cards
                         return hand * not_lower_trump_cards
 
+    def get_equivalent_card_representatives(self, valid_cards: np.ndarray,
+                                            played_cards: np.ndarray,
+                                            trump: int,
+                                            respect_points: bool = True) -> np.ndarray:
+        """
+        Reduce the valid cards to one representative for each class of equivalent cards. Two valid cards are
+        equivalent if they have the same color and all cards between them (in the order of the cards for the trump)
+        are also valid cards or have already been played in a completed trick. Playing either card then leads to the
+        same tricks, so a search only needs to consider one of them.
+
+        Equivalent cards can still have different points (e.g. DK and DQ after DA has been played), so by default
+        they are only put into the same class if they also have the same points. With respect_points=False the
+        reduction is stronger, which can be useful to order moves in a search, but it does not preserve the points.
+
+        Args:
+            valid_cards: one-hot encoded valid cards, as returned by get_valid_cards
+            played_cards: one-hot encoded cards that have been played in completed tricks (cards in the current
+                trick must not be included)
+            trump: trump for the round
+            respect_points: only consider cards with the same points as equivalent
+        Returns:
+            one-hot encoded representatives (the highest card of each class)
+        """
+        representatives = np.zeros(36, dtype=np.int32)
+        values = card_values[trump]
+        for color in range(4):
+            if not valid_cards[color * 9:color * 9 + 9].any():
+                continue
+            if color == trump:
+                order = trump_card_order
+            elif trump == UNE_UFE:
+                order = une_card_order
+            else:
+                order = obe_card_order
+            # the value of the current class, None if no class is open
+            class_value = None
+            for offset in order:
+                card = color * 9 + offset
+                if valid_cards[card]:
+                    if class_value is None or (respect_points and values[card] != class_value):
+                        representatives[card] = 1
+                        class_value = values[card]
+                elif not played_cards[card]:
+                    class_value = None
+        return representatives
+
+    def get_valid_cards_reduced_from_state(self, state: GameState, respect_points: bool = True) -> np.ndarray:
+        """
+        Get the valid cards from the state for the current player, with only one card of each class of
+        equivalent cards (see get_equivalent_card_representatives).
+
+        Args:
+            state: The current state of the game
+            respect_points: only consider cards with the same points as equivalent
+        Returns:
+            one-hot encoded array of the representatives of the valid cards
+        """
+        played_cards = np.zeros(36, dtype=np.int32)
+        played_cards[state.tricks[0:state.nr_tricks].flatten()] = 1
+        return self.get_equivalent_card_representatives(self.get_valid_cards_from_state(state), played_cards,
+                                                        state.trump, respect_points)
+
+    def get_valid_cards_reduced_from_obs(self, obs: GameObservation, respect_points: bool = True) -> np.ndarray:
+        """
+        Get the valid cards from the observation, with only one card of each class of equivalent cards (see
+        get_equivalent_card_representatives).
+
+        Args:
+            obs: Observation of the game from players point of view
+            respect_points: only consider cards with the same points as equivalent
+        Returns:
+            one-hot encoded array of the representatives of the valid cards
+        """
+        played_cards = np.zeros(36, dtype=np.int32)
+        played_cards[obs.tricks[0:obs.nr_tricks].flatten()] = 1
+        return self.get_equivalent_card_representatives(self.get_valid_cards_from_obs(obs), played_cards,
+                                                        obs.trump, respect_points)
+
     def calc_points(self, trick: np.ndarray, is_last: bool, trump: int = -1) -> int:
         """
         Calculate the points from the cards in the trick according to the given trump
@@ -231,6 +319,86 @@ class RuleSchieber(GameRule):
         # adjust actual winner by first player
         return (first_player - winner) % 4
 
+    def point_bounds(self, state: GameState) -> (int, int):
+        """
+        Calculate bounds on the points that team 0 can still make in the remaining tricks (including the cards
+        already played in the current trick and the bonus for the last trick). Team 0 can make at least the lower
+        bound and team 1 can prevent team 0 from getting more than the upper bound, if both teams play the
+        cards that are sure to make a trick. The points already made are in state.points.
+
+        Cards that are sure to make a trick for a team are:
+        - trumps that are higher than all trumps of the other team (including the trumps in the current trick)
+        - if a player of the team leads the trick, the sequence of the highest cards of each color in the hand
+          of the player, for obe or une or if the other team has no more trumps
+
+        The last trick is evaluated exactly. The method is fast enough to be used at each node in a search.
+
+        Args:
+            state: the game state, trump must have been declared
+        Returns:
+            lower and upper bound on the points of team 0 in the rest of the game
+        """
+        if state.nr_played_cards == 36:
+            return 0, 0
+
+        # cards of each team, including the cards played in the current trick
+        team_cards = np.zeros([2, 36], dtype=np.int32)
+        team_cards[0] = state.hands[0] + state.hands[2]
+        team_cards[1] = state.hands[1] + state.hands[3]
+        first_player = state.trick_first_player[state.nr_tricks]
+        for i in range(state.nr_cards_in_trick):
+            team_cards[team[(first_player - i) % 4], state.current_trick[i]] = 1
+        remaining = team_cards[0] + team_cards[1]
+
+        values = card_values[state.trump]
+        total = int(values @ remaining) + 5
+
+        if state.nr_tricks == 8:
+            # last trick, all cards are determined
+            trick = state.current_trick.copy()
+            for i in range(state.nr_cards_in_trick, 4):
+                trick[i] = np.flatnonzero(state.hands[(first_player - i) % 4])[0]
+            if team[self.calc_winner(trick, first_player, state.trump)] == 0:
+                return total, total
+            else:
+                return 0, 0
+
+        sure_0 = self._sure_cards(state, team_cards, remaining, 0)
+        sure_1 = self._sure_cards(state, team_cards, remaining, 1)
+        return int(values @ sure_0), total - int(values @ sure_1)
+
+    @staticmethod
+    def _sure_cards(state: GameState, team_cards: np.ndarray, remaining: np.ndarray, team_nr: int) -> np.ndarray:
+        """
+        Get the cards of a team that are sure to be in a trick that is won by the team.
+        """
+        sure = np.zeros(36, dtype=np.int32)
+        own = team_cards[team_nr]
+        other = team_cards[1 - team_nr]
+        other_has_trump = False
+        if state.trump < OBE_ABE:
+            other_has_trump = bool((other * color_masks[state.trump]).any())
+            for offset in trump_card_order:
+                card = state.trump * 9 + offset
+                if other[card]:
+                    break
+                if own[card]:
+                    sure[card] = 1
+
+        if state.nr_cards_in_trick == 0 and team[state.player] == team_nr and not other_has_trump:
+            hand = state.hands[state.player]
+            order = une_card_order if state.trump == UNE_UFE else obe_card_order
+            for color in range(4):
+                if color == state.trump:
+                    continue
+                for offset in order:
+                    card = color * 9 + offset
+                    if hand[card]:
+                        sure[card] = 1
+                    elif remaining[card]:
+                        break
+        return sure
+
     def assert_invariants(self, state: GameState) -> None:
         """
         Validates the internal consistency of the state according to the rules and throws an assertion exception if an
@@ -0,0 +1,571 @@
+# HSLU
+#
+# Created on 18.10.2026
+#
+"""
+Bulk decoding of files of GameLogEntry and GameObsActionLogEntry into numpy arrays.
+
+Decoding the entries one by one with json.loads and GameLogEntry.from_json (or GameObsActionLogEntry.from_json)
+is slow for large files, as a dict and a GameState is created for each line, the cards are converted trick by
+trick and the date is parsed with strptime. The functions here parse many lines at once into preallocated arrays
+(cards as int8, dates as seconds since the epoch), which can be used directly or converted to the entries of
+single lines.
+
+Only the lines in the format written by LogEntryFileGenerator are parsed this way, which is checked with a regular
+expression per line. In these lines, the position of each value follows from the values before it, so all lines
+can be read in parallel with numpy operations (see _LineReader), e.g. the first card of the first trick of all
+lines at once. Other lines (for example with a different order of the keys, with spaces or older versions of the
+format) are parsed with json.loads. The same fields are checked as in from_json.
+"""
+import calendar
+import functools
+import json
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from jass.game.const import DATE_FORMAT, card_strings, next_player, partner_player
+from jass.game.game_observation import GameObservation
+from jass.game.game_state import GameState
+from jass.logs.game_log_entry import GameLogEntry
+from jass.logs.game_obs_action_log_entry import GameObsActionLogEntry
+
+# card ids by card string, as plain python dict
+_CARD_IDS = {card: i for i, card in enumerate(card_strings.tolist())}
+
+# card ids by the first two bytes of the card string as little endian number (the third byte of the cards with
+# 10 is 0)
+_CARD_TABLE = np.full(256 * 256, -1, dtype=np.int8)
+_CARD_TABLE[[ord(card[0]) + ord(card[1]) * 256 for card in _CARD_IDS]] = list(_CARD_IDS.values())
+
+# the date part of DATE_FORMAT, the time part is parsed directly from the fixed positions
+_DAY_FORMAT = '%d.%m.%y'
+_EPOCH = datetime(1970, 1, 1)
+
+# the lines as written by LogEntryFileGenerator (with separators (',', ':')) in the format of to_json: complete
+# tricks, followed by an incomplete trick (with or without first player), and the hands of the players. The
+# numbers have at most 18 digits (so they fit into int64) and the strings contain no escaped characters.
+_INT = r'-?(?:0|[1-9][0-9]{0,17})'
+_STR = r'"[^"\\\x00-\x1f]*"'
+_CARD = r'"[DHSC](?:[6-9JQKA]|10)"'
+_COMPLETE_TRICK = r'\{"cards":\[<c>,<c>,<c>,<c>\],"points":<n>,"win":<n>,"first":<n>\}'
+_INCOMPLETE_TRICK = r'\{(?:"cards":\[<c>(?:,<c>){0,3}\](?:,"first":<n>)?|"first":<n>)\}'
+_STATE = r'"version":' + re.escape('"' + GameState.FORMAT_VERSION + '"') + \
+    r',"trump":<n>,"dealer":<n>,"currentPlayer":<n>,<v>"forehand":<n>,' + \
+    r'"tricks":\[(?:{1}|{0}(?:,{0}){{0,7}}(?:,(?:{0}|{1}))?)?\],'.format(_COMPLETE_TRICK, _INCOMPLETE_TRICK) + \
+    r'"player":\[' + ','.join([r'\{"hand":\[(?:<c>(?:,<c>)*)?\]\}'] * 4) + r'\],"jassTyp":<s>'
+
+
+def _line_pattern(pattern: str) -> re.Pattern:
+    pattern = pattern.replace('<n>', _INT).replace('<s>', _STR).replace('<c>', _CARD)
+    return re.compile((pattern + r'[ \t\r\n]*').encode())
+
+
+_GAME_LOG_LINE = _line_pattern(r'\{"game":\{' + _STATE.replace('<v>', '') +
+                               r'\},"date":<s>,"player_ids":\[<n>,<n>,<n>,<n>\]\}')
+_OBS_ACTION_LINE = _line_pattern(r'\{"obs":\{' + _STATE.replace('<v>', '"playerView":<n>,') +
+                                 r'\},"action":<n>,"date":<s>,"player_id":<n>\}')
+
+# a trick as (cards, points, winner, first player), the values that are not present are None
+Trick = Tuple[List[str] or None, int or None, int or None, int or None]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_day(day: str) -> int:
+    return calendar.timegm(datetime.strptime(day, _DAY_FORMAT).timetuple())
+
+
+def parse_date(date: str) -> int:
+    """
+    Parse a date in DATE_FORMAT. The dates in a log file usually only differ in few days, so the day is parsed
+    with strptime only once and cached, and the time is added.
+
+    Args:
+        date: the date as string
+    Returns:
+        the seconds since the epoch (of the date as UTC)
+    """
+    hour, minute, second = date[9:11], date[12:14], date[15:17]
+    if len(date) == 17 and date[8] == ' ' and date[11] == ':' and date[14] == ':' and \
+            hour.isdigit() and minute.isdigit() and second.isdigit():
+        hour, minute, second = int(hour), int(minute), int(second)
+        if hour < 24 and minute < 60 and second < 60:
+            return _parse_day(date[0:8]) + hour * 3600 + minute * 60 + second
+    return calendar.timegm(datetime.strptime(date, DATE_FORMAT).timetuple())
+
+
+def date_from_epoch(seconds: int) -> datetime:
+    """
+    Convert the seconds since the epoch returned by parse_date to the date as read by from_json.
+    """
+    return _EPOCH + timedelta(seconds=int(seconds))
+
+
+def _parse_dates(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse dates in DATE_FORMAT, given as bytes with shape [nr_dates, 17].
+
+    Returns:
+        the seconds since the epoch (see parse_date) and whether the dates could be parsed, the other dates
+        must be parsed by parse_date
+    """
+    digits = dates[:, [0, 1, 3, 4, 6, 7, 9, 10, 12, 13, 15, 16]].astype(np.int64) - ord('0')
+    valid = np.all((digits >= 0) & (digits <= 9), axis=1)
+    valid &= np.all(dates[:, [2, 5, 8, 11, 14]] == np.frombuffer(b'.. ::', dtype=np.uint8), axis=1)
+    day, month, year, hour, minute, second = (digits[:, 0::2] * 10 + digits[:, 1::2]).T
+    # %y is in 1969 to 2068
+    year = np.where(year < 69, year + 2000, year + 1900)
+    valid &= (month >= 1) & (month <= 12) & (hour < 24) & (minute < 60) & (second < 60)
+    first_of_month = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + np.clip(month - 1, 0, 11)
+    days_in_month = ((first_of_month + 1).astype('datetime64[D]') - first_of_month.astype('datetime64[D]'))
+    valid &= (day >= 1) & (day <= days_in_month.astype(np.int64))
+    days = first_of_month.astype('datetime64[D]').astype(np.int64) + day - 1
+    return days * 86400 + hour * 3600 + minute * 60 + second, valid
+
+
+def _parse_numbers(buffer: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the integers starting at the given positions, which are known to be in the json format.
+
+    Returns:
+        the values and the end positions of the numbers
+    """
+    negative = buffer[starts] == ord('-')
+    positions = starts + negative
+    values = np.zeros(len(starts), dtype=np.int64)
+    active = np.ones(len(starts), dtype=bool)
+    while True:
+        digits = buffer[positions] - np.uint8(ord('0'))
+        active &= digits <= 9
+        if not np.any(active):
+            return np.where(negative, -values, values), positions
+        values = np.where(active, values * 10 + digits, values)
+        positions += active
+
+
+class _LineReader:
+    """
+    Reader of json formatted lines, which reads the values of all lines in parallel. Only the lines that match the
+    format of to_json (see _GAME_LOG_LINE and _OBS_ACTION_LINE) are read, in which the position of each value
+    follows from the values before it: the reader keeps the current position of each line, which is advanced over
+    the values and the text between them. The lines are given as indices into rows, all lines if not given.
+    """
+    def __init__(self, lines: List[str], pattern: re.Pattern):
+        text = ''.join(lines)
+        self._data = text.encode('utf-8')
+        if len(self._data) == len(text):
+            lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+        else:
+            lengths = np.fromiter((len(line.encode('utf-8')) for line in lines), dtype=np.int64, count=len(lines))
+        ends = np.cumsum(lengths).tolist()
+        starts = [0] + ends[:-1]
+        match = pattern.fullmatch
+        self.decodable = np.fromiter((match(self._data, start, end) is not None for start, end in zip(starts, ends)),
+                                     dtype=bool, count=len(lines))
+        self.rows = np.flatnonzero(self.decodable)
+        self.positions = np.array(starts, dtype=np.int64)[self.rows]
+        self._buffer = np.frombuffer(self._data, dtype=np.uint8)
+        # the two bytes starting at each position, as little endian number
+        self._pairs = np.ndarray(shape=(max(len(self._data) - 1, 0),), dtype='<u2', buffer=self._data, strides=(1,))
+
+    def skip(self, text: str, lines: np.ndarray = slice(None)) -> None:
+        """
+        Skip a text, which is known to be at the positions of the lines.
+        """
+        self.positions[lines] += len(text)
+
+    def peek(self, lines: np.ndarray = slice(None), offset: int = 0) -> np.ndarray:
+        """
+        Get the bytes at an offset from the positions of the lines.
+        """
+        return self._buffer[self.positions[lines] + offset]
+
+    def number(self, lines: np.ndarray = slice(None)) -> np.ndarray:
+        """
+        Read integers.
+        """
+        values, self.positions[lines] = _parse_numbers(self._buffer, self.positions[lines])
+        return values
+
+    def string(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read strings (without escaped characters) of all lines.
+
+        Returns:
+            the start and end positions of the characters of the strings
+        """
+        starts = self.positions + 1
+        ends = starts.copy()
+        lines = np.arange(len(ends))
+        # short strings are searched in parallel, the end of longer strings one by one
+        for _ in range(32):
+            lines = lines[self._buffer[ends[lines]] != ord('"')]
+            if len(lines) == 0:
+                break
+            ends[lines] += 1
+        for line in lines.tolist():
+            ends[line] = self._data.index(b'"', ends[line])
+        self.positions = ends + 1
+        return starts, ends
+
+    def dates(self) -> np.ndarray:
+        """
+        Read dates of all lines, as seconds since the epoch (see parse_date).
+        """
+        starts, ends = self.string()
+        positions = np.minimum(starts[:, np.newaxis] + np.arange(17), len(self._buffer) - 1)
+        seconds, valid = _parse_dates(self._buffer[positions])
+        for i in np.flatnonzero(~valid | (ends - starts != 17)).tolist():
+            seconds[i] = parse_date(self._data[starts[i]:ends[i]].decode('utf-8'))
+        return seconds
+
+    def cards(self, lines: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Read lists of cards, starting after the opening bracket and ending at the closing bracket.
+
+        Returns:
+            the lines and the card ids of the first cards of the lists, then of the second cards and so on
+        """
+        lines = lines[self.peek(lines) != ord(']')]
+        while len(lines) > 0:
+            positions = self.positions[lines]
+            yield lines, _CARD_TABLE[self._pairs[positions + 1]]
+            # the card strings have two characters, except the cards with 10
+            positions += 4 + (self._buffer[positions + 2] == ord('1'))
+            more = self._buffer[positions] == ord(',')
+            self.positions[lines] = positions + more
+            lines = lines[more]
+
+
+class _GameArrays:
+    """
+    Arrays of the information common to games and observations.
+    """
+    def __init__(self, nr_entries: int, hand_shape: Tuple[int, ...]):
+        self.dealer = np.full(nr_entries, -1, dtype=np.int8)
+        self.player = np.full(nr_entries, -1, dtype=np.int8)
+        self.trump = np.full(nr_entries, -1, dtype=np.int8)
+        self.forehand = np.full(nr_entries, -1, dtype=np.int8)
+        self.declared_trump = np.full(nr_entries, -1, dtype=np.int8)
+        self.tricks = np.full([nr_entries, 9, 4], -1, dtype=np.int8)
+        self.trick_winner = np.full([nr_entries, 9], -1, dtype=np.int8)
+        self.trick_points = np.zeros([nr_entries, 9], dtype=np.int16)
+        self.trick_first_player = np.full([nr_entries, 9], -1, dtype=np.int8)
+        self.nr_played_cards = np.zeros(nr_entries, dtype=np.int8)
+        self.points = np.zeros([nr_entries, 2], dtype=np.int16)
+        self.date = np.zeros(nr_entries, dtype=np.int64)
+        self._hands = np.zeros((nr_entries,) + hand_shape, dtype=np.int8)
+
+    def __len__(self):
+        return len(self.dealer)
+
+    def _set_trick(self, entry: int, index: int, trick: Trick) -> None:
+        cards, points, win, first = trick
+        if cards is not None:
+            self.tricks[entry, index, 0:len(cards)] = [_CARD_IDS[card] for card in cards]
+            self.nr_played_cards[entry] += len(cards)
+        if points is not None:
+            self.trick_points[entry, index] = points
+        if win is not None:
+            self.trick_winner[entry, index] = win
+        if first is not None:
+            self.trick_first_player[entry, index] = first
+        else:
+            logging.getLogger(__name__).error('No first player set in trick {}'.format(index))
+
+    def _set_hand(self, entry: int, player: int, cards: List[str]) -> None:
+        raise NotImplementedError()
+
+    def _set_hands(self, entries: np.ndarray, players: np.ndarray, cards: np.ndarray) -> None:
+        raise NotImplementedError()
+
+    def _read_state(self, reader: _LineReader, player_view: np.ndarray = None) -> None:
+        """
+        Read the information of a GameState or GameObservation in the decodable lines, from the trump to the end
+        of the state (after the player view if given).
+        """
+        rows = reader.rows
+        self.trump[rows] = reader.number()
+        reader.skip(',"dealer":')
+        self.dealer[rows] = reader.number()
+        reader.skip(',"currentPlayer":')
+        self.player[rows] = reader.number()
+        if player_view is not None:
+            reader.skip(',"playerView":')
+            player_view[rows] = reader.number()
+        reader.skip(',"forehand":')
+        self.forehand[rows] = reader.number()
+
+        # complete tricks, followed by an incomplete trick (with or without first player)
+        reader.skip(',"tricks":[')
+        lines = np.flatnonzero(reader.peek() == ord('{'))
+        for index in range(9):
+            reader.skip('{', lines)
+            with_cards = lines[reader.peek(lines, 1) == ord('c')]
+            reader.skip('"cards":[', with_cards)
+            for card, (card_lines, cards) in enumerate(reader.cards(with_cards)):
+                self.tricks[rows[card_lines], index, card] = cards
+            reader.skip(']', with_cards)
+            complete = with_cards[reader.peek(with_cards, 2) == ord('p')]
+            reader.skip(',"points":', complete)
+            self.trick_points[rows[complete], index] = reader.number(complete)
+            reader.skip(',"win":', complete)
+            self.trick_winner[rows[complete], index] = reader.number(complete)
+            reader.skip(',', with_cards[reader.peek(with_cards) == ord(',')])
+            first = lines[reader.peek(lines, 1) == ord('f')]
+            reader.skip('"first":', first)
+            self.trick_first_player[rows[first], index] = reader.number(first)
+            for _ in range(len(lines) - len(first)):
+                logging.getLogger(__name__).error('No first player set in trick {}'.format(index))
+            reader.skip('}', lines)
+            lines = lines[reader.peek(lines) == ord(',')]
+            reader.skip(',', lines)
+        self.nr_played_cards[rows] = np.count_nonzero(self.tricks[rows] >= 0, axis=(1, 2))
+
+        # the hands in the order of the players
+        reader.skip('],"player":[')
+        entries, players, hands = [], [], []
+        for player in range(4):
+            reader.skip('{"hand":[' if player == 0 else ',{"hand":[')
+            for card_lines, cards in reader.cards(np.arange(len(rows))):
+                entries.append(rows[card_lines])
+                players.append(np.full(len(card_lines), player))
+                hands.append(cards)
+            reader.skip(']}')
+        if len(entries) > 0:
+            self._set_hands(np.concatenate(entries), np.concatenate(players), np.concatenate(hands))
+        reader.skip('],"jassTyp":')
+        reader.string()
+        reader.skip('}')
+
+    def _set_json(self, entry: int, data: dict, dealer: int, player: int, trump: int, forehand: int,
+                  date: str) -> None:
+        self.dealer[entry] = dealer
+        self.player[entry] = player
+        self.trump[entry] = trump
+        self.forehand[entry] = forehand
+        self.date[entry] = parse_date(date)
+        for index, trick in enumerate(data['tricks']):
+            self._set_trick(entry, index, (trick.get('cards'), trick.get('points'), trick.get('win'),
+                                           trick.get('first')))
+        for i, player_data in enumerate(data['player']):
+            if len(player_data.get('hand', [])) > 0:
+                self._set_hand(entry, i, player_data['hand'])
+
+    def _set_derived(self) -> None:
+        # derived information, as calculated in from_json
+        declared = np.where(self.forehand == 1, np.take(next_player, self.dealer),
+                            np.take(partner_player, np.take(next_player, self.dealer)))
+        self.declared_trump[:] = np.where(self.trump != -1, declared, -1)
+        completed = np.arange(9) < (self.nr_played_cards // 4)[:, np.newaxis]
+        team_0 = (self.trick_winner == 0) | (self.trick_winner == 2)
+        self.points[:, 0] = np.sum(self.trick_points * (completed & team_0), axis=1)
+        self.points[:, 1] = np.sum(self.trick_points * (completed & ~team_0), axis=1)
+
+    def _fill(self, obj, index: int) -> None:
+        # set the common information of a GameState or GameObservation
+        obj.dealer = int(self.dealer[index])
+        obj.player = int(self.player[index])
+        obj.trump = int(self.trump[index])
+        obj.forehand = int(self.forehand[index])
+        obj.declared_trump = int(self.declared_trump[index])
+        obj.tricks[:, :] = self.tricks[index]
+        obj.trick_winner[:] = self.trick_winner[index]
+        obj.trick_points[:] = self.trick_points[index]
+        obj.trick_first_player[:] = self.trick_first_player[index]
+        obj.nr_played_cards = int(self.nr_played_cards[index])
+        obj.nr_tricks, obj.nr_cards_in_trick = divmod(obj.nr_played_cards, 4)
+        obj.current_trick = obj.tricks[obj.nr_tricks] if obj.nr_played_cards != 36 else None
+        obj.points[:] = self.points[index]
+
+
+class GameLogArrays(_GameArrays):
+    """
+    The games of GameLogEntry lines as arrays, the first dimension is the entry.
+    """
+    def __init__(self, nr_entries: int):
+        super().__init__(nr_entries, (4, 36))
+        self.player_ids = np.zeros([nr_entries, 4], dtype=np.int64)
+
+    @property
+    def hands(self) -> np.ndarray:
+        """
+        The hands of the players, with shape [nr_entries, 4, 36] (empty for completed games).
+        """
+        return self._hands
+
+    def _set_hand(self, entry: int, player: int, cards: List[str]) -> None:
+        self._hands[entry, player, [_CARD_IDS[card] for card in cards]] = 1
+
+    def _set_hands(self, entries: np.ndarray, players: np.ndarray, cards: np.ndarray) -> None:
+        self._hands[entries, players, cards] = 1
+
+    def get_state(self, index: int) -> GameState:
+        """
+        Get the game of an entry, as read by GameState.from_json.
+        """
+        state = GameState()
+        self._fill(state, index)
+        state.hands[:, :] = self._hands[index]
+        return state
+
+    def get_entry(self, index: int) -> GameLogEntry:
+        """
+        Get an entry, as read by GameLogEntry.from_json.
+        """
+        return GameLogEntry(game=self.get_state(index), date=date_from_epoch(self.date[index]),
+                            player_ids=self.player_ids[index].tolist())
+
+
+class ObsActionLogArrays(_GameArrays):
+    """
+    The observations and actions of GameObsActionLogEntry lines as arrays, the first dimension is the entry.
+    """
+    def __init__(self, nr_entries: int):
+        super().__init__(nr_entries, (36,))
+        self.player_view = np.full(nr_entries, -1, dtype=np.int8)
+        self.action = np.zeros(nr_entries, dtype=np.int8)
+        self.player_id = np.zeros(nr_entries, dtype=np.int64)
+
+    @property
+    def hand(self) -> np.ndarray:
+        """
+        The hand of the player of the observation, with shape [nr_entries, 36].
+        """
+        return self._hands
+
+    def _set_hand(self, entry: int, player: int, cards: List[str]) -> None:
+        # the cards are set in the hand of the observation even for another player, as in from_json
+        if player != self.player_view[entry]:
+            logging.getLogger(__name__).error('Hand data for wrong player {}'.format(player))
+        self._hands[entry, [_CARD_IDS[card] for card in cards]] = 1
+
+    def _set_hands(self, entries: np.ndarray, players: np.ndarray, cards: np.ndarray) -> None:
+        wrong = players != self.player_view[entries]
+        for player in sorted(set(zip(entries[wrong].tolist(), players[wrong].tolist()))):
+            logging.getLogger(__name__).error('Hand data for wrong player {}'.format(player[1]))
+        self._hands[entries, cards] = 1
+
+    def get_observation(self, index: int) -> GameObservation:
+        """
+        Get the observation of an entry, as read by GameObservation.from_json.
+        """
+        obs = GameObservation()
+        self._fill(obs, index)
+        obs.player_view = int(self.player_view[index])
+        obs.hand[:] = self._hands[index]
+        return obs
+
+    def get_entry(self, index: int) -> GameObsActionLogEntry:
+        """
+        Get an entry, as read by GameObsActionLogEntry.from_json.
+        """
+        return GameObsActionLogEntry(obs=self.get_observation(index), action=int(self.action[index]),
+                                     date=date_from_epoch(self.date[index]), player_id=int(self.player_id[index]))
+
+
+def _check_version(data: dict, required: bool, line_nr: int) -> None:
+    if ('version' in data or required) and data.get('version') != GameState.FORMAT_VERSION:
+        logging.getLogger(__name__).error('Unexpected format version: {}'.format(data.get('version')))
+        raise ValueError('Unexpected format version in line {}'.format(line_nr))
+
+
+def decode_game_log_lines(lines: Iterable[str]) -> GameLogArrays:
+    """
+    Decode json formatted GameLogEntry lines.
+
+    Args:
+        lines: the lines
+    Returns:
+        the entries as arrays
+    """
+    lines = lines if isinstance(lines, list) else list(lines)
+    arrays = GameLogArrays(len(lines))
+
+    def decode_json(entry: int, data: dict):
+        game = data['game']
+        _check_version(game, False, entry)
+        if len(data['player_ids']) != 4:
+            raise ValueError('Expected 4 player ids in line {}'.format(entry))
+        trump = game.get('trump', -1)
+        # previous versions of the format only contained tss (trump was selected by the partner)
+        if 'forehand' in game:
+            forehand = game['forehand']
+        elif 'tss' in game and game['tss'] == 1:
+            forehand = 0
+        else:
+            forehand = 1 if trump != -1 else -1
+        arrays._set_json(entry, game, game['dealer'], game.get('currentPlayer', -1), trump, forehand, data['date'])
+        arrays.player_ids[entry] = data['player_ids']
+
+    reader = _LineReader(lines, _GAME_LOG_LINE)
+    for entry in np.flatnonzero(~reader.decodable).tolist():
+        decode_json(entry, json.loads(lines[entry]))
+    rows = reader.rows
+    reader.skip('{"game":{"version":"' + GameState.FORMAT_VERSION + '","trump":')
+    arrays._read_state(reader)
+    reader.skip(',"date":')
+    arrays.date[rows] = reader.dates()
+    reader.skip(',"player_ids":[')
+    for i in range(4):
+        arrays.player_ids[rows, i] = reader.number()
+        reader.skip(',')
+    arrays._set_derived()
+    return arrays
+
+
+def decode_obs_action_lines(lines: Iterable[str]) -> ObsActionLogArrays:
+    """
+    Decode json formatted GameObsActionLogEntry lines.
+
+    Args:
+        lines: the lines
+    Returns:
+        the entries as arrays
+    """
+    lines = lines if isinstance(lines, list) else list(lines)
+    arrays = ObsActionLogArrays(len(lines))
+
+    def decode_json(entry: int, data: dict):
+        obs = data['obs']
+        _check_version(obs, True, entry)
+        arrays.player_view[entry] = obs['playerView']
+        arrays._set_json(entry, obs, obs['dealer'], obs['currentPlayer'], obs['trump'], obs['forehand'],
+                         data['date'])
+        arrays.action[entry] = int(data['action'])
+        arrays.player_id[entry] = int(data['player_id'])
+
+    reader = _LineReader(lines, _OBS_ACTION_LINE)
+    for entry in np.flatnonzero(~reader.decodable).tolist():
+        decode_json(entry, json.loads(lines[entry]))
+    rows = reader.rows
+    reader.skip('{"obs":{"version":"' + GameState.FORMAT_VERSION + '","trump":')
+    # the player view is needed to check the hands
+    arrays._read_state(reader, arrays.player_view)
+    reader.skip(',"action":')
+    arrays.action[rows] = reader.number()
+    reader.skip(',"date":')
+    arrays.date[rows] = reader.dates()
+    reader.skip(',"player_id":')
+    arrays.player_id[rows] = reader.number()
+    arrays._set_derived()
+    return arrays
+
+
+def decode_game_log_file(filename: str) -> GameLogArrays:
+    """
+    Decode a file of GameLogEntry lines.
+    """
+    with open(filename, mode='r') as file:
+        return decode_game_log_lines(file.readlines())
+
+
+def decode_obs_action_file(filename: str) -> ObsActionLogArrays:
+    """
+    Decode a file of GameObsActionLogEntry lines.
+    """
+    with open(filename, mode='r') as file:
+        return decode_obs_action_lines(file.readlines())
@@ -4,8 +4,12 @@
 #
 import logging
 import json
+import os
 import numpy as np
 
+# encoder for the lines, created once instead of for each call of json.dumps with separators
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
 
 class LogEntryFileGenerator:
     """
@@ -58,11 +62,14 @@ class LogEntryFileGenerator:
         if self._file is not None:
             self._file.close()
 
+    def _get_filename(self, file_number: int) -> str:
+        return self._basename + '{:04d}'.format(file_number) + self._extension
+
     def _open_new_file(self):
         if self._file is not None:
             self._file.close()
         self._current_file_number += 1
-        filename = self._basename + '{:04d}'.format(self._current_file_number) + self._extension
+        filename = self._get_filename(self._current_file_number)
         logging.getLogger(__name__).info('Writing file: {}'.format(filename))
         self._file = open(filename, mode='w')
         self._nr_lines_in_file = 0
@@ -97,5 +104,49 @@ class LogEntryFileGenerator:
         Args:
             entry: entry to add
         """
-        line = json.dumps(entry, separators=(',', ':'))
+        line = _JSON_ENCODER.encode(entry)
         self.add_entry_line(line)
+
+    def flush(self) -> None:
+        """
+        Write all buffered entries to the file and flush the file, so that all entries added so far are saved.
+        """
+        if len(self._buffer) > 0:
+            self._write_buffer()
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @property
+    def position(self) -> (int, int, int):
+        """
+        Position after the last written entry, as the number of the current file, the number of lines in the file
+        and the byte offset in the file. Call flush first, to include all added entries.
+        """
+        offset = self._file.tell() if self._file is not None else 0
+        return self._current_file_number, self._nr_lines_in_file, offset
+
+    def resume(self, position: (int, int, int)) -> None:
+        """
+        Continue writing at a position that was obtained from a previous generator with the same basename. Entries
+        that were written after the position are removed, i.e. the current file is truncated and files with higher
+        numbers are deleted.
+
+        Args:
+            position: the position, as returned by the property position
+        """
+        file_number, nr_lines_in_file, offset = position
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer.clear()
+        self._current_file_number = file_number
+        self._nr_lines_in_file = nr_lines_in_file
+        if file_number > 0:
+            self._file = open(self._get_filename(file_number), mode='r+')
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        next_file_number = file_number + 1
+        while os.path.exists(self._get_filename(next_file_number)):
+            os.remove(self._get_filename(next_file_number))
+            next_file_number += 1
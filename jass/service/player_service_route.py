@@ -17,6 +17,7 @@ from http import HTTPStatus
 from flask import request, jsonify, Blueprint, current_app
 
 from jass.game.const import card_strings
+from jass.game.game_event import GameEvent
 from jass.game.game_observation import GameObservation
 
 JASS_PATH_PREFIX = '/jass/players/'
@@ -130,13 +131,20 @@ def game_info(player_name: str):
 
     try:
         request_dict = request.get_json()
-        _ = GameObservation.from_json(request_dict)
-        # currently we dont do anything with the data
-        return jsonify(''), HTTPStatus.OK
+        obs = GameObservation.from_json(request_dict)
     except Exception as e:
         logging.warning('Error parsing request to GameObservation')
         return jsonify(error=str(e)), HTTPStatus.BAD_REQUEST
 
+    try:
+        # forward the information to the player
+        player.on_game_event(GameEvent(GameEvent.GAME_INFO, player=obs.player_view, obs=obs,
+                                       seats=(obs.player_view,)))
+        return jsonify(''), HTTPStatus.OK
+    except Exception as e:
+        logging.warning('Error in on_game_event: {}'.format(e))
+        return jsonify(error=str(e)), HTTPStatus.INTERNAL_SERVER_ERROR
+
 
 @players.route('/<string:player_name>', methods=['GET'])
 def check_player(player_name: str):
@@ -8,7 +8,7 @@ import numpy as np
 
 from jass.game.const import team, next_player, same_team
 from jass.game.game_state import GameState
-from jass.game.game_util import convert_one_hot_encoded_cards_to_str_encoded_list, get_cards_encoded_from_str
+from jass.game.game_util import convert_one_hot_encoded_hands_to_str_encoded_lists, get_cards_encoded_from_str
 
 
 class LabelPlay:
@@ -85,6 +85,8 @@ class LabelPlay:
         Returns:
             dict that can be serialized to json
         """
+        # the hands at the beginning of the game are the same for all labels of a game, so their encoding is cached
+        hands = convert_one_hot_encoded_hands_to_str_encoded_lists(self.hands)
         return dict(
             card_played=int(self.card_played),
             points_in_trick_own=int(self.points_in_trick_own),
@@ -92,10 +94,10 @@ class LabelPlay:
             trick_winner=int(self.trick_winner),
             points_in_game_own=int(self.points_in_game_own),
             points_in_game_other=int(self.points_in_game_other),
-            hands_player_0=convert_one_hot_encoded_cards_to_str_encoded_list(self.hands[0, :]),
-            hands_player_1=convert_one_hot_encoded_cards_to_str_encoded_list(self.hands[1, :]),
-            hands_player_2=convert_one_hot_encoded_cards_to_str_encoded_list(self.hands[2, :]),
-            hands_player_3=convert_one_hot_encoded_cards_to_str_encoded_list(self.hands[3, :])
+            hands_player_0=hands[0],
+            hands_player_1=hands[1],
+            hands_player_2=hands[2],
+            hands_player_3=hands[3]
         )
 
     @classmethod
@@ -19,11 +19,18 @@ setup(
     packages=find_namespace_packages(include=['jass.*']),
     classifiers=[
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.8",
         "Operating System :: OS Independent",
     ],
     install_requires=[
         'numpy'
     ],
-    python_requires='>=3.6'
+    extras_require={
+        # AgentByNetworkAsync (the paths of the service are defined with the flask routes)
+        'async': ['aiohttp', 'flask']
+    },
+    # math.comb and multiprocessing.shared_memory
+    python_requires='>=3.8'
 )
 
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import unittest
+
+import numpy as np
+
+from jass.game.const import NORTH, DIAMONDS, MAX_TRUMP, PUSH
+from jass.game.game_sim import GameSim
+from jass.game.game_util import deal_random_hand
+from jass.game.rule_schieber import RuleSchieber
+
+try:
+    from aiohttp import web
+    from jass.agents.agent_by_network_async import AgentByNetworkAsync
+except ImportError:
+    web = None
+
+
+class PlayerService:
+    """
+    Local player service that answers with the first card of the hand, or after a delay.
+    """
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self._runner = None
+        self.url = None
+
+    async def _action_trump(self, request):
+        self.requests.append(await request.json())
+        await asyncio.sleep(self.delay)
+        return web.json_response(dict(trump=2))
+
+    async def _action_play_card(self, request):
+        data = await request.json()
+        self.requests.append(data)
+        await asyncio.sleep(self.delay)
+        return web.json_response(dict(card=data['player'][data['playerView']]['hand'][0]))
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/test/action_trump', self._action_trump)
+        app.router.add_post('/test/action_play_card', self._action_play_card)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, '127.0.0.1', 0).start()
+        self.url = 'http://127.0.0.1:{}/test'.format(self._runner.addresses[0][1])
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+@unittest.skipIf(web is None, 'aiohttp (or flask) is not installed')
+class AgentByNetworkAsyncTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        game = GameSim(rule=RuleSchieber())
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        self.obs_trump = game.get_observation()
+        game.action_trump(DIAMONDS)
+        self.obs_card = game.get_observation()
+
+    def _run(self, service: PlayerService, timeout: float):
+        async def run():
+            await service.start()
+            agent = AgentByNetworkAsync(service.url, timeout=timeout)
+            try:
+                trump = await agent.action_trump(self.obs_trump)
+                card = await agent.action_play_card(self.obs_card)
+                return agent, trump, card
+            finally:
+                await agent.close()
+                await service.stop()
+        return asyncio.run(run())
+
+    def test_response(self):
+        service = PlayerService()
+        agent, trump, card = self._run(service, timeout=5)
+        self.assertEqual(2, trump)
+        self.assertEqual(int(np.flatnonzero(self.obs_card.hand)[0]), card)
+        self.assertEqual(0, agent.nr_standin_actions)
+
+        # the observations are sent as json in the format of GameObservation.to_json with the game id
+        self.assertEqual(2, len(service.requests))
+        expected = self.obs_card.to_json()
+        expected['gameId'] = 0
+        self.assertEqual(json.loads(json.dumps(expected)), service.requests[1])
+
+    def test_timeout(self):
+        service = PlayerService(delay=0.5)
+        agent, trump, card = self._run(service, timeout=0.1)
+        self.assertEqual(2, agent.nr_standin_actions)
+        self.assertIn(trump, list(range(MAX_TRUMP + 1)) + [PUSH])
+        self.assertEqual(1, RuleSchieber().get_valid_cards_from_obs(self.obs_card)[card])
+
+
+if __name__ == '__main__':
+    unittest.main()
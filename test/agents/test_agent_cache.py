@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_cache import AgentCached, AgentCheatingCached, DecisionCache
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+
+from deterministic_agents import AgentFirstValidCard, AgentCheatingFirstValidCard
+
+
+def play(agents, cheating_mode=False) -> Arena:
+    arena = Arena(nr_games_to_play=8, cheating_mode=cheating_mode,
+                  dealing_card_strategy=DealingCardRandomStrategy(np.random.default_rng(1)))
+    arena.set_players(*agents)
+    arena.play_all_games()
+    return arena
+
+
+class AgentCacheTestCase(unittest.TestCase):
+
+    def test_lru(self):
+        cache = DecisionCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(1, cache.get('a'))
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertEqual(3, cache.nr_hits)
+        self.assertEqual(1, cache.nr_misses)
+        self.assertEqual(2, len(cache))
+
+    def test_load_max_entries(self):
+        cache = DecisionCache(max_entries=2)
+        for i, key in enumerate(['a', 'b', 'c']):
+            cache.put(key, i)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'cache.json')
+            cache.save(filename)
+            cache = DecisionCache(max_entries=10)
+            for i, key in enumerate(['d', 'e', 'f']):
+                cache.put(key, i)
+            cache.load(filename)
+        self.assertEqual(2, cache.max_entries)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('b'))
+        self.assertEqual(2, cache.get('c'))
+
+    def test_arena(self):
+        points = play([AgentFirstValidCard() for _ in range(4)]).points_team_0
+
+        cache = DecisionCache()
+        points_cached = play([AgentCached(AgentFirstValidCard(), cache) for _ in range(4)]).points_team_0
+        np.testing.assert_array_equal(points, points_cached)
+        self.assertEqual(0, cache.nr_hits)
+        nr_misses = cache.nr_misses
+
+        # the same games are decided from the cache, also after saving and loading it
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'cache.json')
+            cache.save(filename)
+            cache = DecisionCache()
+            cache.load(filename)
+        points_cached = play([AgentCached(AgentFirstValidCard(), cache) for _ in range(4)]).points_team_0
+        np.testing.assert_array_equal(points, points_cached)
+        self.assertEqual(nr_misses, cache.nr_hits)
+        self.assertEqual(0, cache.nr_misses)
+
+    def test_cheating(self):
+        points = play([AgentCheatingFirstValidCard() for _ in range(4)], cheating_mode=True).points_team_0
+        cache = DecisionCache()
+        agents = [AgentCheatingCached(AgentCheatingFirstValidCard(), cache) for _ in range(4)]
+        play(agents, cheating_mode=True)
+        points_cached = play(agents, cheating_mode=True).points_team_0
+        np.testing.assert_array_equal(points, points_cached)
+        self.assertEqual(cache.nr_hits, cache.nr_misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
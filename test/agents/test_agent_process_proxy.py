@@ -0,0 +1,105 @@
+import os
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_process_proxy import AgentProcessProxy, SLOT_SIZE, encode_observation, \
+    decode_observation, encode_event, decode_event
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.game.game_event import GameEvent
+from jass.game.game_observation import GameObservation
+from jass.game.game_sim import GameSim
+from jass.game.rule_schieber import RuleSchieber
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class AgentCrashing(AgentFirstValidCard):
+    """
+    Agent whose process terminates when it has to play a card.
+    """
+    def action_play_card(self, obs: GameObservation) -> int:
+        os._exit(1)
+
+
+class FixedDealing(DealingCardRandomStrategy):
+    """
+    Random deals that are the same for each instance.
+    """
+    def __init__(self):
+        super().__init__(np.random.default_rng(42))
+
+
+class AgentProcessProxyTestCase(unittest.TestCase):
+
+    def test_encode_observation(self):
+        rule = RuleSchieber()
+        sim = GameSim(rule=rule)
+        sim.init_from_cards(hands=DealingCardRandomStrategy().deal_cards(), dealer=0)
+        sim.action_trump(sim.state.player % 4)
+        slot = np.zeros(SLOT_SIZE, dtype=np.int8)
+        while not sim.is_done():
+            obs = sim.get_observation()
+            encode_observation(obs, slot)
+            decoded = decode_observation(slot)
+            self.assertEqual(obs.to_json(), decoded.to_json())
+            np.testing.assert_array_equal(obs.current_trick, decoded.current_trick)
+            np.testing.assert_array_equal(obs.points, decoded.points)
+            valid_cards = rule.get_valid_cards_from_obs(obs)
+            sim.action_play_card(int(np.flatnonzero(valid_cards)[0]))
+
+    def test_encode_event(self):
+        slot = np.zeros(SLOT_SIZE, dtype=np.int8)
+        hand = np.zeros(36, dtype=np.int32)
+        hand[0:9] = 1
+        encode_event(GameEvent(GameEvent.GAME_START, player=1, dealer=3, hand=hand), slot)
+        event = decode_event(slot)
+        self.assertEqual((GameEvent.GAME_START, 1, 3), (event.event_type, event.player, event.dealer))
+        np.testing.assert_array_equal(hand, event.hand)
+
+        hands = np.zeros([4, 36], dtype=np.int32)
+        hands[1, 0:9] = 1
+        hands[3, 9:18] = 1
+        encode_event(GameEvent(GameEvent.GAME_START, player=1, dealer=3, hand=hand, seats=(1, 3), hands=hands), slot)
+        event = decode_event(slot)
+        self.assertEqual((1, 3), event.seats)
+        np.testing.assert_array_equal(hands, event.hands)
+
+        encode_event(GameEvent(GameEvent.GAME_END, points=np.array([100, 57])), slot)
+        event = decode_event(slot)
+        self.assertIsNone(event.hand)
+        self.assertIsNone(event.hands)
+        self.assertIsNone(event.seats)
+        np.testing.assert_array_equal([100, 57], event.points)
+
+    def test_arena(self):
+        def play(agents):
+            arena = Arena(nr_games_to_play=4, dealing_card_strategy=FixedDealing(), notify_game_events=True)
+            arena.set_players(*agents)
+            arena.play_all_games()
+            return arena.points_team_0
+
+        proxies = [AgentProcessProxy(AgentFirstValidCard) for _ in range(4)]
+        try:
+            points_proxy = play(proxies)
+        finally:
+            for proxy in proxies:
+                proxy.close()
+        points = play([AgentFirstValidCard() for _ in range(4)])
+        np.testing.assert_array_equal(points, points_proxy)
+        self.assertEqual(0, sum(proxy.nr_standin_actions for proxy in proxies))
+
+    def test_crash(self):
+        with AgentProcessProxy(AgentCrashing) as proxy:
+            arena = Arena(nr_games_to_play=2)
+            arena.set_players(proxy, AgentRandomSchieber(), AgentRandomSchieber(), AgentRandomSchieber())
+            arena.play_all_games()
+            self.assertEqual(2, arena.nr_games_played)
+            self.assertFalse(proxy.alive)
+            self.assertGreater(proxy.nr_standin_actions, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
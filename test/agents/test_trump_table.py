@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.agents.trump_table import TrumpTable, get_canonical_hand_key, get_hand_from_canonical_key
+from jass.agents.trump_table_builder import TrumpTableBuilder
+from jass.game.const import *
+from jass.game.game_observation import GameObservation
+from jass.game.game_util import get_cards_encoded
+
+
+class TrumpTableTestCase(unittest.TestCase):
+    def test_canonical_key(self):
+        hand = get_cards_encoded([DA, DK, DJ, H9, S6, S7, CA, CK, C10])
+        # same hand with diamonds and clubs exchanged
+        hand_permuted = get_cards_encoded([CA, CK, CJ, H9, S6, S7, DA, DK, D10])
+        key, permutation = get_canonical_hand_key(hand)
+        key_permuted, _ = get_canonical_hand_key(hand_permuted)
+        self.assertEqual(key, key_permuted)
+
+        hand_canonical = get_hand_from_canonical_key(key)
+        self.assertEqual(9, hand_canonical.sum())
+        self.assertEqual(key, get_canonical_hand_key(hand_canonical)[0])
+
+        # the colors of the canonical hand are the colors of the hand in the order of the permutation
+        for i, color in enumerate(permutation):
+            self.assertTrue(np.array_equal(hand_canonical[9 * i:9 * i + 9], hand[9 * color:9 * color + 9]))
+
+    def test_lookup(self):
+        hand = get_cards_encoded([DA, DK, DJ, D9, D10, D6, HA, SA, C6])
+        key, permutation = get_canonical_hand_key(hand)
+        values = np.zeros([1, 2, 7], dtype=np.float32)
+        # canonical color 0 is diamonds for this hand
+        self.assertEqual(DIAMONDS, permutation[0])
+        values[0, TrumpTable.FOREHAND, :] = [100, 10, 10, 10, 20, 20, 50]
+        values[0, TrumpTable.PUSHED, :] = [90, 10, 10, 10, 20, 20, np.nan]
+        table = TrumpTable(np.array([key], dtype=np.int64), values)
+
+        obs = GameObservation()
+        obs.hand[:] = hand
+        self.assertEqual(DIAMONDS, table.action_trump(obs))
+        obs.forehand = 0
+        self.assertEqual(DIAMONDS, table.action_trump(obs))
+
+        # not in table
+        obs.hand[:] = get_cards_encoded([DA, DK, DJ, D9, D10, D6, HA, SA, C7])
+        self.assertIsNone(table.action_trump(obs))
+
+        # the same hand in hearts
+        obs.hand[:] = get_cards_encoded([HA, HK, HJ, H9, H10, H6, DA, SA, C6])
+        self.assertEqual(HEARTS, table.action_trump(obs))
+
+    def test_build_save_load(self):
+        hands = [get_cards_encoded([DA, DK, DJ, D9, D10, D6, HA, SA, C6]),
+                 get_cards_encoded([HA, HK, HJ, H9, H10, H6, DA, SA, C6])]
+        table = TrumpTableBuilder(nr_samples=2, seed=1).build_from_hands(hands)
+        # both hands have the same canonical key
+        self.assertEqual(1, len(table))
+        self.assertTrue(np.isnan(table.values[0, TrumpTable.PUSHED, PUSH_ALT]))
+        self.assertFalse(np.isnan(table.values[0, TrumpTable.FOREHAND, :]).any())
+
+        with tempfile.TemporaryDirectory() as directory:
+            basename = os.path.join(directory, 'table')
+            table.save(basename)
+            table_read = TrumpTable.load(basename)
+            self.assertTrue(np.array_equal(table.keys, table_read.keys))
+            self.assertTrue(np.array_equal(table.values, table_read.values, equal_nan=True))
+            obs = GameObservation()
+            obs.hand[:] = hands[1]
+            self.assertIn(table_read.action_trump(obs), [DIAMONDS, HEARTS, SPADES, CLUBS, OBE_ABE, UNE_UFE, PUSH])
+
+
+if __name__ == '__main__':
+    unittest.main()
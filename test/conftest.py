@@ -0,0 +1,5 @@
+import os
+import sys
+
+# make the helper modules in this directory (e.g. deterministic_agents) importable from all test directories
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,40 @@
+"""
+Deterministic agents shared by the tests, so that the results of different arenas can be compared.
+"""
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.agents.agent_cheating import AgentCheating
+from jass.game.const import card_values
+from jass.game.game_observation import GameObservation
+from jass.game.game_state import GameState
+from jass.game.rule_schieber import RuleSchieber
+
+
+class AgentFirstValidCard(Agent):
+    """
+    Deterministic agent: select the trump with the highest card values and play the valid card with the lowest
+    index (i.e. the highest ranked card of its color, in the order without trump) and never push.
+    """
+    def __init__(self):
+        self._rule = RuleSchieber()
+
+    def action_trump(self, obs: GameObservation) -> int:
+        return int(np.argmax(card_values @ obs.hand))
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        return int(np.flatnonzero(self._rule.get_valid_cards_from_obs(obs))[0])
+
+
+class AgentCheatingFirstValidCard(AgentCheating):
+    """
+    Version of AgentFirstValidCard in cheating mode.
+    """
+    def __init__(self):
+        self._rule = RuleSchieber()
+
+    def action_trump(self, state: GameState) -> int:
+        return int(np.argmax(card_values @ state.hands[state.player]))
+
+    def action_play_card(self, state: GameState) -> int:
+        return int(np.flatnonzero(self._rule.get_valid_cards_from_state(state))[0])
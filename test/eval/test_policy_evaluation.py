@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from jass.agents.agent_batch import BatchAgent
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.eval.policy_evaluation import PolicyEvaluation, evaluate_files, split_file, PHASE_CARD, PHASE_TRUMP
+from jass.game.const import PUSH
+from jass.game.game_observation import GameObservation
+from jass.game.game_sim import GameSim
+from jass.game.rule_schieber import RuleSchieber
+from jass.logs.game_obs_action_log_entry import GameObsActionLogEntry
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class AgentPushWithoutJack(AgentFirstValidCard):
+    """
+    Version of AgentFirstValidCard that selects the color of a jack as trump and pushes if it has no jack.
+    """
+    def action_trump(self, obs: GameObservation) -> int:
+        jacks = np.flatnonzero(obs.hand[3::9])
+        if obs.forehand == -1 and len(jacks) == 0:
+            return PUSH
+        return int(jacks[0]) if len(jacks) > 0 else int(np.argmax(obs.hand)) // 9
+
+
+class AgentPushWithoutJackBatch(BatchAgent):
+    """
+    Batch version of AgentPushWithoutJack.
+    """
+    def __init__(self):
+        self._agent = AgentPushWithoutJack()
+
+    def action_trump_batch(self, obs_list):
+        return [self._agent.action_trump(obs) for obs in obs_list]
+
+    def action_play_card_batch(self, obs_list):
+        return [self._agent.action_play_card(obs) for obs in obs_list]
+
+
+def write_log_file(filename: str, nr_games: int, seed: int) -> None:
+    agent = AgentPushWithoutJack()
+    dealing = DealingCardRandomStrategy(np.random.default_rng(seed))
+    with open(filename, mode='w') as file:
+        for game_nr in range(nr_games):
+            sim = GameSim(rule=RuleSchieber())
+            sim.init_from_cards(hands=dealing.deal_cards(), dealer=game_nr % 4)
+            while not sim.is_done():
+                obs = sim.get_observation()
+                action = agent.action_trump(obs) if sim.state.trump == -1 else agent.action_play_card(obs)
+                entry = GameObsActionLogEntry(obs=obs, action=action, date=datetime.now(), player_id=0)
+                file.write(json.dumps(entry.to_json()) + '\n')
+                if sim.state.trump == -1:
+                    sim.action_trump(action)
+                else:
+                    sim.action_play_card(action)
+
+
+class PolicyEvaluationTestCase(unittest.TestCase):
+
+    def test_evaluate_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filenames = [os.path.join(directory, 'log_{}.txt'.format(i)) for i in range(3)]
+            for i, filename in enumerate(filenames):
+                write_log_file(filename, nr_games=5, seed=i)
+
+            evaluation = evaluate_files(AgentPushWithoutJack, filenames, nr_workers=1, batch_size=7)
+            self.assertEqual(15 * 36, evaluation.nr_decisions[PHASE_CARD])
+            self.assertGreaterEqual(evaluation.nr_decisions[PHASE_TRUMP], 15)
+            self.assertEqual(1.0, evaluation.accuracy)
+            np.testing.assert_array_equal(15 * 4, evaluation.nr_decisions_by_trick)
+            self.assertEqual(15 * 36, evaluation.nr_decisions_by_trump.sum())
+
+            evaluation_batch = evaluate_files(AgentPushWithoutJackBatch, filenames, nr_workers=2, batch_size=16)
+            self.assertEqual(evaluation.to_json(), evaluation_batch.to_json())
+
+            evaluation_random = evaluate_files(AgentRandomSchieber, filenames, nr_workers=1)
+            self.assertLess(evaluation_random.accuracy, 1.0)
+            # the last card of each player is always predicted correctly
+            self.assertEqual(1.0, evaluation_random.accuracy_by_trick[8])
+
+    def test_evaluate_chunks(self):
+        # a single file is split into chunks of lines that are evaluated by several workers
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'log.txt')
+            write_log_file(filename, nr_games=4, seed=3)
+            with open(filename, mode='rb') as file:
+                lines = file.readlines()
+
+            chunks = split_file(filename, chunk_size=5000)
+            self.assertGreater(len(chunks), 4)
+            self.assertEqual(0, chunks[0][1])
+            self.assertEqual(os.path.getsize(filename), chunks[-1][2])
+            chunk_lines = []
+            with open(filename, mode='rb') as file:
+                for name, start, end in chunks:
+                    self.assertEqual(filename, name)
+                    file.seek(start)
+                    data = file.read(end - start)
+                    self.assertTrue(data.endswith(b'\n'))
+                    chunk_lines.extend(data.splitlines(keepends=True))
+            self.assertEqual(lines, chunk_lines)
+
+            evaluation = evaluate_files(AgentRandomSchieber, [filename], nr_workers=1)
+            evaluation_chunks = evaluate_files(AgentPushWithoutJack, [filename], nr_workers=3, chunk_size=5000)
+            self.assertEqual(evaluation.nr_decisions.tolist(), evaluation_chunks.nr_decisions.tolist())
+            self.assertEqual(1.0, evaluation_chunks.accuracy)
+
+    def test_merge(self):
+        evaluation = PolicyEvaluation()
+        evaluation.add_card_decisions(np.array([1, 2]), np.array([1, 3]), np.array([0, 1]), np.array([2, 2]))
+        other = PolicyEvaluation()
+        other.add_trump_decisions(np.array([PUSH, 1]), np.array([PUSH, 2]))
+        evaluation.merge(other)
+        np.testing.assert_array_equal([2, 2], evaluation.nr_decisions)
+        np.testing.assert_array_equal([1, 1], evaluation.nr_correct)
+        self.assertEqual(1, evaluation.nr_correct_by_trump_action[6])
+        self.assertEqual(0.5, evaluation.accuracy)
+
+
+if __name__ == '__main__':
+    unittest.main()
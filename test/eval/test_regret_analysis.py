@@ -0,0 +1,64 @@
+import glob
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.eval.regret_analysis import analyze_files, analyze_game, RegretCache
+from jass.game.const import HEARTS
+from jass.game.game_sim import GameSim
+from jass.game.perfect_information_solver import PerfectInformationSolver
+from jass.game.rule_schieber import RuleSchieber
+
+
+class RegretAnalysisTestCase(unittest.TestCase):
+
+    def test_analyze_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            arena = Arena(nr_games_to_play=6, save_filename=os.path.join(directory, 'games'))
+            arena.set_players(AgentRandomSchieber(), AgentRandomSchieber(), AgentRandomSchieber(),
+                              AgentRandomSchieber(), 1, 2, 3, 4)
+            arena.play_all_games()
+            filenames = glob.glob(os.path.join(directory, 'games*'))
+            cache_filename = os.path.join(directory, 'cache.txt')
+
+            statistics = analyze_files(filenames, nr_workers=2, max_cards_remaining=8, cache_filename=cache_filename)
+            self.assertEqual(6 * 8, statistics.nr_decisions)
+            np.testing.assert_array_equal([0] * 7 + [24, 24], statistics.nr_decisions_by_trick)
+            self.assertEqual({1, 2, 3, 4}, set(statistics.by_player_id.keys()))
+            self.assertEqual(48, sum(counts[0] for counts in statistics.by_player_id.values()))
+            self.assertGreaterEqual(statistics.mean_regret, 0.0)
+            # the last card is forced
+            self.assertEqual(24, statistics.nr_optimal_by_trick[8])
+            self.assertEqual(6, len(RegretCache(cache_filename)))
+
+            # the second analysis uses the cache
+            statistics_cached = analyze_files(filenames, nr_workers=1, max_cards_remaining=8,
+                                              cache_filename=cache_filename)
+            self.assertEqual(statistics.to_json(), statistics_cached.to_json())
+            with open(cache_filename) as file:
+                self.assertEqual(6, len(file.readlines()))
+
+    def test_analyze_game(self):
+        rule = RuleSchieber()
+        rng = np.random.default_rng(3)
+        sim = GameSim(rule=rule)
+        sim.init_from_cards(DealingCardRandomStrategy(rng).deal_cards(), dealer=0)
+        sim.action_trump(HEARTS)
+        while not sim.is_done():
+            sim.action_play_card(rng.choice(np.flatnonzero(rule.get_valid_cards_from_state(sim.state))))
+
+        decisions = analyze_game(sim.state, PerfectInformationSolver(rule), max_cards_remaining=6)
+        self.assertEqual(6, len(decisions))
+        for cards_played, (player, trick_nr, card, value, best_value) in enumerate(decisions, start=30):
+            self.assertEqual(sim.state.tricks[cards_played // 4, cards_played % 4], card)
+            self.assertEqual(cards_played // 4, trick_nr)
+            self.assertGreaterEqual(best_value, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,30 @@
 import unittest
 
+import numpy as np
+
 from jass.agents.agent_cheating_random_schieber import AgentCheatingRandomSchieber
 from jass.agents.agent_random_schieber import AgentRandomSchieber
 from jass.arena.arena import Arena
 
 
+class AgentCountingCards(AgentRandomSchieber):
+    """
+    Random agent that counts the cards it was asked for and the forced cards it was notified about.
+    """
+    def __init__(self):
+        super().__init__()
+        self.nr_requested = 0
+        self.nr_forced = 0
+
+    def action_play_card(self, obs):
+        self.nr_requested += 1
+        return super().action_play_card(obs)
+
+    def on_forced_card(self, obs, card):
+        self.nr_forced += 1
+        assert obs.hand[card] == 1
+
+
 class GameSimTestCase(unittest.TestCase):
 
     def test_arena_in_non_cheating_mode(self):
@@ -47,6 +67,27 @@ class GameSimTestCase(unittest.TestCase):
         with self.assertRaises(AssertionError):
             arena.set_players(my_player, player, my_player, player)
 
+    def test_arena_skip_forced_moves(self):
+        arena = Arena(nr_games_to_play=3, skip_forced_moves=True)
+        players = [AgentCountingCards() for _ in range(4)]
+        arena.set_players(*players)
+        arena.play_all_games()
+
+        for player, agent in enumerate(players):
+            # the last trick is always forced
+            self.assertGreaterEqual(agent.nr_forced, 3)
+            self.assertEqual(agent.nr_forced, arena.nr_forced_moves[player])
+            self.assertEqual(3 * 9, agent.nr_requested + agent.nr_forced)
+        np.testing.assert_array_equal(157, arena.points_team_0 + arena.points_team_1)
+
+    def test_arena_without_skip_forced_moves(self):
+        arena = Arena(nr_games_to_play=1)
+        agent = AgentCountingCards()
+        arena.set_players(agent, agent, agent, agent)
+        arena.play_all_games()
+        self.assertEqual(36, agent.nr_requested)
+        self.assertEqual(0, arena.nr_forced_moves.sum())
+
 
 if __name__ == '__main__':
     unittest.main()
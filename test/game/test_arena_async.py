@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_async import AgentAsync
+from jass.arena.arena import Arena
+from jass.arena.arena_async import AsyncArena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.game.game_observation import GameObservation
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class AgentDelayed(AgentAsync):
+    """
+    Asynchronous version of AgentFirstValidCard that waits a random time for each action, similar to a network agent.
+    """
+    nr_active_requests = 0
+    max_active_requests = 0
+
+    def __init__(self, seed: int):
+        self._agent = AgentFirstValidCard()
+        self._rng = np.random.default_rng(seed)
+        self.nr_closed = 0
+
+    async def _delay(self):
+        AgentDelayed.nr_active_requests += 1
+        AgentDelayed.max_active_requests = max(AgentDelayed.max_active_requests, AgentDelayed.nr_active_requests)
+        await asyncio.sleep(self._rng.random() * 0.001)
+        AgentDelayed.nr_active_requests -= 1
+
+    async def action_trump(self, obs: GameObservation) -> int:
+        await self._delay()
+        return self._agent.action_trump(obs)
+
+    async def action_play_card(self, obs: GameObservation) -> int:
+        await self._delay()
+        return self._agent.action_play_card(obs)
+
+    async def close(self) -> None:
+        self.nr_closed += 1
+
+
+class AsyncArenaTestCase(unittest.TestCase):
+
+    def test_same_results_as_arena(self):
+        arena = Arena(nr_games_to_play=12, dealing_card_strategy=DealingCardRandomStrategy(np.random.default_rng(3)))
+        arena.set_players(AgentFirstValidCard(), AgentFirstValidCard(), AgentFirstValidCard(), AgentFirstValidCard())
+        arena.play_all_games()
+
+        AgentDelayed.max_active_requests = 0
+        agent_0 = AgentDelayed(seed=1)
+        agent_1 = AgentDelayed(seed=2)
+        arena_async = AsyncArena(nr_games_to_play=12, nr_concurrent_games=5,
+                                 dealing_card_strategy=DealingCardRandomStrategy(np.random.default_rng(3)))
+        arena_async.set_players(agent_0, agent_1, agent_0, AgentFirstValidCard())
+        arena_async.play_all_games()
+
+        self.assertEqual(12, arena_async.nr_games_played)
+        np.testing.assert_array_equal(arena.points_team_0, arena_async.points_team_0)
+        np.testing.assert_array_equal(arena.points_team_1, arena_async.points_team_1)
+        self.assertGreater(AgentDelayed.max_active_requests, 1)
+        self.assertLessEqual(AgentDelayed.max_active_requests, 5)
+        self.assertEqual(1, agent_0.nr_closed)
+        self.assertEqual(1, agent_1.nr_closed)
+
+    def test_invalid_agent(self):
+        arena = AsyncArena(nr_games_to_play=1)
+        with self.assertRaises(AssertionError):
+            arena.set_players(object(), object(), object(), object())
+
+
+if __name__ == '__main__':
+    unittest.main()
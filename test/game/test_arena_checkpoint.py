@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.agents.agent import Agent
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.stopping_rule import StoppingRule
+from jass.game.game_observation import GameObservation
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class AgentFailing(AgentFirstValidCard):
+    """
+    Deterministic agent that fails after a number of cards to simulate that the process is stopped.
+    """
+    def __init__(self, fail_after_cards: int = None):
+        super().__init__()
+        self._nr_cards = 0
+        self._fail_after_cards = fail_after_cards
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        self._nr_cards += 1
+        if self._fail_after_cards is not None and self._nr_cards > self._fail_after_cards:
+            raise KeyboardInterrupt()
+        return super().action_play_card(obs)
+
+
+def read_games(basename: str) -> list:
+    with open(basename + '0001.txt') as file:
+        return [json.loads(line)['game'] for line in file]
+
+
+class ArenaCheckpointTestCase(unittest.TestCase):
+
+    def _create_arena(self, directory: str, name: str, agent: Agent, strategy=None, stopping_rule=None) -> Arena:
+        arena = Arena(nr_games_to_play=10,
+                      dealing_card_strategy=strategy,
+                      stopping_rule=stopping_rule,
+                      save_filename=os.path.join(directory, name),
+                      checkpoint_filename=os.path.join(directory, name + '.ckpt'),
+                      checkpoint_every_x_games=4)
+        arena.set_players(agent, agent, agent, agent)
+        return arena
+
+    def _run(self, strategy_factory):
+        with tempfile.TemporaryDirectory() as directory:
+            arena = self._create_arena(directory, 'full', AgentFailing(), strategy_factory())
+            arena.play_all_games()
+            games_full = read_games(os.path.join(directory, 'full'))
+
+            # stop during game 7 (36 cards per game), after the checkpoint at 4 games
+            arena = self._create_arena(directory, 'resumed', AgentFailing(fail_after_cards=6 * 36 + 10),
+                                       strategy_factory())
+            with self.assertRaises(KeyboardInterrupt):
+                arena.play_all_games()
+
+            # simulate entries that were written after the checkpoint
+            basename = os.path.join(directory, 'resumed')
+            with open(basename + '0001.txt', mode='a') as file:
+                file.write('{"incomplete":\n')
+            with open(basename + '0002.txt', mode='w') as file:
+                file.write('{}\n')
+
+            arena = self._create_arena(directory, 'resumed', AgentFailing(), strategy_factory())
+            arena.play_all_games(resume_from=basename + '.ckpt')
+            games_resumed = read_games(basename)
+            self.assertFalse(os.path.exists(basename + '0002.txt'))
+
+        self.assertEqual(10, arena.nr_games_played)
+        self.assertEqual(10, len(games_resumed))
+        self.assertEqual(games_full, games_resumed)
+        return arena
+
+    def test_resume(self):
+        self._run(lambda: DealingCardRandomStrategy(np.random.default_rng(1)))
+
+    def test_resume_global_random_state(self):
+        def create_strategy():
+            np.random.seed(2)
+            return DealingCardRandomStrategy()
+        self._run(create_strategy)
+
+    def _assert_resume_finished(self, stopping_rule_factory):
+        # the checkpoint at the end contains all saved games, also if their number is not a multiple of 4
+        with tempfile.TemporaryDirectory() as directory:
+            basename = os.path.join(directory, 'finished')
+            arena = self._create_arena(directory, 'finished', AgentFailing(), stopping_rule=stopping_rule_factory())
+            arena.play_all_games()
+            nr_games_played = arena.nr_games_played
+            games = read_games(basename)
+            self.assertEqual(nr_games_played, len(games))
+
+            arena = self._create_arena(directory, 'finished', AgentFailing(), stopping_rule=stopping_rule_factory())
+            arena.play_all_games(resume_from=basename + '.ckpt')
+            self.assertEqual(nr_games_played, arena.nr_games_played)
+            self.assertEqual(games, read_games(basename))
+        return nr_games_played
+
+    def test_resume_finished(self):
+        self.assertEqual(10, self._assert_resume_finished(lambda: None))
+
+    def test_resume_stopped(self):
+        nr_games_played = self._assert_resume_finished(lambda: StoppingRule(min_games=2, futility_margin=1000.0))
+        self.assertLess(nr_games_played, 10)
+        self.assertNotEqual(0, nr_games_played % 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
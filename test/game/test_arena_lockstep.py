@@ -0,0 +1,71 @@
+import unittest
+from typing import List
+
+import numpy as np
+
+from jass.agents.agent_batch import BatchAgent
+from jass.agents.agent_cheating_random_schieber import AgentCheatingRandomSchieber
+from jass.arena.arena import Arena
+from jass.arena.arena_lockstep import LockstepArena
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.game.game_observation import GameObservation
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class BatchAgentFirstValidCard(BatchAgent):
+    """
+    Batch version of AgentFirstValidCard that records the batch sizes.
+    """
+    def __init__(self):
+        self._agent = AgentFirstValidCard()
+        self.batch_sizes = []
+
+    def action_trump_batch(self, obs_list: List[GameObservation]) -> List[int]:
+        self.batch_sizes.append(len(obs_list))
+        return [self._agent.action_trump(obs) for obs in obs_list]
+
+    def action_play_card_batch(self, obs_list: List[GameObservation]) -> List[int]:
+        self.batch_sizes.append(len(obs_list))
+        return [self._agent.action_play_card(obs) for obs in obs_list]
+
+
+class LockstepArenaTestCase(unittest.TestCase):
+
+    def test_same_results_as_arena(self):
+        arena = Arena(nr_games_to_play=10, dealing_card_strategy=DealingCardRandomStrategy(np.random.default_rng(7)))
+        arena.set_players(AgentFirstValidCard(), AgentFirstValidCard(), AgentFirstValidCard(), AgentFirstValidCard())
+        arena.play_all_games()
+
+        batch_agent = BatchAgentFirstValidCard()
+        arena_lockstep = LockstepArena(nr_games_to_play=10, nr_parallel_games=4,
+                                       dealing_card_strategy=DealingCardRandomStrategy(np.random.default_rng(7)))
+        arena_lockstep.set_players(batch_agent, AgentFirstValidCard(), batch_agent, AgentFirstValidCard())
+        arena_lockstep.play_all_games()
+
+        self.assertEqual(10, arena_lockstep.nr_games_played)
+        np.testing.assert_array_equal(arena.points_team_0, arena_lockstep.points_team_0)
+        np.testing.assert_array_equal(arena.points_team_1, arena_lockstep.points_team_1)
+        self.assertGreater(max(batch_agent.batch_sizes), 1)
+        self.assertLessEqual(max(batch_agent.batch_sizes), 4)
+        # 2 * 9 cards in each game and at least one trump decision in half of the games
+        self.assertGreaterEqual(sum(batch_agent.batch_sizes), 10 * 18 + 5)
+
+    def test_single_action(self):
+        agent = BatchAgentFirstValidCard()
+        arena = Arena(nr_games_to_play=2)
+        arena.set_players(agent, agent, agent, agent)
+        arena.play_all_games()
+        self.assertEqual([1], list(set(agent.batch_sizes)))
+
+    def test_cheating_mode(self):
+        arena = LockstepArena(nr_games_to_play=3, nr_parallel_games=2, cheating_mode=True)
+        player = AgentCheatingRandomSchieber()
+        arena.set_players(player, player, player, player)
+        arena.play_all_games()
+        self.assertEqual(3, arena.nr_games_played)
+        np.testing.assert_array_equal(157, arena.points_team_0 + arena.points_team_1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.consistent_worlds import ConstrainedCardAssignment, count_consistent_worlds, \
+    enumerate_consistent_worlds, sample_consistent_worlds, get_consistent_worlds
+from jass.game.const import *
+from jass.game.game_observation import GameObservation
+from jass.game.game_sim import GameSim
+from jass.game.game_state_util import observation_from_state
+from jass.game.game_util import deal_random_hand
+from jass.game.rule_schieber import RuleSchieber
+
+
+class ConsistentWorldsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rule = RuleSchieber()
+
+    def _play_game(self, nr_cards: int, trump: int) -> GameSim:
+        game = GameSim(rule=self.rule)
+        agent = AgentRandomSchieber()
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        game.action_trump(trump)
+        for _ in range(nr_cards):
+            game.action_play_card(agent.action_play_card(game.get_observation()))
+        return game
+
+    def _is_consistent(self, obs: GameObservation, hands: np.ndarray) -> bool:
+        # replay the game backwards from the hands and check that each card played was valid
+        hands = hands.copy()
+        tricks = []
+        for trick_nr in range(min(obs.nr_tricks + 1, 9)):
+            first_player = obs.trick_first_player[trick_nr]
+            for i in range(4):
+                card = obs.tricks[trick_nr, i]
+                if card == -1:
+                    break
+                player = (first_player - i) % 4
+                hands[player, card] = 1
+                tricks.append((player, trick_nr, i, card))
+        if (hands.sum(axis=1) != 9).any():
+            return False
+        for player, trick_nr, i, card in tricks:
+            valid = self.rule.get_valid_cards(hands[player], obs.tricks[trick_nr], i, obs.trump)
+            if not valid[card]:
+                return False
+            hands[player, card] = 0
+        return True
+
+    def test_assignment(self):
+        # 4 cards, 2 for player 1 and 2 for player 2, one card can only go to player 1
+        allowed = np.zeros([4, 4], dtype=bool)
+        allowed[:, 1:3] = True
+        allowed[0, 2] = False
+        assignment = ConstrainedCardAssignment([DA, DK, DQ, DJ], allowed, [0, 2, 2, 0])
+        self.assertEqual(3, assignment.count())
+        worlds = assignment.enumerate()
+        self.assertEqual(3, worlds.shape[0])
+        self.assertTrue((worlds[:, 1, DA] == 1).all())
+        samples = assignment.sample(10)
+        self.assertTrue((samples[:, 1, DA] == 1).all())
+        self.assertTrue((samples.sum(axis=2) == [0, 2, 2, 0]).all())
+
+    def test_enumerate_matches_brute_force(self):
+        for trump in [DIAMONDS, CLUBS, OBE_ABE, UNE_UFE]:
+            for nr_cards in [23, 27]:
+                game = self._play_game(nr_cards, trump)
+                obs = observation_from_state(game.state, game.state.player)
+
+                worlds = enumerate_consistent_worlds(obs)
+                self.assertEqual(count_consistent_worlds(obs), worlds.shape[0])
+
+                # the actual distribution is one of the worlds
+                self.assertTrue((worlds == game.state.hands).all(axis=(1, 2)).any())
+
+                # brute force over all distributions of the unknown cards with the correct hand sizes
+                unknown = [c for c in range(36) if obs.hand[c] == 0 and c not in obs.tricks]
+                others = [p for p in range(4) if p != obs.player_view]
+                sizes = [int(game.state.hands[p].sum()) for p in others]
+                nr_expected = 0
+                for first in itertools.combinations(unknown, sizes[0]):
+                    rest = [c for c in unknown if c not in first]
+                    for second in itertools.combinations(rest, sizes[1]):
+                        third = [c for c in rest if c not in second]
+                        hands = np.zeros([4, 36], dtype=np.int32)
+                        hands[obs.player_view] = obs.hand
+                        hands[others[0], list(first)] = 1
+                        hands[others[1], list(second)] = 1
+                        hands[others[2], third] = 1
+                        if self._is_consistent(obs, hands):
+                            nr_expected += 1
+                self.assertEqual(nr_expected, worlds.shape[0])
+
+    def test_sample(self):
+        game = self._play_game(13, HEARTS)
+        obs = observation_from_state(game.state, game.state.player)
+        samples = sample_consistent_worlds(obs, 20, np.random.default_rng(1))
+        self.assertEqual((20, 4, 36), samples.shape)
+        for hands in samples:
+            self.assertTrue(self._is_consistent(obs, hands))
+
+        worlds, exact = get_consistent_worlds(obs, max_worlds=10, nr_samples=5)
+        self.assertFalse(exact)
+        self.assertEqual(5, worlds.shape[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,21 @@ class JassConstTestCase(unittest.TestCase):
         np.testing.assert_array_equal(cards, cards_from_int)
         np.testing.assert_array_equal(cards, cards_from_str)
 
+    def test_hands_conversion(self):
+        hands = np.zeros([4, 36], dtype=np.int32)
+        hands[0, [DA, H10]] = 1
+        hands[2, CQ] = 1
+        expected = [['DA', 'H10'], [], ['CQ'], []]
+        # the second call uses the cached result, which must not be changed by modifying the returned lists
+        for _ in range(2):
+            card_lists = convert_one_hot_encoded_hands_to_str_encoded_lists(hands)
+            self.assertEqual(expected, card_lists)
+            card_lists[0].append('S6')
+        self.assertEqual([['DA', 'H10']], convert_one_hot_encoded_hands_to_str_encoded_lists(hands[0]))
+        self.assertEqual([['DA', 'H10']], convert_one_hot_encoded_hands_to_str_encoded_lists(hands[0].astype(bool)))
+        hands[2, CQ] = 0
+        self.assertEqual([['DA', 'H10'], [], [], []], convert_one_hot_encoded_hands_to_str_encoded_lists(hands))
+
     def test_same_player(self):
         self.assertTrue(same_team[0, 0])
         self.assertTrue(same_team[0, 2])
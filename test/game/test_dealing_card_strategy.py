@@ -0,0 +1,135 @@
+import json
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.arena.arena import Arena
+from jass.arena.dealing_card_constrained_strategy import DealingCardConstrainedStrategy
+from jass.arena.dealing_card_duplicate_strategy import DealingCardDuplicateStrategy
+from jass.arena.dealing_card_file_strategy import DealingCardFileStrategy, generate_deal_file, \
+    extract_deal_file_from_game_logs, get_owners_from_hands, get_hands_from_owners
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.arena import get_dealer
+from jass.game.const import next_player, NORTH, DIAMONDS, HEARTS, DJ, D9
+
+from deterministic_agents import AgentFirstValidCard
+
+
+def play(nr_games, strategy, save_filename=None) -> Arena:
+    arena = Arena(nr_games_to_play=nr_games, dealing_card_strategy=strategy, save_filename=save_filename)
+    agent = AgentFirstValidCard()
+    arena.set_players(agent, agent, agent, agent)
+    arena.play_all_games()
+    return arena
+
+
+class DealingCardStrategyTestCase(unittest.TestCase):
+
+    def test_duplicate_deal(self):
+        strategy = DealingCardDuplicateStrategy(DealingCardRandomStrategy(np.random.default_rng(1)))
+        hands_0 = strategy.deal_cards(0)
+        hands_1 = strategy.deal_cards(1)
+        # the forehand player gets the same hand
+        forehand_0 = next_player[get_dealer(0)]
+        forehand_1 = next_player[get_dealer(1)]
+        np.testing.assert_array_equal(hands_0[forehand_0], hands_1[forehand_1])
+        # but is in the other team
+        self.assertNotEqual(forehand_0 % 2, forehand_1 % 2)
+        with self.assertRaises(ValueError):
+            strategy.deal_cards(3)
+
+    def test_duplicate_arena(self):
+        arena = play(8, DealingCardDuplicateStrategy(DealingCardRandomStrategy(np.random.default_rng(2))))
+        # the same agent plays on all seats, so both teams make the same points with the same cards
+        np.testing.assert_array_equal(arena.points_team_0[0::2], arena.points_team_1[1::2])
+        np.testing.assert_array_equal(arena.points_team_1[0::2], arena.points_team_0[1::2])
+
+    def test_owners(self):
+        hands = DealingCardRandomStrategy(np.random.default_rng(3)).deal_cards()
+        for dealer in range(4):
+            owners = get_owners_from_hands(hands, dealer)
+            self.assertEqual(np.int8, owners.dtype)
+            np.testing.assert_array_equal(hands, get_hands_from_owners(owners, dealer))
+
+    def test_generated_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'deals.npy')
+            generate_deal_file(filename, nr_deals=5, seed=4)
+            strategy = DealingCardFileStrategy(filename)
+            self.assertEqual(5, strategy.nr_deals)
+            for game_nr in range(5):
+                hands = strategy.deal_cards(game_nr)
+                np.testing.assert_array_equal(np.ones(36), hands.sum(axis=0))
+                np.testing.assert_array_equal(np.full(4, 9), hands.sum(axis=1))
+            with self.assertRaises(ValueError):
+                strategy.deal_cards(5)
+            strategy = DealingCardFileStrategy(filename, offset=3, cycle=True, mmap=False)
+            # index (3 + 2) % 5 is used for game 2
+            owners = get_owners_from_hands(strategy.deal_cards(2), get_dealer(2))
+            np.testing.assert_array_equal(np.load(filename)[0], owners)
+
+    def test_extracted_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            basename = os.path.join(directory, 'games')
+            arena = play(6, DealingCardRandomStrategy(np.random.default_rng(5)), save_filename=basename)
+            filename = os.path.join(directory, 'deals.npy')
+            nr_deals = extract_deal_file_from_game_logs([basename + '0001.txt'], filename)
+            self.assertEqual(6, nr_deals)
+
+            arena_replayed = play(6, DealingCardFileStrategy(filename, mmap=False))
+            np.testing.assert_array_equal(arena.points_team_0, arena_replayed.points_team_0)
+
+            with open(basename + '0001.txt') as file:
+                first_game = json.loads(file.readline())['game']
+            self.assertEqual(get_dealer(0), first_game['dealer'])
+
+    def test_constrained_count(self):
+        strategy = DealingCardConstrainedStrategy()
+        self.assertEqual(math.factorial(36) // math.factorial(9) ** 4, strategy.count())
+
+        # only two deals are possible, if all but two cards are given
+        required = DealingCardRandomStrategy(np.random.default_rng(6)).deal_cards()
+        first_cards = [np.flatnonzero(required[0])[0], np.flatnonzero(required[1])[0]]
+        required[0, first_cards[0]] = 0
+        required[1, first_cards[1]] = 0
+        strategy = DealingCardConstrainedStrategy(required_cards=required, relative_to_dealer=False,
+                                                  rng=np.random.default_rng(7))
+        self.assertEqual(2, strategy.count())
+        nr_swapped = sum(strategy.deal_cards()[0, first_cards[1]] for _ in range(400))
+        self.assertTrue(150 < nr_swapped < 250)
+
+        with self.assertRaises(ValueError):
+            max_cards = np.full([4, 4], 9)
+            max_cards[:, HEARTS] = 2
+            DealingCardConstrainedStrategy(max_cards=max_cards)
+
+    def test_constrained_deal(self):
+        # the forehand player holds the jack and nine of diamonds and is void in hearts
+        forehand = next_player[NORTH]
+        required = np.zeros([4, 36], dtype=np.int32)
+        required[forehand, [DJ, D9]] = 1
+        max_cards = np.full([4, 4], 9)
+        max_cards[forehand, HEARTS] = 0
+        min_cards = np.zeros([4, 4], dtype=np.int32)
+        min_cards[forehand, DIAMONDS] = 4
+        strategy = DealingCardConstrainedStrategy(min_cards=min_cards, max_cards=max_cards, required_cards=required,
+                                                  rng=np.random.default_rng(8))
+        for game_nr in range(8):
+            hands = strategy.deal_cards(game_nr)
+            np.testing.assert_array_equal(np.ones(36), hands.sum(axis=0))
+            np.testing.assert_array_equal(np.full(4, 9), hands.sum(axis=1))
+            hand = hands[next_player[get_dealer(game_nr)]]
+            self.assertEqual(1, hand[DJ])
+            self.assertEqual(1, hand[D9])
+            self.assertEqual(0, hand[HEARTS * 9:HEARTS * 9 + 9].sum())
+            self.assertGreaterEqual(hand[DIAMONDS * 9:DIAMONDS * 9 + 9].sum(), 4)
+
+        arena = play(4, strategy)
+        self.assertEqual(4, arena.nr_games_played)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import glob
+import multiprocessing
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from jass.arena.distributed_arena import DistributedArenaCoordinator, DistributedArenaWorker, receive_message, \
+    send_message
+from jass.arena.parallel_arena import ParallelArena
+
+from deterministic_agents import AgentFirstValidCard
+
+
+def run_worker(port: int):
+    worker = DistributedArenaWorker('127.0.0.1', port)
+    worker.set_players(AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard)
+    worker.run()
+
+
+def run_dropping_worker(port: int):
+    # request a block and disconnect without returning it
+    with socket.create_connection(('127.0.0.1', port)) as sock:
+        receive_message(sock)
+        send_message(sock, dict(type='request'))
+        receive_message(sock)
+
+
+class DistributedArenaTestCase(unittest.TestCase):
+
+    def test_localhost(self):
+        with tempfile.TemporaryDirectory() as directory:
+            save_filename = os.path.join(directory, 'games')
+            with DistributedArenaCoordinator(nr_games_to_play=25, games_per_block=4, seed=42,
+                                             save_filename=save_filename) as coordinator:
+                # only local workers are accepted by default
+                self.assertEqual('127.0.0.1', coordinator.address[0])
+                port = coordinator.address[1]
+                play_thread = threading.Thread(target=coordinator.play_all_games)
+                play_thread.start()
+                run_dropping_worker(port)
+                workers = [multiprocessing.Process(target=run_worker, args=(port,)) for _ in range(3)]
+                for worker in workers:
+                    worker.start()
+                play_thread.join(timeout=60)
+                for worker in workers:
+                    worker.join(timeout=10)
+
+            self.assertEqual(25, coordinator.nr_games_played)
+            self.assertEqual(1, coordinator.nr_reassigned_blocks)
+            with open(glob.glob(save_filename + '*')[0]) as file:
+                self.assertEqual(25, len(file.readlines()))
+
+        arena = ParallelArena(nr_games_to_play=25, nr_workers=1, games_per_block=4, seed=42)
+        arena.set_players(AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard)
+        arena.play_all_games()
+        np.testing.assert_array_equal(arena.points_team_0, coordinator.points_team_0)
+        np.testing.assert_array_equal(arena.points_team_1, coordinator.points_team_1)
+
+
+if __name__ == '__main__':
+    unittest.main()
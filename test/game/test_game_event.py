@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.game.const import PUSH, NORTH, EAST, SOUTH
+from jass.game.game_event import GameEvent
+
+
+class AgentRecordingEvents(AgentRandomSchieber):
+    """
+    Random agent that records the events and keeps track of the hands of its seats from the events only.
+    """
+    def __init__(self):
+        super().__init__()
+        self.events = []
+        self.seats = ()
+        self.hands = None
+
+    def on_game_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+        if event.event_type == GameEvent.GAME_START:
+            self.seats = event.seats
+            self.hands = event.hands.copy()
+        elif event.event_type == GameEvent.CARD_PLAYED and event.player in self.seats:
+            self.hands[event.player, event.card] = 0
+
+    def action_play_card(self, obs):
+        np.testing.assert_array_equal(obs.hand, self.hands[obs.player_view])
+        return super().action_play_card(obs)
+
+
+class GameEventTestCase(unittest.TestCase):
+
+    def test_arena_events(self):
+        arena = Arena(nr_games_to_play=4, notify_game_events=True)
+        agents = [AgentRecordingEvents() for _ in range(4)]
+        arena.set_players(*agents)
+        arena.play_all_games()
+
+        for player, agent in enumerate(agents):
+            types = [event.event_type for event in agent.events]
+            self.assertEqual(4, types.count(GameEvent.GAME_START))
+            self.assertEqual(4 * 36, types.count(GameEvent.CARD_PLAYED))
+            self.assertEqual(4 * 9, types.count(GameEvent.TRICK_END))
+            self.assertEqual(4, types.count(GameEvent.GAME_END))
+
+            # check the events of each game
+            game_starts = [i for i, t in enumerate(types) if t == GameEvent.GAME_START] + [len(types)]
+            for game_nr in range(4):
+                events = agent.events[game_starts[game_nr]:game_starts[game_nr + 1]]
+                self.assertEqual(player, events[0].player)
+                self.assertEqual((player,), events[0].seats)
+                self.assertEqual(9, events[0].hand.sum())
+
+                trump_events = [e for e in events if e.event_type == GameEvent.TRUMP]
+                self.assertIn(len(trump_events), [1, 2])
+                if len(trump_events) == 2:
+                    self.assertEqual(PUSH, trump_events[0].trump)
+
+                # each trick has 4 cards of different players followed by the end of the trick
+                points = np.zeros(2)
+                cards = [e for e in events if e.event_type in (GameEvent.CARD_PLAYED, GameEvent.TRICK_END)]
+                for trick_nr in range(9):
+                    trick = cards[trick_nr * 5:trick_nr * 5 + 5]
+                    self.assertEqual([GameEvent.CARD_PLAYED] * 4 + [GameEvent.TRICK_END], [e.event_type for e in trick])
+                    self.assertEqual({trick_nr}, {e.trick_nr for e in trick})
+                    self.assertEqual(4, len({e.player for e in trick[0:4]}))
+                    points[trick[4].player % 2] += trick[4].points
+
+                self.assertEqual(GameEvent.GAME_END, events[-1].event_type)
+                np.testing.assert_array_equal(points, events[-1].points)
+                np.testing.assert_array_equal(points, [arena.points_team_0[game_nr], arena.points_team_1[game_nr]])
+
+    def test_agent_on_several_seats(self):
+        # the same agent instance plays north and south, it receives each event only once
+        arena = Arena(nr_games_to_play=2, notify_game_events=True)
+        agent = AgentRecordingEvents()
+        others = [AgentRecordingEvents(), AgentRecordingEvents()]
+        arena.set_players(agent, others[0], agent, others[1])
+        arena.play_all_games()
+        events = agent.events
+
+        self.assertEqual([len(other.events) for other in others], [len(events)] * 2)
+        types = [event.event_type for event in events]
+        self.assertEqual(2, types.count(GameEvent.GAME_START))
+        self.assertEqual(2 * 36, types.count(GameEvent.CARD_PLAYED))
+        self.assertEqual({(NORTH, SOUTH)}, {event.seats for event in events})
+        self.assertEqual({(EAST,)}, {event.seats for event in others[0].events})
+
+        for game_start in [event for event in events if event.event_type == GameEvent.GAME_START]:
+            self.assertEqual(NORTH, game_start.player)
+            np.testing.assert_array_equal(game_start.hands[NORTH], game_start.hand)
+            np.testing.assert_array_equal([9, 0, 9, 0], game_start.hands.sum(axis=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
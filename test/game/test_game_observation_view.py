@@ -0,0 +1,108 @@
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.game.const import NORTH, next_player
+from jass.game.game_observation import GameObservation
+from jass.game.game_observation_view import ObservationView
+from jass.game.game_sim import GameSim
+from jass.game.game_state_util import observation_from_state
+from jass.game.game_util import deal_random_hand
+from jass.game.rule_schieber import RuleSchieber
+
+
+class AgentKeepObservations(AgentRandomSchieber):
+    """
+    Agent that keeps the observations it receives.
+    """
+    def __init__(self):
+        super().__init__()
+        self.observations = []
+
+    def action_play_card(self, obs: GameObservation) -> int:
+        self.observations.append(obs)
+        return super().action_play_card(obs)
+
+
+class ObservationViewTestCase(unittest.TestCase):
+    def test_view_equals_observation(self):
+        np.random.seed(3)
+        rule = RuleSchieber()
+        game = GameSim(rule=rule)
+        agent = AgentRandomSchieber()
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        game.action_trump(agent.action_trump(game.get_observation()))
+
+        while not game.is_done():
+            for player in [game.state.player, -1]:
+                view = ObservationView(game.state, player)
+                obs = observation_from_state(game.state, player)
+                self.assertEqual(obs, view)
+                self.assertEqual(obs.to_json(), view.to_json())
+            view = game.get_observation_view()
+            np.testing.assert_array_equal(rule.get_valid_cards_from_obs(game.get_observation()),
+                                          rule.get_valid_cards_from_obs(view))
+            game.action_play_card(agent.action_play_card(view))
+
+        view = game.get_observation_view()
+        self.assertIsNone(view.current_trick)
+        self.assertEqual(0, view.hand.sum())
+        self.assertEqual(observation_from_state(game.state, game.state.player), view)
+
+    def test_read_only(self):
+        game = GameSim(rule=RuleSchieber())
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        view = game.get_observation_view()
+        self.assertEqual(next_player[NORTH], view.player)
+        with self.assertRaises(ValueError):
+            view.hand[0] = 1
+        with self.assertRaises(ValueError):
+            view.tricks[0, 0] = 0
+        with self.assertRaises(ValueError):
+            view.current_trick[0] = 0
+        with self.assertRaises(AttributeError):
+            view.trump = 0
+
+    def test_materialize(self):
+        game = GameSim(rule=RuleSchieber())
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        game.action_trump(0)
+        view = game.get_observation_view()
+        obs = view.materialize()
+        self.assertIs(type(obs), GameObservation)
+        for result in [obs, copy.copy(view), copy.deepcopy(view), pickle.loads(pickle.dumps(view))]:
+            self.assertIs(type(result), GameObservation)
+            self.assertEqual(obs, result)
+
+        # the view follows the state, the copy does not
+        card = int(np.flatnonzero(game.state.hands[game.state.player])[0])
+        game.action_play_card(card)
+        self.assertEqual(card, view.tricks[0, 0])
+        self.assertEqual(0, view.hand[card])
+        self.assertEqual(-1, obs.tricks[0, 0])
+        self.assertEqual(1, obs.hand[card])
+        obs.hand[card] = 0
+
+    def test_arena(self):
+        # agents receive copies by default
+        arena = Arena(nr_games_to_play=2, print_every_x_games=100)
+        agents = [AgentKeepObservations() for _ in range(4)]
+        arena.set_players(*agents)
+        arena.play_all_games()
+        self.assertIs(type(agents[0].observations[0]), GameObservation)
+        # the kept observation is not changed by the following moves
+        self.assertEqual(0, agents[0].observations[0].nr_tricks)
+
+        arena = Arena(nr_games_to_play=2, print_every_x_games=100, observation_views=True)
+        agents = [AgentKeepObservations() for _ in range(4)]
+        arena.set_players(*agents)
+        arena.play_all_games()
+        self.assertIsInstance(agents[0].observations[0], ObservationView)
+
+
+if __name__ == '__main__':
+    unittest.main()
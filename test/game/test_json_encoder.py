@@ -0,0 +1,59 @@
+import json
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.const import NORTH, PUSH
+from jass.game.game_sim import GameSim
+from jass.game.game_state_util import observation_from_state
+from jass.game.game_util import deal_random_hand
+from jass.game.json_encoder import ObservationJsonEncoder
+from jass.game.rule_schieber import RuleSchieber
+
+
+def expected_json(obs, game_id=0) -> bytes:
+    data = obs.to_json()
+    if game_id is not None:
+        data['gameId'] = game_id
+    return json.dumps(data).encode('utf-8')
+
+
+class ObservationJsonEncoderTestCase(unittest.TestCase):
+    def assert_encoding(self, encoder: ObservationJsonEncoder, game: GameSim):
+        for player in [game.state.player, (game.state.player + 1) % 4, -1]:
+            obs = observation_from_state(game.state, player)
+            self.assertEqual(expected_json(obs), encoder.encode(obs))
+            self.assertEqual(expected_json(obs), encoder.encode_state(game.state, player))
+            self.assertEqual(expected_json(obs, None), encoder.encode(obs, game_id=None))
+            self.assertEqual(expected_json(obs, 17), encoder.encode_state(game.state, player, game_id=17))
+
+    def test_encode(self):
+        np.random.seed(7)
+        encoder = ObservationJsonEncoder()
+        agent = AgentRandomSchieber()
+        game = GameSim(rule=RuleSchieber())
+        for _ in range(4):
+            game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+            self.assert_encoding(encoder, game)
+            game.action_trump(PUSH)
+            self.assert_encoding(encoder, game)
+            game.action_trump(agent.action_trump(game.get_observation()))
+            while not game.is_done():
+                self.assert_encoding(encoder, game)
+                game.action_play_card(agent.action_play_card(game.get_observation()))
+            obs = observation_from_state(game.state, NORTH)
+            self.assertEqual(expected_json(obs), encoder.encode(obs))
+            self.assertEqual(expected_json(obs), encoder.encode_state(game.state, NORTH))
+
+    def test_encode_view(self):
+        encoder = ObservationJsonEncoder()
+        game = GameSim(rule=RuleSchieber())
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        game.action_trump(0)
+        view = game.get_observation_view()
+        self.assertEqual(expected_json(view.materialize()), encoder.encode(view))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.arena.latency_statistics import LatencyStatistics
+
+
+class AgentWithStandin(AgentRandomSchieber):
+    """
+    Random agent that reports every card played in the first trick as a fallback.
+    """
+    def __init__(self):
+        super().__init__()
+        self.nr_standin_actions = 0
+
+    def action_play_card(self, obs):
+        if obs.nr_tricks == 0:
+            self.nr_standin_actions += 1
+        return super().action_play_card(obs)
+
+
+class LatencyStatisticsTestCase(unittest.TestCase):
+
+    def test_percentiles(self):
+        statistics = LatencyStatistics()
+        for i in range(100):
+            statistics.add(1, 3, 0.001 * (i + 1))
+        statistics.add(1, 3, 0.5, fallbacks=1)
+        summary = statistics.summary()
+        self.assertEqual(1, len(summary))
+        entry = summary[0]
+        self.assertEqual(1, entry['seat'])
+        self.assertEqual(3, entry['phase'])
+        self.assertEqual(101, entry['count'])
+        self.assertEqual(0.5, entry['max'])
+        self.assertEqual(1, entry['fallbacks'])
+        # percentiles are upper bounds of the buckets
+        self.assertTrue(0.050 <= entry['p50'] <= 0.050 * 1.2)
+        self.assertTrue(0.095 <= entry['p95'] <= 0.095 * 1.2)
+        self.assertTrue(0.099 <= entry['p99'] <= 0.100 * 1.2)
+
+    def test_small_and_large_values(self):
+        statistics = LatencyStatistics()
+        statistics.add(0, LatencyStatistics.PHASE_TRUMP, 0.0)
+        statistics.add(0, LatencyStatistics.PHASE_TRUMP, 1e6)
+        self.assertEqual(1, statistics.counts[0, 0, 0])
+        self.assertEqual(1, statistics.counts[0, 0, -1])
+
+    def test_arena(self):
+        arena = Arena(nr_games_to_play=3, record_latency=True)
+        agent = AgentWithStandin()
+        arena.set_players(agent, AgentRandomSchieber(), agent, AgentRandomSchieber())
+        arena.play_all_games()
+
+        statistics = arena.latency_statistics
+        by_seat = statistics.summary(by_phase=False)
+        self.assertEqual(4, len(by_seat))
+        for seat in range(4):
+            self.assertGreaterEqual(by_seat[seat]['count'], 3 * 9)
+        self.assertEqual(3, statistics.fallbacks[0, 1])
+        self.assertEqual(3, statistics.fallbacks[2, 1])
+        self.assertEqual(0, statistics.fallbacks[:, 2:].sum())
+        self.assertEqual(0, statistics.fallbacks[1].sum())
+
+        with tempfile.TemporaryDirectory() as directory:
+            statistics.save_json(os.path.join(directory, 'latency.json'))
+            statistics.save_csv(os.path.join(directory, 'latency.csv'))
+            with open(os.path.join(directory, 'latency.json')) as file:
+                data = json.load(file)
+            with open(os.path.join(directory, 'latency.csv')) as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(statistics.summary()), len(data['summary']))
+        self.assertEqual(len(statistics.summary()), len(rows))
+
+    def test_disabled(self):
+        arena = Arena(nr_games_to_play=1)
+        self.assertIsNone(arena.latency_statistics)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import get_dealer
+from jass.arena.dealing_card_duplicate_strategy import DealingCardDuplicateStrategy
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.arena.parallel_arena import ParallelArena
+from jass.game.const import NORTH, EAST, SOUTH, WEST
+from jass.logs.game_log_entry import GameLogEntry
+
+from deterministic_agents import AgentFirstValidCard
+
+
+def duplicate_strategy(rng: np.random.Generator) -> DealingCardDuplicateStrategy:
+    return DealingCardDuplicateStrategy(DealingCardRandomStrategy(rng))
+
+
+def play(nr_workers: int, save_filename: str = None) -> ParallelArena:
+    arena = ParallelArena(nr_games_to_play=25, nr_workers=nr_workers, games_per_block=4, seed=42,
+                          save_filename=save_filename)
+    arena.set_players(AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard)
+    arena.play_all_games()
+    return arena
+
+
+class ParallelArenaTestCase(unittest.TestCase):
+
+    def test_get_dealer(self):
+        self.assertEqual([NORTH, WEST, SOUTH, EAST, NORTH], [get_dealer(i) for i in range(5)])
+
+    def test_reproducible(self):
+        arena_1 = play(nr_workers=1)
+        arena_3 = play(nr_workers=3)
+        self.assertEqual(25, arena_1.nr_games_played)
+        self.assertEqual(25, arena_3.nr_games_played)
+        np.testing.assert_array_equal(arena_1.points_team_0, arena_3.points_team_0)
+        np.testing.assert_array_equal(arena_1.points_team_1, arena_3.points_team_1)
+        np.testing.assert_array_equal(157, arena_1.points_team_0 + arena_1.points_team_1)
+
+    def test_random_agents(self):
+        arena = ParallelArena(nr_games_to_play=10, nr_workers=2, games_per_block=3, seed=1)
+        arena.set_players(AgentRandomSchieber, AgentRandomSchieber, AgentRandomSchieber, AgentRandomSchieber)
+        arena.play_all_games()
+        self.assertEqual(10, arena.nr_games_played)
+        np.testing.assert_array_equal(157, arena.points_team_0 + arena.points_team_1)
+
+    def test_save(self):
+        with tempfile.TemporaryDirectory() as directory:
+            arena = play(nr_workers=2, save_filename=os.path.join(directory, 'games'))
+            files = glob.glob(os.path.join(directory, 'games*.txt'))
+            self.assertEqual(1, len(files))
+            with open(files[0]) as f:
+                entries = [GameLogEntry.from_json(json.loads(line)) for line in f]
+        self.assertEqual(25, len(entries))
+        for game_nr, entry in enumerate(entries):
+            self.assertEqual(get_dealer(game_nr), entry.game.dealer)
+            self.assertEqual(arena.points_team_0[game_nr], entry.game.points[0])
+
+    def test_duplicate_blocks(self):
+        with self.assertRaises(ValueError):
+            ParallelArena(nr_games_to_play=12, games_per_block=3, dealing_card_strategy_factory=duplicate_strategy)
+        with self.assertRaises(ValueError):
+            ParallelArena(nr_games_to_play=13, games_per_block=4, dealing_card_strategy_factory=duplicate_strategy)
+        arena = ParallelArena(nr_games_to_play=10, nr_workers=2, games_per_block=4, seed=3,
+                              dealing_card_strategy_factory=duplicate_strategy)
+        arena.set_players(AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard, AgentFirstValidCard)
+        arena.play_all_games()
+        self.assertEqual(10, arena.nr_games_played)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from jass.arena.dealing_card_random_strategy import DealingCardRandomStrategy
+from jass.game.const import team
+from jass.game.game_sim import GameSim
+from jass.game.game_state import GameState
+from jass.game.perfect_information_solver import PerfectInformationSolver
+from jass.game.rule_schieber import RuleSchieber
+
+
+def minimax(state: GameState, rule: RuleSchieber) -> int:
+    """
+    Points of team 0 in the rest of the game by a full search without any pruning.
+    """
+    if state.nr_played_cards == 36:
+        return 0
+    values = []
+    for card in np.flatnonzero(rule.get_valid_cards_from_state(state)):
+        sim = GameSim(rule=rule)
+        sim.init_from_state(state)
+        sim.action_play_card(card)
+        values.append(sim.state.points[0] - state.points[0] + minimax(sim.state, rule))
+    return max(values) if team[state.player] == 0 else min(values)
+
+
+class PerfectInformationSolverTestCase(unittest.TestCase):
+
+    def test_solve(self):
+        rule = RuleSchieber()
+        rng = np.random.default_rng(5)
+        solver = PerfectInformationSolver(rule)
+        for game_nr in range(12):
+            nr_cards_remaining = 8 + game_nr % 3
+            sim = GameSim(rule=rule)
+            sim.init_from_cards(DealingCardRandomStrategy(rng).deal_cards(), dealer=game_nr % 4)
+            sim.action_trump(game_nr % 6)
+            while sim.state.nr_played_cards < 36 - nr_cards_remaining:
+                sim.action_play_card(rng.choice(np.flatnonzero(rule.get_valid_cards_from_state(sim.state))))
+            state = sim.state
+
+            self.assertEqual(minimax(state, rule), solver.solve(state))
+
+            values = solver.action_values(state)
+            remaining = 157 - state.points.sum()
+            valid_cards = np.flatnonzero(rule.get_valid_cards_from_state(state))
+            self.assertEqual(len(valid_cards), np.sum(values >= 0))
+            for card in valid_cards:
+                child = GameSim(rule=rule)
+                child.init_from_state(state)
+                child.action_play_card(card)
+                value = child.state.points[0] - state.points[0] + minimax(child.state, rule)
+                self.assertEqual(value if team[state.player] == 0 else remaining - value, values[card])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+import jass.bench
+from jass.bench.game_tree import perft, get_reference_state, verify_reference_positions, reference_positions
+from jass.game.rule_schieber import RuleSchieber
+
+
+class PerftTestCase(unittest.TestCase):
+    def test_reference_positions(self):
+        rule = RuleSchieber()
+        for index in range(len(reference_positions)):
+            rule.assert_invariants(get_reference_state(index))
+
+        errors = verify_reference_positions(lambda state, depth: perft(state, depth).nr_leaf_nodes, max_depth=4)
+        self.assertEqual([], errors)
+
+    def test_nodes_per_depth(self):
+        result = perft(get_reference_state(0), 2)
+        # 7 trump actions, after pushing 6 trump actions and otherwise 9 cards for the first player
+        self.assertEqual([1, 7, 60], result.nodes_per_depth)
+        self.assertEqual(60, result.nr_leaf_nodes)
+        self.assertEqual(68, result.nr_nodes)
+        self.assertGreater(result.nodes_per_second, 0)
+
+        result = perft(get_reference_state(2), 6)
+        self.assertEqual([1, 1, 1, 1, 5, 9, 16], result.nodes_per_depth)
+
+    def test_package_export(self):
+        result = jass.bench.perft(get_reference_state(0), 1)
+        self.assertIsInstance(result, jass.bench.PerftResult)
+        self.assertEqual([1, 7], result.nodes_per_depth)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from jass.agents.agent_random_schieber import AgentRandomSchieber
 from jass.game.game_util import deal_random_hand
 
 from jass.game.game_sim import GameSim
@@ -156,8 +157,96 @@ class RuleSchieberTestCase(unittest.TestCase):
         actions = rule.get_valid_actions_from_state(game.state)
         self.assertEqual(9, actions.sum())
 
+    def _minimax(self, game: GameSim) -> int:
+        # exact remaining points of team 0 under optimal play of both teams
+        if game.is_done():
+            return 0
+        state = game.state
+        results = []
+        for card in np.flatnonzero(self.rule.get_valid_cards_from_state(state)):
+            child = GameSim(rule=self.rule)
+            child.init_from_state(state)
+            child.action_play_card(card)
+            results.append(int(child.state.points[0] - state.points[0]) + self._minimax(child))
+        return max(results) if team[state.player] == 0 else min(results)
+
+    def test_point_bounds(self):
+        agent = AgentRandomSchieber()
+        for trump in [DIAMONDS, SPADES, OBE_ABE, UNE_UFE]:
+            for nr_cards in [24, 26, 29, 32, 35]:
+                game = GameSim(rule=self.rule)
+                game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+                game.action_trump(trump)
+                for _ in range(nr_cards):
+                    game.action_play_card(agent.action_play_card(game.get_observation()))
+                lower, upper = self.rule.point_bounds(game.state)
+                exact = self._minimax(game)
+                self.assertLessEqual(lower, exact)
+                self.assertGreaterEqual(upper, exact)
+                if nr_cards >= 32:
+                    self.assertEqual(lower, upper)
+
+    def test_point_bounds_top_trumps(self):
+        game = GameSim(rule=self.rule)
+        hands = np.zeros([4, 36], np.int32)
+        hands[NORTH, [HJ, H9, DA, DK, DQ, DJ, D10, D9, D8]] = 1
+        hands[EAST, [HA, HK, HQ, H10, H8, H7, H6, D7, D6]] = 1
+        hands[SOUTH, [SA, SK, SQ, SJ, S10, S9, S8, S7, S6]] = 1
+        hands[WEST, [CA, CK, CQ, CJ, C10, C9, C8, C7, C6]] = 1
+        game.init_from_cards(hands=hands, dealer=EAST)
+        game.action_trump(HEARTS)
+        lower, upper = self.rule.point_bounds(game.state)
+        # trump jack and nine are sure, the diamonds not as east has trump
+        self.assertEqual(20 + 14, lower)
+        self.assertEqual(157, upper)
+
+        game.init_from_cards(hands=hands, dealer=EAST)
+        game.action_trump(OBE_ABE)
+        lower, upper = self.rule.point_bounds(game.state)
+        # north leads and can play the diamonds from the ace to the eight
+        self.assertEqual(11 + 4 + 3 + 2 + 10 + 0 + 8, lower)
+        self.assertEqual(157, upper)
+
+    def test_equivalent_cards(self):
+        self.hand[[DK, DQ, D8, D7, D6, HJ, H9, S10]] = 1
+        played = np.zeros(36, np.int32)
+        played[[DA, S9]] = 1
+        reduced = self.rule.get_equivalent_card_representatives(self.hand, played, HEARTS, respect_points=False)
+        expected = np.zeros(36, np.int32)
+        expected[[DK, D8, HJ, S10]] = 1
+        self.assertTrue(np.all(expected == reduced))
 
+        reduced = self.rule.get_equivalent_card_representatives(self.hand, played, HEARTS)
+        expected[[DQ, H9]] = 1
+        self.assertTrue(np.all(expected == reduced))
 
+        # in une, the order of the cards is reversed
+        reduced = self.rule.get_equivalent_card_representatives(self.hand, played, UNE_UFE, respect_points=False)
+        expected = np.zeros(36, np.int32)
+        expected[[D6, DQ, H9, HJ, S10]] = 1
+        self.assertTrue(np.all(expected == reduced))
+
+    def test_equivalent_cards_search(self):
+        # the value of a search with the reduced cards is the same as with all valid cards
+        agent = AgentRandomSchieber()
+        for trump in [DIAMONDS, CLUBS, OBE_ABE, UNE_UFE]:
+            game = GameSim(rule=self.rule)
+            game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+            game.action_trump(trump)
+            for _ in range(25):
+                game.action_play_card(agent.action_play_card(game.get_observation()))
+            state = game.state
+            valid = self.rule.get_valid_cards_from_state(state)
+            reduced = self.rule.get_valid_cards_reduced_from_state(state)
+            self.assertTrue(np.all(reduced <= valid))
+            results = {}
+            for card in np.flatnonzero(valid):
+                child = GameSim(rule=self.rule)
+                child.init_from_state(state)
+                child.action_play_card(card)
+                results[card] = int(child.state.points[0]) + self._minimax(child)
+            best = max if team[state.player] == 0 else min
+            self.assertEqual(best(results.values()), best(results[card] for card in np.flatnonzero(reduced)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.arena.arena import Arena
+from jass.arena.stopping_rule import StoppingRule
+
+
+class StoppingRuleTestCase(unittest.TestCase):
+
+    def test_team_0_better(self):
+        rng = np.random.default_rng(1)
+        rule = StoppingRule(alpha=0.05, min_games=50)
+        for difference in rng.normal(30.0, 80.0, size=10000):
+            if rule.add(difference):
+                break
+        self.assertEqual(StoppingRule.TEAM_0_BETTER, rule.decision)
+        self.assertLess(rule.nr_games, 1000)
+        lower, upper = rule.interval()
+        self.assertGreater(lower, 0.0)
+        self.assertLess(lower, 30.0)
+        self.assertGreater(upper, 30.0)
+
+    def test_team_1_better(self):
+        rng = np.random.default_rng(2)
+        rule = StoppingRule(alpha=0.05, min_games=50)
+        for difference in rng.normal(-30.0, 80.0, size=10000):
+            if rule.add(difference):
+                break
+        self.assertEqual(StoppingRule.TEAM_1_BETTER, rule.decision)
+
+    def test_no_difference(self):
+        rng = np.random.default_rng(3)
+        rule = StoppingRule(alpha=0.05, min_games=50)
+        for difference in rng.normal(0.0, 80.0, size=5000):
+            rule.add(difference)
+        self.assertFalse(rule.stopped)
+        self.assertEqual(5000, rule.nr_games)
+        lower, upper = rule.interval()
+        self.assertLess(lower, 0.0)
+        self.assertGreater(upper, 0.0)
+
+    def test_futility(self):
+        rng = np.random.default_rng(4)
+        rule = StoppingRule(alpha=0.05, min_games=50, futility_margin=10.0)
+        for difference in rng.normal(0.0, 80.0, size=10000):
+            if rule.add(difference):
+                break
+        self.assertEqual(StoppingRule.EQUIVALENT, rule.decision)
+
+    def test_paired(self):
+        rule = StoppingRule(min_games=2, paired=True)
+        for difference in [10.0, -10.0, 20.0, 0.0, 5.0]:
+            rule.add(difference)
+        self.assertEqual(5, rule.nr_games)
+        self.assertEqual(2, rule.nr_samples)
+        self.assertEqual(5.0, rule.mean)
+
+    def test_arena(self):
+        rule = StoppingRule(min_games=10, futility_margin=1000.0)
+        arena = Arena(nr_games_to_play=100, stopping_rule=rule)
+        arena.set_players(AgentRandomSchieber(), AgentRandomSchieber(), AgentRandomSchieber(), AgentRandomSchieber())
+        arena.play_all_games()
+        self.assertEqual(StoppingRule.EQUIVALENT, arena.stopping_rule.decision)
+        self.assertEqual(10, arena.nr_games_played)
+        self.assertEqual(10, arena.points_team_0.shape[0])
+        self.assertEqual(10, arena.points_team_1.shape[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
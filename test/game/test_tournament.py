@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from jass.arena.tournament import Tournament
+from jass.game.const import card_values
+from jass.game.game_observation import GameObservation
+
+from deterministic_agents import AgentFirstValidCard
+
+
+class AgentLastCard(AgentFirstValidCard):
+    """
+    Deterministic agent that plays the last valid card.
+    """
+    def action_play_card(self, obs: GameObservation) -> int:
+        return int(np.flatnonzero(self._rule.get_valid_cards_from_obs(obs))[-1])
+
+
+class AgentHighestValue(AgentFirstValidCard):
+    """
+    Deterministic agent that plays the valid card with the highest value.
+    """
+    def action_play_card(self, obs: GameObservation) -> int:
+        valid_cards = np.flatnonzero(self._rule.get_valid_cards_from_obs(obs))
+        return int(valid_cards[np.argmax(card_values[obs.trump, valid_cards])])
+
+
+AGENTS = dict(first=AgentFirstValidCard, last=AgentLastCard, highest=AgentHighestValue)
+
+
+class TournamentTestCase(unittest.TestCase):
+
+    def test_reproducible(self):
+        nr_callbacks = []
+        tournament_1 = Tournament(AGENTS, nr_games_per_pairing=20, games_per_block=6, nr_workers=1, seed=3)
+        standings = tournament_1.play(callback=lambda t: nr_callbacks.append(t.nr_games_played))
+        tournament_2 = Tournament(AGENTS, nr_games_per_pairing=20, games_per_block=6, nr_workers=2, seed=3)
+        tournament_2.play()
+
+        # 4 blocks for each of the 3 pairings
+        self.assertEqual(12, len(nr_callbacks))
+        self.assertEqual(60, nr_callbacks[-1])
+        self.assertEqual(60, tournament_1.nr_games_played)
+        np.testing.assert_array_equal(tournament_1.wins, tournament_2.wins)
+        np.testing.assert_array_equal(tournament_1.elo, tournament_2.elo)
+        np.testing.assert_array_equal(np.full((3, 3), 20) - np.diag(np.full(3, 20)), tournament_1.nr_games)
+
+        self.assertEqual(3, len(standings))
+        elo = [entry['elo'] for entry in standings]
+        self.assertEqual(sorted(elo, reverse=True), elo)
+        self.assertAlmostEqual(0.0, tournament_1.elo.sum())
+        self.assertEqual(40, standings[0]['games'])
+
+    def test_odd_block_size(self):
+        with self.assertRaises(ValueError):
+            Tournament(AGENTS, games_per_block=5)
+
+    def test_ratings(self):
+        tournament = Tournament(AGENTS, nr_workers=1)
+        # first beats last, last beats highest and highest beats first
+        tournament.add_results(0, np.array([10.0, 20.0, 30.0, -5.0]))
+        tournament.add_results(2, np.array([10.0, 20.0, 30.0, -5.0]))
+        tournament.add_results(1, np.array([-10.0, -20.0, 0.0, 5.0]))
+        self.assertEqual(3.0, tournament.wins[0, 1])
+        self.assertEqual(1.0, tournament.wins[1, 0])
+        self.assertEqual(1.5, tournament.wins[0, 2])
+
+        bradley_terry = tournament.bradley_terry()
+        self.assertAlmostEqual(0.0, bradley_terry.mean())
+        self.assertEqual([0, 1, 2], list(np.argsort(-bradley_terry)))
+        self.assertEqual([0, 1, 2], list(np.argsort(-tournament.elo)))
+        self.assertEqual('first', tournament.standings()[0]['name'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.const import PUSH, DATE_FORMAT
+from jass.game.game_sim import GameSim
+from jass.game.game_state_util import observation_from_state
+from jass.game.game_util import deal_random_hand
+from jass.game.rule_schieber import RuleSchieber
+from jass.logs.game_log_entry import GameLogEntry
+from jass.logs.game_obs_action_log_entry import GameObsActionLogEntry
+from jass.logs.log_decoder import decode_game_log_lines, decode_obs_action_lines, parse_date, date_from_epoch
+
+
+def to_line(entry, separators=(',', ':')) -> str:
+    # as written by LogEntryFileGenerator
+    return json.dumps(entry.to_json(), separators=separators) + '\n'
+
+
+class LogDecoderTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        np.random.seed(11)
+        self.date = datetime(2026, 10, 18, 23, 5, 59)
+        self.game_lines = []
+        self.obs_lines = []
+        agent = AgentRandomSchieber()
+        for dealer in range(4):
+            game = GameSim(rule=RuleSchieber())
+            game.init_from_cards(hands=deal_random_hand(), dealer=dealer)
+            self.game_lines.append(to_line(GameLogEntry(game=game.state, date=self.date, player_ids=[1, 2, 3, 4])))
+            game.action_trump(PUSH)
+            game.action_trump(int(agent.action_trump(game.get_observation())))
+            while not game.is_done():
+                obs = game.get_observation()
+                action = int(agent.action_play_card(obs))
+                self.obs_lines.append(to_line(GameObsActionLogEntry(obs=obs, action=action, date=self.date,
+                                                                    player_id=int(obs.player_view))))
+                game.action_play_card(action)
+                if game.state.nr_played_cards == 14:
+                    self.game_lines.append(to_line(GameLogEntry(game=game.state, date=self.date,
+                                                                player_ids=[0, 0, 0, 0])))
+            self.game_lines.append(to_line(GameLogEntry(game=game.state, date=self.date, player_ids=[5, 6, 7, -1])))
+            self.obs_lines.append(to_line(GameObsActionLogEntry(obs=observation_from_state(game.state, -1), action=0,
+                                                                date=self.date, player_id=0)))
+
+    def test_game_log_lines(self):
+        arrays = decode_game_log_lines(self.game_lines)
+        self.assertEqual(len(self.game_lines), len(arrays))
+        for i, line in enumerate(self.game_lines):
+            self.assertEqual(GameLogEntry.from_json(json.loads(line)), arrays.get_entry(i))
+        self.assertEqual(np.int8, arrays.tricks.dtype)
+        np.testing.assert_array_equal([36, 14, 0], arrays.nr_played_cards[[2, 1, 0]])
+
+    def test_obs_action_lines(self):
+        arrays = decode_obs_action_lines(self.obs_lines)
+        self.assertEqual(len(self.obs_lines), len(arrays))
+        for i, line in enumerate(self.obs_lines):
+            self.assertEqual(GameObsActionLogEntry.from_json(json.loads(line)), arrays.get_entry(i))
+
+    def test_other_formats(self):
+        # lines in other formats are decoded from json
+        lines = [to_line(GameLogEntry.from_json(json.loads(line)), separators=None) for line in self.game_lines]
+        legacy = json.loads(self.game_lines[0])
+        del legacy['game']['version']
+        del legacy['game']['forehand']
+        legacy['game']['tss'] = 1
+        lines.append(json.dumps(legacy))
+        arrays = decode_game_log_lines(lines)
+        for i, line in enumerate(lines):
+            self.assertEqual(GameLogEntry.from_json(json.loads(line)), arrays.get_entry(i))
+        self.assertEqual(0, arrays.forehand[-1])
+
+        obs_lines = [to_line(GameObsActionLogEntry.from_json(json.loads(line)), separators=None)
+                     for line in self.obs_lines]
+        arrays = decode_obs_action_lines(obs_lines)
+        for i, line in enumerate(obs_lines):
+            self.assertEqual(GameObsActionLogEntry.from_json(json.loads(line)), arrays.get_entry(i))
+
+    def test_mixed_lines(self):
+        # lines that are not read in parallel (escaped characters, 19 digits) between the other lines
+        escaped = json.loads(self.game_lines[1])
+        escaped['game']['jassTyp'] = 'SCHIEBER "1000"'
+        large = json.loads(self.game_lines[2])
+        large['player_ids'] = [1234567890123456789, 1, 2, 3]
+        lines = self.game_lines[0:2] + [json.dumps(escaped, separators=(',', ':')), self.game_lines[2],
+                                        json.dumps(large, separators=(',', ':')), self.game_lines[3].rstrip('\n')]
+        arrays = decode_game_log_lines(lines)
+        for i, line in enumerate(lines):
+            self.assertEqual(GameLogEntry.from_json(json.loads(line)), arrays.get_entry(i))
+        self.assertEqual(1234567890123456789, arrays.player_ids[4, 0])
+
+    def test_version(self):
+        line = json.loads(self.obs_lines[0])
+        line['obs']['version'] = 'V0.1'
+        with self.assertRaises(ValueError):
+            decode_obs_action_lines([json.dumps(line)])
+
+    def test_parse_date(self):
+        for date in ['18.10.26 23:05:59', '01.01.70 00:00:00', '29.02.24 12:30:01']:
+            self.assertEqual(datetime.strptime(date, DATE_FORMAT), date_from_epoch(parse_date(date)))
+        with self.assertRaises(ValueError):
+            parse_date('18.10.26 24:05:59')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import unittest
+
+from jass.agents.agent_random_schieber import AgentRandomSchieber
+from jass.game.const import NORTH
+from jass.game.game_event import GameEvent
+from jass.game.game_sim import GameSim
+from jass.game.game_util import deal_random_hand
+from jass.game.rule_schieber import RuleSchieber
+
+try:
+    from jass.service.player_service_app import PlayerServiceApp
+except ImportError:
+    PlayerServiceApp = None
+
+
+class AgentRecordingEvents(AgentRandomSchieber):
+    """
+    Random agent that records the events it receives.
+    """
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def on_game_event(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+
+@unittest.skipIf(PlayerServiceApp is None, 'flask is not installed')
+class PlayerServiceRouteTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = AgentRecordingEvents()
+        app = PlayerServiceApp('player_service')
+        app.add_player('recording', self.agent)
+        self.client = app.test_client()
+
+    def test_game_info(self):
+        game = GameSim(rule=RuleSchieber())
+        game.init_from_cards(hands=deal_random_hand(), dealer=NORTH)
+        game.action_trump(0)
+        game.action_play_card(int(RuleSchieber().get_valid_cards_from_obs(game.get_observation()).argmax()))
+        obs = game.get_observation()
+
+        response = self.client.post('/recording/game_info', data=json.dumps(obs.to_json()),
+                                    content_type='application/json')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, len(self.agent.events))
+        event = self.agent.events[0]
+        self.assertEqual(GameEvent.GAME_INFO, event.event_type)
+        self.assertEqual(obs.player_view, event.player)
+        self.assertEqual((obs.player_view,), event.seats)
+        self.assertEqual(obs, event.obs)
+
+    def test_game_info_errors(self):
+        response = self.client.post('/unknown/game_info', data='{}', content_type='application/json')
+        self.assertEqual(400, response.status_code)
+        response = self.client.post('/recording/game_info', data='no json', content_type='text/plain')
+        self.assertEqual(415, response.status_code)
+        self.assertEqual([], self.agent.events)
+
+
+if __name__ == '__main__':
+    unittest.main()